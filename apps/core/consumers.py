@@ -0,0 +1,166 @@
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs
+
+import orjson
+from bson import ObjectId
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from django.conf import settings
+
+from apps.core.models.backtest import BacktestModel
+from apps.core.services.stream import StreamService
+
+logger = logging.getLogger("django")
+
+
+class BacktestConsumer(AsyncJsonWebsocketConsumer):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    API_KEY_HEADER: bytes = b"x-api-key"
+    API_KEY_PARAM: str = "api_key"
+    CLOSE_UNAUTHORIZED: int = 4401
+    CLOSE_NOT_FOUND: int = 4404
+
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _group_name: Optional[str]
+    _pending: Dict[Tuple[str, str], Dict[str, Any]]
+    _resync: bool
+    _wake: asyncio.Event
+    _flush_task: Optional[asyncio.Task]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._stream_service = StreamService()
+        self._group_name = None
+        self._pending = {}
+        self._resync = False
+        self._wake = asyncio.Event()
+        self._flush_task = None
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    async def connect(self) -> None:
+        backtest_id = self.scope["url_route"]["kwargs"]["id"]
+
+        if not self._is_authenticated():
+            await self.close(code=self.CLOSE_UNAUTHORIZED)
+            return
+
+        if not await self._backtest_exists(backtest_id):
+            await self.close(code=self.CLOSE_NOT_FOUND)
+            return
+
+        self._group_name = self._stream_service.get_group_name(backtest_id)
+
+        await self.channel_layer.group_add(self._group_name, self.channel_name)
+        await self.accept()
+
+        self._flush_task = asyncio.create_task(self._flush())
+
+    async def disconnect(self, _code: int) -> None:
+        if self._flush_task:
+            self._flush_task.cancel()
+
+        if self._group_name:
+            await self.channel_layer.group_discard(self._group_name, self.channel_name)
+
+    async def backtest_delta(self, message: Dict[str, Any]) -> None:
+        self._buffer(message["resource"], message["event"], message["data"])
+        self._wake.set()
+
+    async def backtest_deltas(self, message: Dict[str, Any]) -> None:
+        for data in message["items"]:
+            self._buffer(message["resource"], message["event"], data)
+
+        self._wake.set()
+
+    @classmethod
+    async def encode_json(cls, content: Any) -> str:
+        return orjson.dumps(content).decode()
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    async def _flush(self) -> None:
+        interval = settings.STREAM_FLUSH_INTERVAL / 1000
+
+        try:
+            while True:
+                await self._wake.wait()
+                self._wake.clear()
+
+                deltas = list(self._pending.values())
+                self._pending = {}
+
+                if self._resync:
+                    self._resync = False
+                    await self.send_json({"type": "resync"})
+
+                if deltas:
+                    await self.send_json({"type": "deltas", "deltas": deltas})
+
+                await asyncio.sleep(interval)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to stream deltas to {self._group_name}, closing: {e}")
+            await self.close()
+
+    def _buffer(self, resource: str, event: str, data: Dict[str, Any]) -> None:
+        key = (resource, data["_id"])
+        delta = self._pending.get(key)
+
+        if delta:
+            delta["data"].update(data)
+        elif len(self._pending) >= settings.STREAM_MAX_PENDING:
+            self._pending = {}
+            self._resync = True
+        else:
+            self._pending[key] = {
+                "resource": resource,
+                "event": event,
+                "data": data,
+            }
+
+    async def _backtest_exists(self, backtest_id: str) -> bool:
+        if not ObjectId.is_valid(backtest_id):
+            return False
+
+        try:
+            return bool(
+                await BacktestModel().afind(
+                    query_filters={"_id": ObjectId(backtest_id)},
+                    projection_fields={"_id": 1},
+                    limit=1,
+                )
+            )
+        except Exception as e:
+            logger.error(f"Failed to find backtest: {e}")
+
+            return False
+
+    def _is_authenticated(self) -> bool:
+        expected_key = getattr(settings, "API_KEY", None)
+        if not expected_key:
+            return False
+
+        return self._get_api_key() == expected_key
+
+    # Helpers
+    def _get_api_key(self) -> Optional[str]:
+        for name, value in self.scope.get("headers", []):
+            if name == self.API_KEY_HEADER:
+                return value.decode()
+
+        query = parse_qs(self.scope.get("query_string", b"").decode())
+        values = query.get(self.API_KEY_PARAM)
+
+        return values[0] if values else None
@@ -1,10 +1,10 @@
 import logging
 from datetime import UTC, datetime
-from typing import Any, ClassVar, Dict, List, Optional, Type
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Type
 
+from asgiref.sync import sync_to_async
 from bson import ObjectId
-from cerberus import Validator
-from django.http import JsonResponse
+from django.http import HttpResponse
 from drf_spectacular.utils import extend_schema
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.request import Request
@@ -14,6 +14,8 @@ from apps.core.controllers.base import BaseController
 from apps.core.enums.backtest_status import BacktestStatus
 from apps.core.enums.http_status import HttpStatus
 from apps.core.models.backtest import BacktestModel
+from apps.core.services.stream import StreamService
+from apps.core.services.validation import ValidationService
 from apps.core.tasks import make_backtest_report
 
 from .schemas.delete import delete_schema
@@ -23,9 +25,56 @@ from .schemas.put import update_schema
 
 
 class BacktestController(BaseController):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    POST_VALIDATION_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "asset": {
+            "type": "string",
+            "required": True,
+            "minlength": 1,
+        },
+        "strategies": {
+            "type": "string",
+            "required": True,
+            "minlength": 1,
+        },
+        "from_date": {
+            "type": "integer",
+            "required": True,
+            "coerce": int,
+        },
+        "to_date": {
+            "type": "integer",
+            "required": True,
+            "coerce": int,
+        },
+    }
+
+    UPDATE_VALIDATION_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "status": {
+            "type": "string",
+            "required": False,
+            "allowed": [s.value for s in BacktestStatus],
+        },
+    }
+
+    PROJECTION_FIELDS: ClassVar[FrozenSet[str]] = frozenset(
+        {
+            "_id",
+            *POST_VALIDATION_SCHEMA,
+            *UPDATE_VALIDATION_SCHEMA,
+            "start_at",
+            "end_at",
+            "created_at",
+            "updated_at",
+        }
+    )
+
     # ───────────────────────────────────────────────────────────
     # PROPERTIES
     # ───────────────────────────────────────────────────────────
+    _stream_service: StreamService
     authentication_classes: ClassVar[List[Type[BaseAuthentication]]] = [
         APIKeyAuthentication
     ]
@@ -36,16 +85,17 @@ class BacktestController(BaseController):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._model = BacktestModel()
+        self._stream_service = StreamService()
 
     # ───────────────────────────────────────────────────────────
     # PUBLIC METHODS
     # ───────────────────────────────────────────────────────────
     @extend_schema(**get_schema())
-    def get(self, request: Request) -> JsonResponse:
-        return super().get(request)
+    async def get(self, request: Request) -> HttpResponse:
+        return await super().get(request)
 
     @extend_schema(**post_schema())
-    def post(self, request: Request) -> JsonResponse:
+    async def post(self, request: Request) -> HttpResponse:
         logger = logging.getLogger("django")
         data = getattr(request, "data", {})
         body = data if isinstance(data, dict) else {}
@@ -73,7 +123,7 @@ class BacktestController(BaseController):
         backtest_data["status"] = BacktestStatus.RUNNING.value
 
         try:
-            backtest_id = self._model.store(data=backtest_data)
+            backtest_id = await self._model.astore(data=backtest_data)
 
         except Exception as e:
             logger.error(f"Failed to create backtest: {e}")
@@ -93,7 +143,7 @@ class BacktestController(BaseController):
         )
 
     @extend_schema(**update_schema())
-    def put(self, request: Request, id: str) -> JsonResponse:
+    async def put(self, request: Request, id: str) -> HttpResponse:
         logger = logging.getLogger("django")
         data = getattr(request, "data", {})
         body = data if isinstance(data, dict) else {}
@@ -109,10 +159,12 @@ class BacktestController(BaseController):
             )
 
         try:
-            backtest = self._model.find(
-                query_filters={
-                    "_id": ObjectId(id),
-                }
+            backtest = (
+                await self._model.afind(
+                    query_filters={
+                        "_id": ObjectId(id),
+                    }
+                )
             )[0]
         except Exception as e:
             logger.error(f"Failed to find backtest: {e}")
@@ -153,10 +205,17 @@ class BacktestController(BaseController):
             to_update["status"] = body.get("status")
 
         try:
-            self._model.update(
+            await self._model.aupdate(
                 query_filters={"_id": ObjectId(id)},
                 data=to_update,
             )
+            await self._stream_service.apublish(
+                backtest_id=id,
+                resource="backtest",
+                event="updated",
+                document_id=id,
+                data=to_update,
+            )
         except Exception as e:
             logger.error(f"Failed to update backtest: {e}")
 
@@ -165,7 +224,7 @@ class BacktestController(BaseController):
             and new_status == BacktestStatus.COMPLETED.value
         ):
             try:
-                make_backtest_report.apply_async(
+                await sync_to_async(make_backtest_report.apply_async)(
                     args=[str(id)],
                     countdown=10,
                 )  # type: ignore
@@ -180,12 +239,12 @@ class BacktestController(BaseController):
         )
 
     @extend_schema(**delete_schema())
-    def delete(self, request: Request, id: str) -> JsonResponse:
+    async def delete(self, request: Request, id: str) -> HttpResponse:
         logger = logging.getLogger("django")
         backtest = None
 
         try:
-            results = self._model.find(
+            results = await self._model.afind(
                 query_filters={
                     "_id": ObjectId(id),
                 }
@@ -208,7 +267,7 @@ class BacktestController(BaseController):
             )
 
         try:
-            self._model.delete(
+            await self._model.adelete(
                 query_filters={
                     "_id": ObjectId(id),
                 }
@@ -232,51 +291,11 @@ class BacktestController(BaseController):
     # PRIVATE METHODS
     # ───────────────────────────────────────────────────────────
     def _is_post_data_valid(self, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        validator = Validator(
-            {
-                "asset": {
-                    "type": "string",
-                    "required": True,
-                    "minlength": 1,
-                },
-                "strategies": {
-                    "type": "string",
-                    "required": True,
-                    "minlength": 1,
-                },
-                "from_date": {
-                    "type": "integer",
-                    "required": True,
-                    "coerce": int,
-                },
-                "to_date": {
-                    "type": "integer",
-                    "required": True,
-                    "coerce": int,
-                },
-            }  # type: ignore
-        )
-
-        is_valid = validator.validate(body)  # type: ignore
-        if not is_valid:
-            return validator.errors  # type: ignore
-
-        return None
+        return ValidationService().validate_fast(self.POST_VALIDATION_SCHEMA, body)
 
     def _is_update_data_valid(self, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        validator = Validator(
-            {
-                "status": {  # type: ignore
-                    "type": "string",
-                    "required": False,
-                    "allowed": [s.value for s in BacktestStatus],
-                },
-            },
+        return ValidationService().validate_fast(
+            self.UPDATE_VALIDATION_SCHEMA,
+            body,
             allow_unknown=True,
         )
-
-        is_valid = validator.validate(body)  # type: ignore
-        if not is_valid:
-            return validator.errors  # type: ignore
-
-        return None
@@ -0,0 +1,206 @@
+import csv
+import io
+import json
+import logging
+from typing import Any, AsyncIterator, ClassVar, Dict, List, Type
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from bson.raw_bson import RawBSONDocument
+from django.conf import settings
+from django.http import HttpResponseBase, StreamingHttpResponse
+from drf_spectacular.utils import extend_schema
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.request import Request
+
+from apps.core.authentication import APIKeyAuthentication
+from apps.core.controllers.base import BaseController
+from apps.core.controllers.orders import OrderController
+from apps.core.controllers.snapshot import SnapshotController
+from apps.core.enums.http_status import HttpStatus
+from apps.core.models.backtest import BacktestModel
+from apps.core.models.base import BaseModel
+from apps.core.models.order import OrderModel
+from apps.core.models.snapshot import SnapshotModel
+
+from .schemas.get import get_schema
+
+
+class BacktestExportController(BaseController):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    CONTENT_TYPES: ClassVar[Dict[str, str]] = {
+        "ndjson": "application/x-ndjson",
+        "csv": "text/csv",
+    }
+    CSV_COLUMNS: ClassVar[Dict[str, List[str]]] = {
+        "orders": list(
+            dict.fromkeys(
+                ["_id", *OrderController.POST_VALIDATION_SCHEMA, "created_at", "updated_at"]
+            )
+        ),
+        "snapshots": list(
+            dict.fromkeys(
+                ["_id", *SnapshotController.POST_VALIDATION_SCHEMA, "created_at", "updated_at"]
+            )
+        ),
+    }
+
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    authentication_classes: ClassVar[List[Type[BaseAuthentication]]] = [
+        APIKeyAuthentication
+    ]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._model = BacktestModel()
+        self._resource_models: Dict[str, BaseModel] = {
+            "orders": OrderModel(),
+            "snapshots": SnapshotModel(),
+        }
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    @extend_schema(**get_schema())
+    async def get(  # type: ignore[override]
+        self,
+        request: Request,
+        id: str,
+        resource: str,
+    ) -> HttpResponseBase:
+        logger = logging.getLogger("django")
+        output = request.query_params.get("output", "ndjson")
+
+        if output not in self.CONTENT_TYPES:
+            return self.response(
+                success=False,
+                message=f"Invalid output, expected one of: {', '.join(self.CONTENT_TYPES)}",
+                status=HttpStatus.BAD_REQUEST,
+            )
+
+        try:
+            backtest_id = ObjectId(id)
+        except (InvalidId, TypeError):
+            return self.response(
+                success=False,
+                message="Invalid backtest id",
+                status=HttpStatus.BAD_REQUEST,
+            )
+
+        try:
+            backtests = await self._model.afind(
+                limit=1,
+                query_filters={"_id": backtest_id},
+                projection_fields={"_id": 1},
+            )
+        except Exception as e:
+            logger.error(f"Failed to find backtest: {e}")
+
+            return self.response(
+                success=False,
+                message="Failed to find backtest",
+                status=HttpStatus.INTERNAL_SERVER_ERROR,
+            )
+
+        if not backtests:
+            return self.response(
+                success=False,
+                message="Backtest not found",
+                status=HttpStatus.NOT_FOUND,
+            )
+
+        model = self._resource_models[resource]
+
+        if output == "csv":
+            documents = model.astream(
+                query_filters={"backtest_id": id},
+                sort_by="created_at",
+                sort_direction="asc",
+                batch_size=settings.EXPORT_BATCH_SIZE,
+            )
+            chunks = self._render_csv(documents, self.CSV_COLUMNS[resource])
+        else:
+            raw_documents = model.astream_raw(
+                query_filters={"backtest_id": id},
+                sort_by="created_at",
+                sort_direction="asc",
+                batch_size=settings.EXPORT_BATCH_SIZE,
+            )
+            chunks = self._render_ndjson(raw_documents)
+
+        response = StreamingHttpResponse(
+            chunks,
+            content_type=self.CONTENT_TYPES[output],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="backtest-{id}-{resource}.{output}"'
+        )
+
+        return response
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    async def _render_ndjson(
+        self,
+        documents: AsyncIterator[RawBSONDocument],
+    ) -> AsyncIterator[bytes]:
+        renderer = self.json_renderer_class()
+        lines: List[bytes] = []
+
+        async for document in self._guard(documents):
+            lines.append(renderer.render(document))
+
+            if len(lines) >= settings.EXPORT_BATCH_SIZE:
+                yield b"\n".join(lines) + b"\n"
+                lines = []
+
+        if lines:
+            yield b"\n".join(lines) + b"\n"
+
+    async def _render_csv(
+        self,
+        documents: AsyncIterator[Dict[str, Any]],
+        columns: List[str],
+    ) -> AsyncIterator[str]:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        rows = 0
+
+        async for document in self._guard(documents):
+            writer.writerow(self._flatten(self._serialize(document)))
+            rows += 1
+
+            if rows >= settings.EXPORT_BATCH_SIZE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                rows = 0
+
+        yield buffer.getvalue()
+
+    async def _guard(
+        self,
+        documents: AsyncIterator[Any],
+    ) -> AsyncIterator[Any]:
+        try:
+            async for document in documents:
+                yield document
+        except Exception as e:
+            logging.getLogger("django").error(f"Export stream aborted: {e}")
+            raise
+
+    # Helpers
+    def _flatten(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            key: json.dumps(value) if isinstance(value, (dict, list)) else value
+            for key, value in document.items()
+        }
@@ -0,0 +1,50 @@
+from typing import Any
+
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, inline_serializer
+from rest_framework import serializers
+
+
+def get_schema() -> Any:
+    return {
+        "tags": ["Backtest"],
+        "summary": "Export the orders or snapshots of a backtest",
+        "description": (
+            "Streams every order or snapshot of a backtest, oldest first, straight "
+            "from a MongoDB cursor as NDJSON or CSV. Memory stays flat regardless of "
+            "the backtest size."
+        ),
+        "parameters": [
+            OpenApiParameter(
+                name="id",
+                type=str,
+                location=OpenApiParameter.PATH,
+                description="Backtest ID",
+                required=True,
+            ),
+            OpenApiParameter(
+                name="output",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description="Export format",
+                default="ndjson",
+                enum=["ndjson", "csv"],
+            ),
+        ],
+        "responses": {
+            (200, "application/x-ndjson"): OpenApiResponse(
+                response=str,
+                description="One JSON document per line",
+            ),
+            (200, "text/csv"): OpenApiResponse(
+                response=str,
+                description="Header row followed by one row per document",
+            ),
+            404: inline_serializer(
+                name="BacktestExportNotFoundResponse",
+                fields={
+                    "success": serializers.BooleanField(),
+                    "message": serializers.CharField(),
+                },
+            ),
+        },
+    }
@@ -0,0 +1,73 @@
+import logging
+from typing import Any, ClassVar, List, Type
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from django.http import HttpResponseBase
+from drf_spectacular.utils import extend_schema
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.request import Request
+
+from apps.core.authentication import APIKeyAuthentication
+from apps.core.controllers.base import BaseController
+from apps.core.enums.http_status import HttpStatus
+from apps.core.services.aggregate import AggregateService
+
+from .schemas.get import get_schema
+
+
+class BacktestLiveReportController(BaseController):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    authentication_classes: ClassVar[List[Type[BaseAuthentication]]] = [APIKeyAuthentication]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._service = AggregateService()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    @extend_schema(**get_schema())
+    async def get(  # type: ignore[override]
+        self,
+        request: Request,  # noqa: ARG002
+        id: str,
+    ) -> HttpResponseBase:
+        logger = logging.getLogger("django")
+
+        try:
+            ObjectId(id)
+        except (InvalidId, TypeError):
+            return self.response(
+                success=False,
+                message="Invalid backtest id",
+                status=HttpStatus.BAD_REQUEST,
+            )
+
+        try:
+            state = await self._service.afind(id)
+        except Exception as e:
+            logger.error(f"Failed to find aggregate: {e}")
+
+            return self.response(
+                success=False,
+                message="Failed to find live report",
+                status=HttpStatus.INTERNAL_SERVER_ERROR,
+            )
+
+        if state is None:
+            return self.response(
+                success=False,
+                message="Live report not found",
+                status=HttpStatus.NOT_FOUND,
+            )
+
+        return self.response(
+            success=True,
+            data=self._service.get_report(state),
+        )
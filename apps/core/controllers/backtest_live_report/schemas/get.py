@@ -0,0 +1,42 @@
+from typing import Any
+
+from drf_spectacular.utils import OpenApiParameter, inline_serializer
+from rest_framework import serializers
+
+
+def get_schema() -> Any:
+    return {
+        "tags": ["Backtest"],
+        "summary": "Get the live report of a running backtest",
+        "description": (
+            "Returns the metrics and breakdowns maintained incrementally as orders "
+            "and snapshots are stored. Expected shortfall is only available in the "
+            "final report, and `exact` turns false once snapshots arrive out of order "
+            "or are edited."
+        ),
+        "parameters": [
+            OpenApiParameter(
+                name="id",
+                type=str,
+                location=OpenApiParameter.PATH,
+                description="Backtest ID",
+                required=True,
+            ),
+        ],
+        "responses": {
+            200: inline_serializer(
+                name="BacktestLiveReportResponse",
+                fields={
+                    "success": serializers.BooleanField(),
+                    "data": serializers.DictField(),
+                },
+            ),
+            404: inline_serializer(
+                name="BacktestLiveReportNotFoundResponse",
+                fields={
+                    "success": serializers.BooleanField(),
+                    "message": serializers.CharField(),
+                },
+            ),
+        },
+    }
@@ -1,41 +1,141 @@
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import base64
+import hashlib
+import inspect
+import re
+from datetime import UTC, datetime
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple, Type, Union
 
-from bson import ObjectId
-from cerberus import Validator
-from django.http import JsonResponse
+from bson import ObjectId, json_util
+from bson.errors import InvalidId
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.http import http_date, parse_etags
+from rest_framework.renderers import BaseRenderer
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
+from apps.core.enums.count_mode import CountMode
+from apps.core.enums.field_type import FieldType
 from apps.core.enums.http_status import HttpStatus
 from apps.core.models.base import BaseModel
+from apps.core.renderers import ORJSONRenderer
+from apps.core.services.validation import ValidationService
 
 
 class BaseController(APIView):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    CURSOR_JSON_OPTIONS: ClassVar[json_util.JSONOptions] = json_util.JSONOptions(
+        tz_aware=True,
+        tzinfo=UTC,
+    )
+
+    FILTER_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"^(?P<column>[a-zA-Z_][a-zA-Z0-9_]*)(?P<operator>>=|<=|!=|>|<|:)(?P<value>.+)$"
+    )
+    FIELD_LIST_PATTERN: ClassVar[str] = r"[a-zA-Z_][a-zA-Z0-9_]*(,[a-zA-Z_][a-zA-Z0-9_]*)*"
+    PROJECTION_FIELDS: ClassVar[FrozenSet[str]] = frozenset()
+    ETAG_PROJECTION: ClassVar[Dict[str, int]] = {"_id": 1, "updated_at": 1}
+    FILTER_OPERATORS: ClassVar[Dict[str, str]] = {
+        ">=": "$gte",
+        "<=": "$lte",
+        ">": "$gt",
+        "<": "$lt",
+        "!=": "$ne",
+    }
+
+    PAGINATION_VALIDATION_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "page_param": {
+            "type": "integer",
+            "coerce": int,
+            "min": 1,
+        },
+        "page_size_param": {
+            "type": "integer",
+            "coerce": int,
+            "min": 1,
+            "max": 100,
+        },
+        "sort_by_param": {
+            "type": "string",
+            "minlength": 1,
+        },
+        "sort_direction_param": {
+            "type": "string",
+            "allowed": ["asc", "desc"],
+        },
+        "filter_by_param": {
+            "type": "list",
+            "schema": {
+                "type": "string",
+                "regex": FILTER_PATTERN.pattern,
+            },
+            "nullable": True,
+        },
+        "after_param": {
+            "type": "string",
+            "regex": r"^[A-Za-z0-9_-]+$",
+            "nullable": True,
+        },
+        "count_param": {
+            "type": "string",
+            "allowed": [mode.value for mode in CountMode],
+        },
+        "fields_param": {
+            "type": "string",
+            "regex": rf"^(\*|{FIELD_LIST_PATTERN})$",
+            "nullable": True,
+        },
+        "exclude_param": {
+            "type": "string",
+            "regex": rf"^{FIELD_LIST_PATTERN}$",
+            "nullable": True,
+        },
+    }
+
     # ───────────────────────────────────────────────────────────
     # PROPERTIES
     # ───────────────────────────────────────────────────────────
     _model: BaseModel
+    json_renderer_class: ClassVar[Type[BaseRenderer]] = ORJSONRenderer
 
     # ───────────────────────────────────────────────────────────
     # PUBLIC METHODS
     # ───────────────────────────────────────────────────────────
-    def get(self, request: Request) -> JsonResponse:
-        response = {}
+    def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        if not self.view_is_async:
+            return super().dispatch(request, *args, **kwargs)
+
+        return self._adispatch(request, *args, **kwargs)
+
+    async def get(self, request: Request) -> HttpResponse:
         query_params = request.query_params
 
         page_param = query_params.get("page", "1")
         page_size_param = query_params.get("page_size", "10")
         sort_by_param = query_params.get("sort", "created_at")
         sort_direction_param = query_params.get("sort_order", "desc")
-        filter_by_param = query_params.get("filter_by", None)
+        filter_by_param = query_params.getlist("filter_by") or None
+        after_param = query_params.get("after", None)
+        count_param = query_params.get(
+            "count",
+            CountMode.NONE.value if after_param else CountMode.EXACT.value,
+        )
+        fields_param = query_params.get("fields", None)
+        exclude_param = query_params.get("exclude", None)
 
         validation_errors = self._is_pagination_params_valid(
-            page_param,
-            page_size_param,
-            sort_by_param,
-            sort_direction_param,
-            filter_by_param,
+            page_param=page_param,
+            page_size_param=page_size_param,
+            sort_by_param=sort_by_param,
+            sort_direction_param=sort_direction_param,
+            filter_by_param=filter_by_param,
+            after_param=after_param,
+            count_param=count_param,
+            fields_param=fields_param,
+            exclude_param=exclude_param,
         )
         if validation_errors:
             return self.response(
@@ -49,67 +149,71 @@ class BaseController(APIView):
         page_size = int(page_size_param)  # type: ignore
         sort_by = str(sort_by_param)  # type: ignore
         sort_direction = str(sort_direction_param)  # type: ignore
+        count_mode = CountMode(count_param)
         query_filters = None
+        after = None
 
         if filter_by_param:
-            parts = str(filter_by_param).split(":", 1)
-            column = parts[0].strip()
-            value = parts[1].strip()
-            query_filters = {column: {"$regex": value, "$options": "i"}}
-
-        limit = int(page_size)
-        offset = (page - 1) * limit
+            try:
+                query_filters = self._parse_filters(filter_by_param)  # type: ignore
+            except ValueError as e:
+                return self.response(
+                    success=False,
+                    message="Invalid pagination parameters",
+                    data={"errors": {"filter_by_param": [str(e)]}},
+                    status=HttpStatus.BAD_REQUEST,
+                )
 
         try:
-            results = self._model.find(
-                limit=limit,
-                offset=offset,
+            projection_fields = self._parse_projection(
+                fields=fields_param,  # type: ignore
+                exclude=exclude_param,  # type: ignore
                 sort_by=sort_by,
-                sort_direction=sort_direction,
-                query_filters=query_filters,
             )
-
-        except Exception as e:
+        except ValueError as e:
             return self.response(
                 success=False,
-                message=str(e),
-                status=HttpStatus.INTERNAL_SERVER_ERROR,
+                message="Invalid pagination parameters",
+                data={"errors": {"fields_param" if fields_param else "exclude_param": [str(e)]}},
+                status=HttpStatus.BAD_REQUEST,
             )
 
-        try:
-            total = self._model.count(
-                query_filters=query_filters,
-            )
-        except Exception as e:
-            return self.response(
-                success=False,
-                message=str(e),
-                status=HttpStatus.INTERNAL_SERVER_ERROR,
+        if after_param:
+            after = self._decode_cursor(
+                token=str(after_param),
+                sort_by=sort_by,
+                sort_direction=sort_direction,
             )
 
-        response["results"] = [self._serialize(doc) for doc in results]
-        response["pagination"] = {
-            "page": page,
-            "page_size": page_size,
-            "total": total,
-            "total_pages": (total + page_size - 1) // page_size,
-        }
+            if after is None:
+                return self.response(
+                    success=False,
+                    message="Invalid pagination parameters",
+                    data={"errors": {"after_param": ["invalid cursor"]}},
+                    status=HttpStatus.BAD_REQUEST,
+                )
 
-        return self.response(
-            success=True,
-            message="Data retrieved successfully",
-            data=response,
-            status=HttpStatus.OK,
+        return await self._get_page(
+            request=request,
+            page=page,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            count_mode=count_mode,
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+            after=after,
         )
 
     def response(
         self,
         success: bool,
         message: Optional[str] = None,
-        data: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
         status: Optional[HttpStatus] = None,
-    ) -> JsonResponse:
+    ) -> HttpResponse:
         response_code = HttpStatus.OK.value if success else HttpStatus.BAD_REQUEST.value
+        renderer = self.json_renderer_class()
         response: Dict[str, Any] = {
             "success": success,
         }
@@ -117,69 +221,468 @@ class BaseController(APIView):
         if message is not None:
             response["message"] = message
 
-        if data is not None:
-            response["data"] = data
+        if isinstance(data, bytes):
+            content = renderer.render(response)[:-1] + b',"data":' + data + b"}"
+        else:
+            if data is not None:
+                response["data"] = data
 
-        return JsonResponse(
-            response,
+            content = renderer.render(response)
+
+        return HttpResponse(
+            content,
+            content_type=renderer.media_type,
             status=response_code if status is None else status.value,
         )
 
     # ───────────────────────────────────────────────────────────
     # PRIVATE METHODS
     # ───────────────────────────────────────────────────────────
+    async def _adispatch(
+        self,
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> HttpResponseBase:
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            self.initial(request, *args, **kwargs)
+
+            method = request.method.lower()  # type: ignore
+            if method in self.http_method_names:
+                handler = getattr(self, method, self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+
+            if inspect.isawaitable(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def _get_page(
+        self,
+        *,
+        request: Request,
+        page: int,
+        page_size: int,
+        sort_by: str,
+        sort_direction: str,
+        count_mode: CountMode,
+        query_filters: Optional[Dict[str, Any]],
+        projection_fields: Optional[Dict[str, int]],
+        after: Optional[Dict[str, Any]],
+    ) -> HttpResponse:
+        response: Dict[str, Any] = {}
+        limit = int(page_size)
+        offset = 0 if after else (page - 1) * limit
+        is_conditional = bool(request.headers.get("If-None-Match"))
+        find = self._model.afind if is_conditional else self._model.afind_raw
+
+        try:
+            window, total = await asyncio.gather(
+                find(
+                    limit=limit + 1,
+                    offset=offset,
+                    sort_by=sort_by,
+                    sort_direction=sort_direction,
+                    query_filters=query_filters,
+                    projection_fields=self.ETAG_PROJECTION if is_conditional else projection_fields,
+                    after=after,
+                ),
+                self._get_total(
+                    count_mode=count_mode,
+                    query_filters=query_filters,
+                ),
+            )
+
+        except Exception as e:
+            return self.response(
+                success=False,
+                message=str(e),
+                status=HttpStatus.INTERNAL_SERVER_ERROR,
+            )
+
+        etag = self._build_etag(
+            path=request.get_full_path(),
+            window=window,
+            total=total,
+        )
+        last_modified = self._get_last_modified(window)
+
+        if is_conditional and self._is_not_modified(request, etag):
+            return self._set_validators(
+                response=HttpResponse(status=HttpStatus.NOT_MODIFIED.value),
+                etag=etag,
+                last_modified=last_modified,
+            )
+
+        results = window
+
+        if is_conditional:
+            try:
+                results = await self._model.afind_raw(
+                    limit=limit + 1,
+                    offset=offset,
+                    sort_by=sort_by,
+                    sort_direction=sort_direction,
+                    query_filters=query_filters,
+                    projection_fields=projection_fields,
+                    after=after,
+                )
+
+            except Exception as e:
+                return self.response(
+                    success=False,
+                    message=str(e),
+                    status=HttpStatus.INTERNAL_SERVER_ERROR,
+                )
+
+        has_more = len(results) > limit
+        results = results[:limit]
+        next_cursor = None
+
+        if has_more:
+            next_cursor = self._encode_cursor(
+                document=results[-1],
+                sort_by=sort_by,
+                sort_direction=sort_direction,
+            )
+
+        response["results"] = results
+        response["pagination"] = {
+            "page_size": page_size,
+            "count": count_mode.value,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
+
+        if not after:
+            response["pagination"]["page"] = page
+
+        if total is not None:
+            response["pagination"]["total"] = total
+            response["pagination"]["total_pages"] = (total + page_size - 1) // page_size
+
+        return self._set_validators(
+            response=self.response(
+                success=True,
+                message="Data retrieved successfully",
+                data=response,
+                status=HttpStatus.OK,
+            ),
+            etag=etag,
+            last_modified=last_modified,
+        )
+
     def _is_pagination_params_valid(
         self,
+        *,
         page_param: Union[str, List[str], None],
         page_size_param: Union[str, List[str], None],
         sort_by_param: Union[str, List[str], None],
         sort_direction_param: Union[str, List[str], None],
         filter_by_param: Union[str, List[str], None] = None,
+        after_param: Union[str, List[str], None] = None,
+        count_param: Union[str, List[str], None] = None,
+        fields_param: Union[str, List[str], None] = None,
+        exclude_param: Union[str, List[str], None] = None,
     ) -> Optional[Dict[str, Any]]:
-        validator = Validator(
-            {
-                "page_param": {
-                    "type": "integer",
-                    "coerce": int,
-                    "min": 1,
-                },
-                "page_size_param": {
-                    "type": "integer",
-                    "coerce": int,
-                    "min": 1,
-                    "max": 100,
-                },
-                "sort_by_param": {
-                    "type": "string",
-                    "minlength": 1,
-                },
-                "sort_direction_param": {
-                    "type": "string",
-                    "allowed": ["asc", "desc"],
-                },
-                "filter_by_param": {
-                    "type": "string",
-                    "regex": r"^[a-zA-Z_][a-zA-Z0-9_]*:.+$",
-                    "nullable": True,
-                },
-            }  # type: ignore
-        )
-
-        is_valid = validator.validate(  # type: ignore
+        return ValidationService().validate_fast(
+            self.PAGINATION_VALIDATION_SCHEMA,
             {
                 "page_param": page_param,
                 "page_size_param": page_size_param,
                 "sort_by_param": sort_by_param,
                 "sort_direction_param": sort_direction_param,
                 "filter_by_param": filter_by_param,
-            }
+                "after_param": after_param,
+                "count_param": count_param,
+                "fields_param": fields_param,
+                "exclude_param": exclude_param,
+            },
         )
 
-        if not is_valid:
-            return validator.errors  # type: ignore
+    def _parse_filters(self, filter_by: List[str]) -> Dict[str, Any]:
+        filters: Dict[str, Any] = {}
+        conditions: List[Dict[str, Any]] = []
+
+        for expression in filter_by:
+            column, condition = self._parse_filter(expression)
+            current = filters.get(column)
+
+            if current is None:
+                filters[column] = condition
+            elif (
+                isinstance(current, dict)
+                and isinstance(condition, dict)
+                and not set(current) & set(condition)
+            ):
+                current.update(condition)
+            else:
+                conditions.append({column: condition})
+
+        if conditions:
+            return {"$and": [filters, *conditions]}
+
+        return filters
+
+    def _parse_filter(self, expression: str) -> Tuple[str, Any]:
+        match = self.FILTER_PATTERN.match(expression)
+
+        if not match:
+            raise ValueError(f"invalid filter '{expression}'")
+
+        column = match.group("column")
+        operator = match.group("operator")
+        value = match.group("value").strip()
+        field_type = self._model.field_types.get(column, FieldType.STRING)
+
+        if operator in self.FILTER_OPERATORS:
+            return column, {
+                self.FILTER_OPERATORS[operator]: self._convert_filter_value(
+                    column, value, field_type
+                )
+            }
+
+        keyword, _, argument = value.partition(":")
+
+        if keyword == "in" and argument:
+            values = [item.strip() for item in argument.split(",") if item.strip()]
+            return column, {
+                "$in": [
+                    self._convert_filter_value(column, item, field_type)
+                    for item in values
+                ]
+            }
+
+        if keyword == "prefix" and argument:
+            if field_type != FieldType.STRING:
+                raise ValueError(f"prefix filter requires a string field, got '{column}'")
+
+            return column, {"$regex": f"^{re.escape(argument)}"}
+
+        if keyword == "contains" and argument:
+            if field_type != FieldType.STRING:
+                raise ValueError(f"contains filter requires a string field, got '{column}'")
+
+            return column, {"$regex": re.escape(argument), "$options": "i"}
+
+        return column, self._convert_filter_value(column, value, field_type)
+
+    def _parse_projection(
+        self,
+        fields: Optional[str],
+        exclude: Optional[str],
+        sort_by: str,
+    ) -> Optional[Dict[str, int]]:
+        if fields and exclude:
+            raise ValueError("fields and exclude cannot be combined")
+
+        if fields == "*":
+            return None
+
+        if fields:
+            return {
+                **dict.fromkeys(self._parse_projection_fields(fields), 1),
+                **self.ETAG_PROJECTION,
+                sort_by: 1,
+            }
+
+        if exclude:
+            return {
+                field: 0
+                for field in self._parse_projection_fields(exclude)
+                if field not in self.ETAG_PROJECTION and field != sort_by
+            }
+
+        return self._model.default_projection
+
+    def _build_etag(
+        self,
+        path: str,
+        window: List[Dict[str, Any]],
+        total: Optional[int],
+    ) -> str:
+        digest = hashlib.sha1(usedforsecurity=False)
+        digest.update(f"{path}:{total}:{len(window)}".encode())
+
+        for document in window:
+            digest.update(f"{document['_id']}:{document.get('updated_at')}".encode())
+
+        return f'"{digest.hexdigest()}"'
+
+    def _is_not_modified(self, request: Request, etag: str) -> bool:
+        if_none_match = request.headers.get("If-None-Match")
+
+        if not if_none_match:
+            return False
+
+        if if_none_match.strip() == "*":
+            return True
+
+        return etag in {self._strip_weak(tag) for tag in parse_etags(if_none_match)}
+
+    def _set_validators(
+        self,
+        response: HttpResponse,
+        etag: str,
+        last_modified: Optional[datetime],
+    ) -> HttpResponse:
+        response["ETag"] = etag
+        response["Cache-Control"] = "no-cache"
+
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified.timestamp())
+
+        return response
+
+    async def _get_total(
+        self,
+        count_mode: CountMode,
+        query_filters: Optional[Dict[str, Any]],
+    ) -> Optional[int]:
+        if count_mode == CountMode.EXACT:
+            return await self._model.acount(query_filters=query_filters)
+
+        if count_mode == CountMode.ESTIMATED:
+            return await self._model.aestimated_count(query_filters=query_filters)
 
         return None
 
+    def _encode_cursor(
+        self,
+        document: Dict[str, Any],
+        sort_by: str,
+        sort_direction: str,
+    ) -> str:
+        payload = json_util.dumps(
+            {
+                "sort": sort_by,
+                "order": sort_direction,
+                "value": document.get(sort_by),
+                "_id": document["_id"],
+            }
+        )
+
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def _decode_cursor(
+        self,
+        token: str,
+        sort_by: str,
+        sort_direction: str,
+    ) -> Optional[Dict[str, Any]]:
+        padding = "=" * (-len(token) % 4)
+
+        try:
+            payload = base64.urlsafe_b64decode(token + padding).decode()
+            cursor = json_util.loads(payload, json_options=self.CURSOR_JSON_OPTIONS)
+        except (ValueError, TypeError):
+            return None
+
+        if not isinstance(cursor, dict) or not isinstance(cursor.get("_id"), ObjectId):
+            return None
+
+        if cursor.get("sort") != sort_by or cursor.get("order") != sort_direction:
+            return None
+
+        return {
+            "value": cursor.get("value"),
+            "_id": cursor["_id"],
+        }
+
+    # Helpers
+    def _convert_filter_value(
+        self,
+        column: str,
+        value: str,
+        field_type: FieldType,
+    ) -> Any:
+        try:
+            if field_type == FieldType.INTEGER:
+                return int(value)
+
+            if field_type == FieldType.FLOAT:
+                return float(value)
+
+            if field_type == FieldType.BOOLEAN:
+                return self._convert_to_boolean(value)
+
+            if field_type == FieldType.DATETIME:
+                return self._convert_to_datetime(value)
+
+            if field_type == FieldType.OBJECT_ID:
+                return ObjectId(value)
+
+        except (ValueError, TypeError, InvalidId) as e:
+            raise ValueError(
+                f"invalid {field_type.value} value '{value}' for '{column}'"
+            ) from e
+
+        return value
+
+    def _convert_to_boolean(self, value: str) -> bool:
+        normalized = value.lower()
+
+        if normalized in ("true", "1"):
+            return True
+
+        if normalized in ("false", "0"):
+            return False
+
+        raise ValueError(value)
+
+    def _convert_to_datetime(self, value: str) -> datetime:
+        try:
+            return datetime.fromtimestamp(float(value), tz=UTC)
+        except (ValueError, OverflowError, OSError):
+            pass
+
+        date = datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+        if date.tzinfo is None:
+            return date.replace(tzinfo=UTC)
+
+        return date
+
+    def _get_last_modified(self, window: List[Dict[str, Any]]) -> Optional[datetime]:
+        timestamps = [
+            document["updated_at"] for document in window if isinstance(document.get("updated_at"), datetime)
+        ]
+
+        if not timestamps:
+            return None
+
+        last_modified = max(timestamps)
+
+        if last_modified.tzinfo is None:
+            return last_modified.replace(tzinfo=UTC)
+
+        return last_modified
+
+    def _strip_weak(self, etag: str) -> str:
+        return etag[2:] if etag.startswith("W/") else etag
+
+    def _parse_projection_fields(self, value: str) -> List[str]:
+        fields = value.split(",")
+        unknown = [field for field in fields if field not in self.PROJECTION_FIELDS]
+
+        if unknown:
+            raise ValueError(f"unknown field '{unknown[0]}'")
+
+        return fields
+
     def _serialize(self, document: Dict[str, Any]) -> Dict[str, Any]:
         serialized = {}
 
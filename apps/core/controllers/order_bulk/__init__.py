@@ -0,0 +1,183 @@
+import logging
+from itertools import islice
+from typing import Any, ClassVar, Dict, List, Optional, Type
+
+from django.conf import settings
+from django.http import HttpResponse
+from drf_spectacular.utils import extend_schema
+from pymongo.errors import BulkWriteError
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.parsers import BaseParser, JSONParser
+from rest_framework.request import Request
+
+from apps.core.authentication import APIKeyAuthentication
+from apps.core.controllers.base import BaseController
+from apps.core.controllers.orders import OrderController
+from apps.core.enums.http_status import HttpStatus
+from apps.core.models.order import OrderModel
+from apps.core.parsers import NDJSONParser
+from apps.core.services.stream import StreamService
+from apps.core.services.validation import ValidationService
+
+from .schemas.post import post_schema
+
+
+class OrderBulkController(BaseController):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _stream_service: StreamService
+    authentication_classes: ClassVar[List[Type[BaseAuthentication]]] = [
+        APIKeyAuthentication
+    ]
+    parser_classes: ClassVar[List[Type[BaseParser]]] = [
+        JSONParser,
+        NDJSONParser,
+    ]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._model = OrderModel()
+        self._stream_service = StreamService()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    @extend_schema(**post_schema())
+    async def post(self, request: Request) -> HttpResponse:
+        logger = logging.getLogger("django")
+        data = getattr(request, "data", [])
+        items = [] if isinstance(data, dict) else list(islice(data, settings.BULK_MAX_ITEMS + 1))
+
+        body_error = self._get_body_error(data, items)
+        if body_error:
+            return body_error
+
+        results: List[Dict[str, Any]] = []
+        orders: List[Dict[str, Any]] = []
+        indexes: List[int] = []
+
+        for index, item in enumerate(items):
+            validation_errors = self._is_item_valid(item)
+
+            if validation_errors:
+                results.append({"index": index, "errors": validation_errors})
+                continue
+
+            orders.append(dict(item))
+            indexes.append(index)
+
+        write_errors: Dict[int, Dict[str, Any]] = {}
+
+        if orders:
+            try:
+                await self._model.astore_many(data=orders, ordered=False)
+            except BulkWriteError as e:
+                write_errors = self._extract_write_errors(e)
+            except Exception as e:
+                logger.error(f"Failed to create orders: {e}")
+
+                return self.response(
+                    success=False,
+                    message="Failed to create orders",
+                    status=HttpStatus.INTERNAL_SERVER_ERROR,
+                )
+
+        written: List[Dict[str, Any]] = []
+
+        for position, order in enumerate(orders):
+            index = indexes[position]
+
+            if position in write_errors:
+                results.append({"index": index, "errors": write_errors[position]})
+                continue
+
+            results.append({"index": index, "_id": str(order["_id"])})
+            written.append(order)
+
+        await self._stream_service.apublish_many(
+            resource="order",
+            event="created",
+            documents=written,
+            exclude=self._model.default_projection,
+        )
+
+        results.sort(key=lambda result: result["index"])
+        failed = sum(1 for result in results if "errors" in result)
+        inserted = len(results) - failed
+        response = {
+            "inserted": inserted,
+            "failed": failed,
+            "results": results,
+        }
+
+        if inserted == 0:
+            return self.response(
+                success=False,
+                message="No orders were created",
+                data=response,
+                status=HttpStatus.BAD_REQUEST,
+            )
+
+        if failed:
+            return self.response(
+                success=True,
+                message="Some orders could not be created",
+                data=response,
+                status=HttpStatus.MULTI_STATUS,
+            )
+
+        return self.response(
+            success=True,
+            message="Orders created successfully",
+            data=response,
+            status=HttpStatus.CREATED,
+        )
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _get_body_error(self, data: Any, items: List[Any]) -> Optional[HttpResponse]:
+        max_items = settings.BULK_MAX_ITEMS
+
+        if isinstance(data, dict):
+            return self.response(
+                success=False,
+                message="Expected a JSON array or an NDJSON body",
+                status=HttpStatus.BAD_REQUEST,
+            )
+
+        if not items:
+            return self.response(
+                success=False,
+                message="No orders provided",
+                status=HttpStatus.BAD_REQUEST,
+            )
+
+        if len(items) > max_items:
+            return self.response(
+                success=False,
+                message=f"Too many orders, the limit is {max_items} per request",
+                status=HttpStatus.REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        return None
+
+    def _is_item_valid(self, item: Any) -> Optional[Dict[str, Any]]:
+        if not isinstance(item, dict):
+            return {"order": ["must be a JSON object"]}
+
+        return ValidationService().validate_fast(
+            OrderController.POST_VALIDATION_SCHEMA,
+            item,
+        )
+
+    # Helpers
+    def _extract_write_errors(self, error: BulkWriteError) -> Dict[int, Dict[str, Any]]:
+        return {
+            write_error["index"]: {"database": [write_error.get("errmsg", "Write failed")]}
+            for write_error in error.details.get("writeErrors", [])
+        }
@@ -0,0 +1,50 @@
+from typing import Any
+
+from drf_spectacular.utils import inline_serializer
+from rest_framework import serializers
+
+from apps.core.controllers.orders.schemas.post import post_schema as order_post_schema
+
+
+def post_schema() -> Any:
+    order_request = order_post_schema()["request"]
+
+    return {
+        "tags": ["Order"],
+        "summary": "Create orders in bulk",
+        "description": (
+            "Creates up to BULK_MAX_ITEMS orders in a single request. "
+            "Accepts a JSON array or an NDJSON body (application/x-ndjson). "
+            "Valid orders are inserted even when others are rejected."
+        ),
+        "request": {
+            "application/json": serializers.ListSerializer(child=order_request),
+            "application/x-ndjson": order_request,
+        },
+        "responses": {
+            201: inline_serializer(
+                name="OrderBulkResponse",
+                fields={
+                    "success": serializers.BooleanField(),
+                    "message": serializers.CharField(),
+                    "data": inline_serializer(
+                        name="OrderBulkData",
+                        fields={
+                            "inserted": serializers.IntegerField(),
+                            "failed": serializers.IntegerField(),
+                            "results": serializers.ListField(
+                                child=inline_serializer(
+                                    name="OrderBulkResult",
+                                    fields={
+                                        "index": serializers.IntegerField(),
+                                        "_id": serializers.CharField(required=False),
+                                        "errors": serializers.DictField(required=False),
+                                    },
+                                ),
+                            ),
+                        },
+                    ),
+                },
+            ),
+        },
+    }
@@ -1,10 +1,9 @@
 import logging
 from datetime import UTC, datetime
-from typing import Any, ClassVar, Dict, List, Optional, Type
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Type
 
 from bson import ObjectId
-from cerberus import Validator
-from django.http import JsonResponse
+from django.http import HttpResponse
 from drf_spectacular.utils import extend_schema
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.request import Request
@@ -13,6 +12,8 @@ from apps.core.authentication import APIKeyAuthentication
 from apps.core.controllers.base import BaseController
 from apps.core.enums.http_status import HttpStatus
 from apps.core.models.order import OrderModel
+from apps.core.services.stream import StreamService
+from apps.core.services.validation import ValidationService
 
 from .schemas.delete import delete_schema
 from .schemas.get import get_schema
@@ -21,9 +22,326 @@ from .schemas.put import update_schema
 
 
 class OrderController(BaseController):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    POST_VALIDATION_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "id": {
+            "type": "string",
+            "required": False,
+            "nullable": True,
+        },
+        "gateway_order_id": {
+            "type": "string",
+            "required": False,
+            "nullable": True,
+        },
+        "backtest": {
+            "type": "boolean",
+            "required": True,
+        },
+        "backtest_id": {
+            "type": "string",
+            "required": False,
+            "nullable": True,
+        },
+        "portfolio_id": {
+            "type": "string",
+            "required": False,
+            "nullable": True,
+        },
+        "asset_id": {
+            "type": "string",
+            "required": False,
+            "nullable": True,
+        },
+        "strategy_id": {
+            "type": "string",
+            "required": True,
+            "minlength": 1,
+        },
+        "symbol": {
+            "type": "string",
+            "required": True,
+            "minlength": 1,
+        },
+        "gateway": {
+            "type": "string",
+            "required": True,
+            "minlength": 1,
+        },
+        "side": {
+            "type": "string",
+            "required": True,
+            "allowed": ["buy", "sell"],
+        },
+        "order_type": {
+            "type": "string",
+            "required": True,
+            "minlength": 1,
+        },
+        "status": {
+            "type": "string",
+            "required": True,
+            "minlength": 1,
+        },
+        "volume": {
+            "type": "float",
+            "required": True,
+            "coerce": float,
+        },
+        "executed_volume": {
+            "type": "float",
+            "required": True,
+            "coerce": float,
+        },
+        "price": {
+            "type": "float",
+            "required": True,
+            "coerce": float,
+        },
+        "close_price": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "take_profit_price": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "stop_loss_price": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "commission": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "commission_percentage": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "client_order_id": {
+            "type": "string",
+            "required": False,
+            "nullable": True,
+        },
+        "filled": {
+            "type": "boolean",
+            "required": True,
+        },
+        "profit": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "profit_percentage": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "trades": {
+            "type": "list",
+            "required": False,
+            "nullable": True,
+        },
+        "logs": {
+            "type": "list",
+            "required": False,
+            "nullable": True,
+        },
+        "variables": {
+            "type": "dict",
+            "required": False,
+            "nullable": True,
+        },
+        "created_at": {
+            "type": "integer",
+            "required": True,
+            "coerce": int,
+        },
+        "updated_at": {
+            "type": "integer",
+            "required": True,
+            "coerce": int,
+        },
+    }
+
+    UPDATE_VALIDATION_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "id": {
+            "type": "string",
+            "required": False,
+            "nullable": True,
+        },
+        "gateway_order_id": {
+            "type": "string",
+            "required": False,
+            "nullable": True,
+        },
+        "backtest": {
+            "type": "boolean",
+            "required": False,
+        },
+        "backtest_id": {
+            "type": "string",
+            "required": False,
+            "nullable": True,
+        },
+        "portfolio_id": {
+            "type": "string",
+            "required": False,
+            "nullable": True,
+        },
+        "asset_id": {
+            "type": "string",
+            "required": False,
+            "nullable": True,
+        },
+        "strategy_id": {
+            "type": "string",
+            "required": False,
+            "minlength": 1,
+        },
+        "symbol": {
+            "type": "string",
+            "required": False,
+            "minlength": 1,
+        },
+        "gateway": {
+            "type": "string",
+            "required": False,
+            "minlength": 1,
+        },
+        "side": {
+            "type": "string",
+            "required": False,
+            "allowed": ["buy", "sell"],
+        },
+        "order_type": {
+            "type": "string",
+            "required": False,
+            "minlength": 1,
+        },
+        "status": {
+            "type": "string",
+            "required": False,
+            "minlength": 1,
+        },
+        "volume": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "executed_volume": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "price": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "close_price": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "take_profit_price": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "stop_loss_price": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "commission": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "commission_percentage": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "client_order_id": {
+            "type": "string",
+            "required": False,
+            "nullable": True,
+        },
+        "filled": {
+            "type": "boolean",
+            "required": False,
+        },
+        "profit": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "profit_percentage": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "trades": {
+            "type": "list",
+            "required": False,
+            "nullable": True,
+        },
+        "logs": {
+            "type": "list",
+            "required": False,
+            "nullable": True,
+        },
+        "variables": {
+            "type": "dict",
+            "required": False,
+            "nullable": True,
+        },
+        "created_at": {
+            "type": "integer",
+            "required": False,
+            "coerce": int,
+        },
+        "updated_at": {
+            "type": "integer",
+            "required": False,
+            "coerce": int,
+        },
+    }
+
+    PROJECTION_FIELDS: ClassVar[FrozenSet[str]] = frozenset(
+        {"_id", *POST_VALIDATION_SCHEMA, *UPDATE_VALIDATION_SCHEMA, "created_at", "updated_at"}
+    )
+
     # ───────────────────────────────────────────────────────────
     # PROPERTIES
     # ───────────────────────────────────────────────────────────
+    _stream_service: StreamService
     authentication_classes: ClassVar[List[Type[BaseAuthentication]]] = [
         APIKeyAuthentication
     ]
@@ -34,16 +352,17 @@ class OrderController(BaseController):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._model = OrderModel()
+        self._stream_service = StreamService()
 
     # ───────────────────────────────────────────────────────────
     # PUBLIC METHODS
     # ───────────────────────────────────────────────────────────
     @extend_schema(**get_schema())
-    def get(self, request: Request) -> JsonResponse:
-        return super().get(request)
+    async def get(self, request: Request) -> HttpResponse:
+        return await super().get(request)
 
     @extend_schema(**post_schema())
-    def post(self, request: Request) -> JsonResponse:
+    async def post(self, request: Request) -> HttpResponse:
         logger = logging.getLogger("django")
         data = getattr(request, "data", {})
         body = data if isinstance(data, dict) else {}
@@ -70,7 +389,7 @@ class OrderController(BaseController):
         order_id = None
 
         try:
-            order_id = self._model.store(data=order_data)
+            order_id = await self._model.astore(data=order_data)
         except Exception as e:
             logger.error(f"Failed to create order: {e}")
 
@@ -81,6 +400,15 @@ class OrderController(BaseController):
                 status=HttpStatus.INTERNAL_SERVER_ERROR,
             )
 
+        await self._stream_service.apublish(
+            backtest_id=order_data.get("backtest_id"),
+            resource="order",
+            event="created",
+            document_id=order_id,
+            data=order_data,
+            exclude=self._model.default_projection,
+        )
+
         return self.response(
             success=True,
             message="Order created successfully",
@@ -89,7 +417,7 @@ class OrderController(BaseController):
         )
 
     @extend_schema(**update_schema())
-    def put(self, request: Request, id: str) -> JsonResponse:
+    async def put(self, request: Request, id: str) -> HttpResponse:
         logger = logging.getLogger("django")
         data = getattr(request, "data", {})
         body = data if isinstance(data, dict) else {}
@@ -105,7 +433,7 @@ class OrderController(BaseController):
             )
 
         try:
-            results = self._model.find(
+            results = await self._model.afind(
                 query_filters={
                     "_id": ObjectId(id),
                 }
@@ -243,7 +571,7 @@ class OrderController(BaseController):
             to_update["updated_at"] = updated_at
 
         try:
-            self._model.update(
+            await self._model.aupdate(
                 query_filters={"_id": ObjectId(id)},
                 data=to_update,
             )
@@ -256,6 +584,15 @@ class OrderController(BaseController):
                 status=HttpStatus.INTERNAL_SERVER_ERROR,
             )
 
+        await self._stream_service.apublish(
+            backtest_id=to_update.get("backtest_id", order.get("backtest_id")),
+            resource="order",
+            event="updated",
+            document_id=id,
+            data=to_update,
+            exclude=self._model.default_projection,
+        )
+
         return self.response(
             success=True,
             message="Order updated successfully",
@@ -264,12 +601,12 @@ class OrderController(BaseController):
         )
 
     @extend_schema(**delete_schema())
-    def delete(self, request: Request, id: str) -> JsonResponse:
+    async def delete(self, request: Request, id: str) -> HttpResponse:
         logger = logging.getLogger("django")
         order = None
 
         try:
-            results = self._model.find(
+            results = await self._model.afind(
                 query_filters={
                     "_id": ObjectId(id),
                 }
@@ -293,7 +630,7 @@ class OrderController(BaseController):
             )
 
         try:
-            self._model.delete(
+            await self._model.adelete(
                 query_filters={
                     "_id": ObjectId(id),
                 }
@@ -318,329 +655,11 @@ class OrderController(BaseController):
     # PRIVATE METHODS
     # ───────────────────────────────────────────────────────────
     def _is_post_data_valid(self, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        validator = Validator(
-            {
-                "id": {
-                    "type": "string",
-                    "required": False,
-                    "nullable": True,
-                },
-                "gateway_order_id": {
-                    "type": "string",
-                    "required": False,
-                    "nullable": True,
-                },
-                "backtest": {
-                    "type": "boolean",
-                    "required": True,
-                },
-                "backtest_id": {
-                    "type": "string",
-                    "required": False,
-                    "nullable": True,
-                },
-                "portfolio_id": {
-                    "type": "string",
-                    "required": False,
-                    "nullable": True,
-                },
-                "asset_id": {
-                    "type": "string",
-                    "required": False,
-                    "nullable": True,
-                },
-                "strategy_id": {
-                    "type": "string",
-                    "required": True,
-                    "minlength": 1,
-                },
-                "symbol": {
-                    "type": "string",
-                    "required": True,
-                    "minlength": 1,
-                },
-                "gateway": {
-                    "type": "string",
-                    "required": True,
-                    "minlength": 1,
-                },
-                "side": {
-                    "type": "string",
-                    "required": True,
-                    "allowed": ["buy", "sell"],
-                },
-                "order_type": {
-                    "type": "string",
-                    "required": True,
-                    "minlength": 1,
-                },
-                "status": {
-                    "type": "string",
-                    "required": True,
-                    "minlength": 1,
-                },
-                "volume": {
-                    "type": "float",
-                    "required": True,
-                    "coerce": float,
-                },
-                "executed_volume": {
-                    "type": "float",
-                    "required": True,
-                    "coerce": float,
-                },
-                "price": {
-                    "type": "float",
-                    "required": True,
-                    "coerce": float,
-                },
-                "close_price": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "take_profit_price": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "stop_loss_price": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "commission": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "commission_percentage": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "client_order_id": {
-                    "type": "string",
-                    "required": False,
-                    "nullable": True,
-                },
-                "filled": {
-                    "type": "boolean",
-                    "required": True,
-                },
-                "profit": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "profit_percentage": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "trades": {
-                    "type": "list",
-                    "required": False,
-                    "nullable": True,
-                },
-                "logs": {
-                    "type": "list",
-                    "required": False,
-                    "nullable": True,
-                },
-                "variables": {
-                    "type": "dict",
-                    "required": False,
-                    "nullable": True,
-                },
-                "created_at": {
-                    "type": "integer",
-                    "required": True,
-                    "coerce": int,
-                },
-                "updated_at": {
-                    "type": "integer",
-                    "required": True,
-                    "coerce": int,
-                },
-            }  # type: ignore
-        )
-
-        is_valid = validator.validate(body)  # type: ignore
-        if not is_valid:
-            return validator.errors  # type: ignore
-
-        return None
+        return ValidationService().validate_fast(self.POST_VALIDATION_SCHEMA, body)
 
     def _is_update_data_valid(self, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        validator = Validator(
-            {
-                "id": {
-                    "type": "string",
-                    "required": False,
-                    "nullable": True,
-                },
-                "gateway_order_id": {
-                    "type": "string",
-                    "required": False,
-                    "nullable": True,
-                },
-                "backtest": {
-                    "type": "boolean",
-                    "required": False,
-                },
-                "backtest_id": {
-                    "type": "string",
-                    "required": False,
-                    "nullable": True,
-                },
-                "portfolio_id": {
-                    "type": "string",
-                    "required": False,
-                    "nullable": True,
-                },
-                "asset_id": {
-                    "type": "string",
-                    "required": False,
-                    "nullable": True,
-                },
-                "strategy_id": {
-                    "type": "string",
-                    "required": False,
-                    "minlength": 1,
-                },
-                "symbol": {
-                    "type": "string",
-                    "required": False,
-                    "minlength": 1,
-                },
-                "gateway": {
-                    "type": "string",
-                    "required": False,
-                    "minlength": 1,
-                },
-                "side": {
-                    "type": "string",
-                    "required": False,
-                    "allowed": ["buy", "sell"],
-                },
-                "order_type": {
-                    "type": "string",
-                    "required": False,
-                    "minlength": 1,
-                },
-                "status": {
-                    "type": "string",
-                    "required": False,
-                    "minlength": 1,
-                },
-                "volume": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "executed_volume": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "price": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "close_price": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "take_profit_price": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "stop_loss_price": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "commission": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "commission_percentage": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "client_order_id": {
-                    "type": "string",
-                    "required": False,
-                    "nullable": True,
-                },
-                "filled": {
-                    "type": "boolean",
-                    "required": False,
-                },
-                "profit": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "profit_percentage": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "trades": {
-                    "type": "list",
-                    "required": False,
-                    "nullable": True,
-                },
-                "logs": {
-                    "type": "list",
-                    "required": False,
-                    "nullable": True,
-                },
-                "variables": {
-                    "type": "dict",
-                    "required": False,
-                    "nullable": True,
-                },
-                "created_at": {
-                    "type": "integer",
-                    "required": False,
-                    "coerce": int,
-                },
-                "updated_at": {
-                    "type": "integer",
-                    "required": False,
-                    "coerce": int,
-                },
-            },  # type: ignore
+        return ValidationService().validate_fast(
+            self.UPDATE_VALIDATION_SCHEMA,
+            body,
             allow_unknown=True,
         )
-
-        is_valid = validator.validate(body)  # type: ignore
-        if not is_valid:
-            return validator.errors  # type: ignore
-
-        return None
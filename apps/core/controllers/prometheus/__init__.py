@@ -0,0 +1,28 @@
+from typing import ClassVar, List, Type
+
+from django.http import HttpResponse
+from drf_spectacular.utils import extend_schema
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from apps.core.authentication import APIKeyAuthentication
+from apps.core.services.instrumentation import InstrumentationService
+
+
+class PrometheusController(APIView):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    authentication_classes: ClassVar[List[Type[BaseAuthentication]]] = [
+        APIKeyAuthentication
+    ]
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    @extend_schema(exclude=True)
+    def get(self, request: Request) -> HttpResponse:  # noqa: ARG002
+        content, content_type = InstrumentationService().export()
+
+        return HttpResponse(content, content_type=content_type)
@@ -1,6 +1,6 @@
-from typing import Any, ClassVar, List, Type
+from typing import Any, ClassVar, FrozenSet, List, Type
 
-from django.http import JsonResponse
+from django.http import HttpResponse
 from drf_spectacular.utils import extend_schema
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.request import Request
@@ -13,6 +13,27 @@ from .schemas.get import get_schema
 
 
 class ReportController(BaseController):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    PROJECTION_FIELDS: ClassVar[FrozenSet[str]] = frozenset(
+        {
+            "_id",
+            "backtest_id",
+            "status",
+            "folder",
+            "metrics",
+            "symbols",
+            "strategies",
+            "orders_count",
+            "snapshots_count",
+            "artifacts",
+            "build_time",
+            "created_at",
+            "updated_at",
+        }
+    )
+
     # ───────────────────────────────────────────────────────────
     # PROPERTIES
     # ───────────────────────────────────────────────────────────
@@ -31,5 +52,5 @@ class ReportController(BaseController):
     # PUBLIC METHODS
     # ───────────────────────────────────────────────────────────
     @extend_schema(**get_schema())
-    def get(self, request: Request) -> JsonResponse:
-        return super().get(request)
+    async def get(self, request: Request) -> HttpResponse:
+        return await super().get(request)
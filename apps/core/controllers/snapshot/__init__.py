@@ -1,10 +1,9 @@
 import logging
 from datetime import UTC, datetime
-from typing import Any, ClassVar, Dict, List, Optional, Type
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Type
 
 from bson import ObjectId
-from cerberus import Validator
-from django.http import JsonResponse
+from django.http import HttpResponse
 from drf_spectacular.utils import extend_schema
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.request import Request
@@ -13,6 +12,8 @@ from apps.core.authentication import APIKeyAuthentication
 from apps.core.controllers.base import BaseController
 from apps.core.enums.http_status import HttpStatus
 from apps.core.models.snapshot import SnapshotModel
+from apps.core.services.stream import StreamService
+from apps.core.services.validation import ValidationService
 
 from .schemas.delete import delete_schema
 from .schemas.get import get_schema
@@ -20,9 +21,133 @@ from .schemas.post import post_schema
 
 
 class SnapshotController(BaseController):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    POST_VALIDATION_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "backtest_id": {
+            "type": "string",
+            "required": False,
+            "nullable": True,
+            "minlength": 1,
+        },
+        "backtest": {
+            "type": "boolean",
+            "required": True,
+            "coerce": bool,
+        },
+        "strategy_id": {
+            "type": "string",
+            "required": True,
+            "minlength": 1,
+        },
+        "event": {
+            "type": "string",
+            "required": False,
+            "nullable": True,
+        },
+        "nav": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+            "min": 0,
+        },
+        "allocation": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+            "min": 0,
+        },
+        "nav_peak": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+            "min": 0,
+        },
+        "r2": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+            "min": 0,
+            "max": 1,
+        },
+        "cagr": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "calmar_ratio": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "expected_shortfall": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "max_drawdown": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+            "max": 0,
+        },
+        "profit_factor": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+            "min": 0,
+        },
+        "recovery_factor": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "sharpe_ratio": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "sortino_ratio": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+        },
+        "ulcer_index": {
+            "type": "float",
+            "required": False,
+            "nullable": True,
+            "coerce": float,
+            "min": 0,
+        },
+        "created_at": {
+            "type": "integer",
+            "required": False,
+            "nullable": True,
+            "coerce": int,
+        },
+    }
+
+    PROJECTION_FIELDS: ClassVar[FrozenSet[str]] = frozenset(
+        {"_id", *POST_VALIDATION_SCHEMA, "created_at", "updated_at"}
+    )
+
     # ───────────────────────────────────────────────────────────
     # PROPERTIES
     # ───────────────────────────────────────────────────────────
+    _stream_service: StreamService
     authentication_classes: ClassVar[List[Type[BaseAuthentication]]] = [
         APIKeyAuthentication
     ]
@@ -33,21 +158,37 @@ class SnapshotController(BaseController):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._model = SnapshotModel()
+        self._stream_service = StreamService()
 
     # ───────────────────────────────────────────────────────────
     # PUBLIC METHODS
     # ───────────────────────────────────────────────────────────
+    @classmethod
+    def is_post_data_valid(cls, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        validation_errors = ValidationService().validate_fast(
+            cls.POST_VALIDATION_SCHEMA,
+            body,
+        )
+
+        if validation_errors:
+            return validation_errors
+
+        if body.get("backtest") is True and not body.get("backtest_id"):
+            return {"backtest_id": ["Field is required when backtest is true"]}
+
+        return None
+
     @extend_schema(**get_schema())
-    def get(self, request: Request) -> JsonResponse:
-        return super().get(request)
+    async def get(self, request: Request) -> HttpResponse:
+        return await super().get(request)
 
     @extend_schema(**post_schema())
-    def post(self, request: Request) -> JsonResponse:
+    async def post(self, request: Request) -> HttpResponse:
         logger = logging.getLogger("django")
         data = getattr(request, "data", {})
         body = data if isinstance(data, dict) else {}
 
-        validation_errors = self._is_post_data_valid(body)
+        validation_errors = self.is_post_data_valid(body)
         if validation_errors:
             return self.response(
                 success=False,
@@ -65,7 +206,7 @@ class SnapshotController(BaseController):
             snapshot_data["created_at"] = datetime.fromtimestamp(created_at, tz=UTC)
 
         try:
-            snapshot_id = self._model.store(data=snapshot_data)
+            snapshot_id = await self._model.astore(data=snapshot_data)
 
         except Exception as e:
             logger.error(f"Failed to create snapshot: {e}")
@@ -77,6 +218,15 @@ class SnapshotController(BaseController):
                 status=HttpStatus.INTERNAL_SERVER_ERROR,
             )
 
+        await self._stream_service.apublish(
+            backtest_id=snapshot_data.get("backtest_id"),
+            resource="snapshot",
+            event="created",
+            document_id=snapshot_id,
+            data=snapshot_data,
+            exclude=self._model.default_projection,
+        )
+
         return self.response(
             success=True,
             message="Snapshot created successfully",
@@ -85,12 +235,12 @@ class SnapshotController(BaseController):
         )
 
     @extend_schema(**delete_schema())
-    def delete(self, request: Request, id: str) -> JsonResponse:
+    async def delete(self, request: Request, id: str) -> HttpResponse:
         logger = logging.getLogger("django")
         snapshot = None
 
         try:
-            results = self._model.find(
+            results = await self._model.afind(
                 query_filters={
                     "_id": ObjectId(id),
                 }
@@ -114,7 +264,7 @@ class SnapshotController(BaseController):
             )
 
         try:
-            self._model.delete(
+            await self._model.adelete(
                 query_filters={
                     "_id": ObjectId(id),
                 }
@@ -133,139 +283,3 @@ class SnapshotController(BaseController):
             message="Snapshot deleted successfully",
             status=HttpStatus.OK,
         )
-
-    # ───────────────────────────────────────────────────────────
-    # PRIVATE METHODS
-    # ───────────────────────────────────────────────────────────
-    def _is_post_data_valid(self, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        validator = Validator(
-            {
-                "backtest_id": {
-                    "type": "string",
-                    "required": False,
-                    "nullable": True,
-                    "minlength": 1,
-                },
-                "backtest": {
-                    "type": "boolean",
-                    "required": True,
-                    "coerce": bool,
-                },
-                "strategy_id": {
-                    "type": "string",
-                    "required": True,
-                    "minlength": 1,
-                },
-                "event": {
-                    "type": "string",
-                    "required": False,
-                    "nullable": True,
-                },
-                "nav": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                    "min": 0,
-                },
-                "allocation": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                    "min": 0,
-                },
-                "nav_peak": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                    "min": 0,
-                },
-                "r2": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                    "min": 0,
-                    "max": 1,
-                },
-                "cagr": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "calmar_ratio": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "expected_shortfall": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "max_drawdown": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                    "max": 0,
-                },
-                "profit_factor": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                    "min": 0,
-                },
-                "recovery_factor": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "sharpe_ratio": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "sortino_ratio": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                },
-                "ulcer_index": {
-                    "type": "float",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": float,
-                    "min": 0,
-                },
-                "created_at": {
-                    "type": "integer",
-                    "required": False,
-                    "nullable": True,
-                    "coerce": int,
-                },
-            }  # type: ignore
-        )
-
-        is_valid = validator.validate(body)  # type: ignore
-
-        if not is_valid:
-            return validator.errors  # type: ignore
-
-        if body.get("backtest") is True:
-            backtest_id = body.get("backtest_id")
-            if not backtest_id or backtest_id is None:
-                return {
-                    "backtest_id": ["Field is required when backtest is true"]
-                }
-
-        return None
@@ -0,0 +1,168 @@
+import logging
+from typing import Any, ClassVar, Dict, List, Optional, Set, Type
+
+from django.conf import settings
+from django.http import HttpResponse
+from drf_spectacular.utils import extend_schema
+from pymongo.errors import BulkWriteError
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.parsers import BaseParser
+from rest_framework.request import Request
+
+from apps.core.authentication import APIKeyAuthentication
+from apps.core.controllers.base import BaseController
+from apps.core.controllers.snapshot import SnapshotController
+from apps.core.enums.http_status import HttpStatus
+from apps.core.models.snapshot import SnapshotModel
+from apps.core.parsers import NDJSONParser
+from apps.core.services.stream import StreamService
+
+from .schemas.post import post_schema
+
+
+class SnapshotBulkController(BaseController):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _stream_service: StreamService
+    authentication_classes: ClassVar[List[Type[BaseAuthentication]]] = [
+        APIKeyAuthentication
+    ]
+    parser_classes: ClassVar[List[Type[BaseParser]]] = [
+        NDJSONParser,
+    ]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._model = SnapshotModel()
+        self._stream_service = StreamService()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    @extend_schema(**post_schema())
+    async def post(self, request: Request) -> HttpResponse:
+        logger = logging.getLogger("django")
+        data = getattr(request, "data", [])
+
+        if isinstance(data, dict):
+            return self.response(
+                success=False,
+                message="Expected an NDJSON body",
+                status=HttpStatus.BAD_REQUEST,
+            )
+
+        batch_size = settings.BULK_INSERT_BATCH_SIZE
+        snapshots: List[Dict[str, Any]] = []
+        indexes: List[int] = []
+        summary: Dict[str, Any] = {
+            "received": 0,
+            "inserted": 0,
+            "failed": 0,
+            "errors": [],
+        }
+
+        try:
+            for index, item in enumerate(data):
+                summary["received"] += 1
+                validation_errors = self._is_item_valid(item)
+
+                if validation_errors:
+                    self._add_error(summary, index, validation_errors)
+                    continue
+
+                snapshots.append(dict(item))
+                indexes.append(index)
+
+                if len(snapshots) >= batch_size:
+                    await self._store_batch(snapshots, indexes, summary)
+                    snapshots = []
+                    indexes = []
+
+            if snapshots:
+                await self._store_batch(snapshots, indexes, summary)
+
+        except Exception as e:
+            logger.error(f"Failed to create snapshots: {e}")
+
+            return self.response(
+                success=False,
+                message="Failed to create snapshots",
+                data=summary,
+                status=HttpStatus.INTERNAL_SERVER_ERROR,
+            )
+
+        if summary["inserted"] == 0:
+            return self.response(
+                success=False,
+                message="No snapshots were created",
+                data=summary,
+                status=HttpStatus.BAD_REQUEST,
+            )
+
+        if summary["failed"]:
+            return self.response(
+                success=True,
+                message="Some snapshots could not be created",
+                data=summary,
+                status=HttpStatus.MULTI_STATUS,
+            )
+
+        return self.response(
+            success=True,
+            message="Snapshots created successfully",
+            data=summary,
+            status=HttpStatus.CREATED,
+        )
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    async def _store_batch(
+        self,
+        snapshots: List[Dict[str, Any]],
+        indexes: List[int],
+        summary: Dict[str, Any],
+    ) -> None:
+        failed: Set[int] = set()
+
+        try:
+            await self._model.astore_many(data=snapshots, ordered=False)
+        except BulkWriteError as e:
+            for write_error in e.details.get("writeErrors", []):
+                failed.add(write_error["index"])
+                self._add_error(
+                    summary,
+                    indexes[write_error["index"]],
+                    {"database": [write_error.get("errmsg", "Write failed")]},
+                )
+
+        summary["inserted"] += len(snapshots) - len(failed)
+
+        await self._stream_service.apublish_many(
+            resource="snapshot",
+            event="created",
+            documents=[snapshot for position, snapshot in enumerate(snapshots) if position not in failed],
+            exclude=self._model.default_projection,
+        )
+
+    def _is_item_valid(self, item: Any) -> Optional[Dict[str, Any]]:
+        if not isinstance(item, dict):
+            return {"snapshot": ["must be a JSON object"]}
+
+        return SnapshotController.is_post_data_valid(item)
+
+    # Helpers
+    def _add_error(
+        self,
+        summary: Dict[str, Any],
+        index: int,
+        errors: Dict[str, Any],
+    ) -> None:
+        summary["failed"] += 1
+
+        if len(summary["errors"]) < settings.BULK_MAX_REPORTED_ERRORS:
+            summary["errors"].append({"index": index, "errors": errors})
@@ -0,0 +1,48 @@
+from typing import Any
+
+from drf_spectacular.utils import inline_serializer
+from rest_framework import serializers
+
+from apps.core.controllers.snapshot.schemas.post import post_schema as snapshot_post_schema
+
+
+def post_schema() -> Any:
+    return {
+        "tags": ["Snapshot"],
+        "summary": "Create snapshots in bulk",
+        "description": (
+            "Streams an NDJSON body (application/x-ndjson), one snapshot per line. "
+            "Lines are validated as they are read and inserted in batches of "
+            "BULK_INSERT_BATCH_SIZE, so the payload is never held in memory. "
+            "Valid lines are inserted even when others are rejected."
+        ),
+        "request": {
+            "application/x-ndjson": snapshot_post_schema()["request"],
+        },
+        "responses": {
+            201: inline_serializer(
+                name="SnapshotBulkResponse",
+                fields={
+                    "success": serializers.BooleanField(),
+                    "message": serializers.CharField(),
+                    "data": inline_serializer(
+                        name="SnapshotBulkData",
+                        fields={
+                            "received": serializers.IntegerField(),
+                            "inserted": serializers.IntegerField(),
+                            "failed": serializers.IntegerField(),
+                            "errors": serializers.ListField(
+                                child=inline_serializer(
+                                    name="SnapshotBulkError",
+                                    fields={
+                                        "index": serializers.IntegerField(),
+                                        "errors": serializers.DictField(),
+                                    },
+                                ),
+                            ),
+                        },
+                    ),
+                },
+            ),
+        },
+    }
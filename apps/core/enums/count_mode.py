@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class CountMode(Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class FieldType(Enum):
+    STRING = "string"
+    INTEGER = "integer"
+    FLOAT = "float"
+    BOOLEAN = "boolean"
+    DATETIME = "datetime"
+    OBJECT_ID = "object_id"
@@ -5,9 +5,12 @@ class HttpStatus(Enum):
     OK = 200
     CREATED = 201
     NO_CONTENT = 204
+    MULTI_STATUS = 207
+    NOT_MODIFIED = 304
     BAD_REQUEST = 400
     UNAUTHORIZED = 401
     FORBIDDEN = 403
     NOT_FOUND = 404
     METHOD_NOT_ALLOWED = 405
+    REQUEST_ENTITY_TOO_LARGE = 413
     INTERNAL_SERVER_ERROR = 500
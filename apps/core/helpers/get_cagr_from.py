@@ -0,0 +1,15 @@
+import numpy as np
+
+
+def get_cagr_from(nav: np.ndarray, years: float) -> float:
+    if nav.size == 0:
+        raise ValueError("NAV series cannot be empty")
+
+    if nav[0] <= 0:
+        raise ValueError("Initial NAV must be positive")
+
+    if years <= 0 or nav[-1] <= 0:
+        return 0.0
+
+    # CAGR = (NAV_end / NAV_start) ^ (1 / years) - 1
+    return float((nav[-1] / nav[0]) ** (1.0 / years) - 1.0)
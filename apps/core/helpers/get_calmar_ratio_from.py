@@ -0,0 +1,8 @@
+def get_calmar_ratio_from(cagr: float, max_drawdown: float) -> float:
+    if max_drawdown > 0:
+        raise ValueError("Max drawdown must be non-positive")
+
+    if max_drawdown == 0:
+        return 0.0
+
+    return float(cagr / -max_drawdown)
@@ -0,0 +1,17 @@
+import math
+
+import numpy as np
+
+
+def get_cvar_from(returns: np.ndarray, confidence: float = 0.95) -> float:
+    if returns.size == 0:
+        raise ValueError("Returns series cannot be empty")
+
+    if not 0 < confidence < 1:
+        raise ValueError("Confidence must be between 0 and 1")
+
+    tail_size = max(1, math.ceil(returns.size * (1.0 - confidence)))
+    tail = np.partition(returns, tail_size - 1)[:tail_size]
+
+    # CVaR_a = -E[R | R <= VaR_a]
+    return float(-tail.mean())
@@ -0,0 +1,8 @@
+import numpy as np
+
+
+def get_max_drawdown_from(drawdowns: np.ndarray) -> float:
+    if drawdowns.size == 0:
+        raise ValueError("Drawdown series cannot be empty")
+
+    return float(drawdowns.min())
@@ -0,0 +1,14 @@
+import numpy as np
+
+
+def get_profit_factor_from(profits: np.ndarray) -> float:
+    if profits.size == 0:
+        raise ValueError("Profits series cannot be empty")
+
+    gross_profit = float(profits[profits > 0].sum())
+    gross_loss = float(-profits[profits < 0].sum())
+
+    if gross_loss == 0:
+        return 0.0
+
+    return gross_profit / gross_loss
@@ -0,0 +1,22 @@
+import numpy as np
+
+
+def get_r2_from(nav: np.ndarray) -> float:
+    if nav.size == 0:
+        raise ValueError("NAV series cannot be empty")
+
+    if nav.size == 1:
+        return 0.0
+
+    size = nav.size
+    deviations = nav - nav.mean()
+    nav_variance = float(np.dot(deviations, deviations))
+
+    if nav_variance == 0:
+        return 0.0
+
+    # R^2 of an OLS line over t = 0..n-1: cov(t, NAV)^2 / (var(t) * var(NAV)), var(t) = n(n^2 - 1) / 12
+    time_variance = size * (size * size - 1) / 12.0
+    covariance = float(np.dot(np.arange(size, dtype=np.float64), deviations))
+
+    return covariance * covariance / (time_variance * nav_variance)
@@ -0,0 +1,13 @@
+import numpy as np
+
+
+def get_recovery_factor_from(nav: np.ndarray, peaks: np.ndarray) -> float:
+    if nav.size == 0 or peaks.size != nav.size:
+        raise ValueError("NAV and peak series must be non-empty and of equal length")
+
+    max_loss = float((peaks - nav).max())
+
+    if max_loss == 0:
+        return 0.0
+
+    return float((nav[-1] - nav[0]) / max_loss)
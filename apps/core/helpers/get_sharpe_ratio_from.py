@@ -0,0 +1,14 @@
+import numpy as np
+
+
+def get_sharpe_ratio_from_orders(returns: np.ndarray, periods_per_year: float) -> float:
+    if returns.size == 0:
+        raise ValueError("Returns series cannot be empty")
+
+    deviation = float(returns.std())
+
+    if deviation == 0 or periods_per_year <= 0:
+        return 0.0
+
+    # Sharpe = mean(R) / std(R) * sqrt(periods per year), Rf = 0
+    return float(returns.mean() / deviation * np.sqrt(periods_per_year))
@@ -0,0 +1,21 @@
+import numpy as np
+
+
+def get_sortino_ratio_from(
+    returns: np.ndarray,
+    losses: np.ndarray,
+    periods_per_year: float,
+) -> float:
+    if returns.size == 0:
+        raise ValueError("Returns series cannot be empty")
+
+    if periods_per_year <= 0:
+        return 0.0
+
+    # Downside deviation = sqrt(sum(min(R, 0) ^ 2) / N)
+    downside_deviation = float(np.sqrt(np.dot(losses, losses) / returns.size))
+
+    if downside_deviation == 0:
+        return 0.0
+
+    return float(returns.mean() / downside_deviation * np.sqrt(periods_per_year))
@@ -0,0 +1,11 @@
+import numpy as np
+
+
+def get_ulcer_index_from(drawdowns: np.ndarray) -> float:
+    if drawdowns.size == 0:
+        raise ValueError("Drawdown series cannot be empty")
+
+    # Ulcer Index (Martin, 1987): UI = sqrt(mean((100 * DD_t) ^ 2))
+    percentages = drawdowns * 100.0
+
+    return float(np.sqrt(np.dot(percentages, percentages) / percentages.size))
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from bson.raw_bson import RawBSONDocument
 
 
 class RepositoryInterface(ABC):
@@ -9,15 +11,53 @@ class RepositoryInterface(ABC):
     @abstractmethod
     def find(
         self,
+        *,
         limit: int = 10,
         offset: int = 0,
         sort_by: Optional[str] = None,
         sort_direction: str = "desc",
         query_filters: Optional[Dict[str, Any]] = None,
         projection_fields: Optional[Dict[str, Any]] = None,
+        after: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         pass
 
+    @abstractmethod
+    def find_raw(
+        self,
+        *,
+        limit: int = 10,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+        after: Optional[Dict[str, Any]] = None,
+    ) -> List[RawBSONDocument]:
+        pass
+
+    @abstractmethod
+    def stream(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "asc",
+        projection_fields: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def stream_raw(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "asc",
+        projection_fields: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[RawBSONDocument]:
+        pass
+
     @abstractmethod
     def count(
         self,
@@ -25,6 +65,13 @@ class RepositoryInterface(ABC):
     ) -> int:
         pass
 
+    @abstractmethod
+    def estimated_count(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        pass
+
     @abstractmethod
     def store(
         self,
@@ -36,6 +83,7 @@ class RepositoryInterface(ABC):
     def store_many(
         self,
         data: List[Dict[str, Any]],
+        ordered: bool = True,
     ) -> List[str]:
         pass
 
@@ -60,3 +108,112 @@ class RepositoryInterface(ABC):
         query_filters: Dict[str, Any],
     ) -> int:
         pass
+
+    @abstractmethod
+    async def afind(
+        self,
+        *,
+        limit: int = 10,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+        after: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def afind_raw(
+        self,
+        *,
+        limit: int = 10,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+        after: Optional[Dict[str, Any]] = None,
+    ) -> List[RawBSONDocument]:
+        pass
+
+    @abstractmethod
+    def astream(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "asc",
+        projection_fields: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def astream_raw(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "asc",
+        projection_fields: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[RawBSONDocument]:
+        pass
+
+    @abstractmethod
+    async def acount(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        pass
+
+    @abstractmethod
+    async def aestimated_count(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        pass
+
+    @abstractmethod
+    async def astore(
+        self,
+        data: Dict[str, Any],
+    ) -> str:
+        pass
+
+    @abstractmethod
+    async def astore_many(
+        self,
+        data: List[Dict[str, Any]],
+        ordered: bool = True,
+    ) -> List[str]:
+        pass
+
+    @abstractmethod
+    async def aupdate(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+    ) -> int:
+        pass
+
+    @abstractmethod
+    async def adelete(
+        self,
+        query_filters: Dict[str, Any],
+    ) -> int:
+        pass
+
+    @abstractmethod
+    async def adelete_many(
+        self,
+        query_filters: Dict[str, Any],
+    ) -> int:
+        pass
+
+    @abstractmethod
+    def ensure_indexes(
+        self,
+        dry_run: bool = False,
+        rebuild_drifted: bool = False,
+    ) -> Dict[str, List[str]]:
+        pass
@@ -0,0 +1,467 @@
+import asyncio
+import json
+import resource
+import subprocess
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import numpy as np
+from asgiref.testing import ApplicationCommunicator
+from celery import current_app
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.core.enums.http_status import HttpStatus
+from apps.core.enums.report_status import ReportStatus
+from apps.core.models.backtest import BacktestModel
+from apps.core.models.order import OrderModel
+from apps.core.models.report import ReportModel
+from apps.core.models.snapshot import SnapshotModel
+from apps.core.services.async_mongodb import AsyncMongoDBService
+from apps.core.services.mongodb import MongoDBService
+from apps.core.tasks import make_backtest_report
+
+SYMBOLS = np.array(["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT"], dtype=object)
+STRATEGIES = np.array(["ema5_breakout", "mean_reversion", "momentum"], dtype=object)
+SCENARIOS = ("snapshot_post", "order_post", "orders_deep_page", "orders_filtered", "report")
+STARTED_AT = 1_704_067_200
+
+Request = Tuple[str, str, Optional[Dict[str, Any]]]
+
+
+class Command(BaseCommand):
+    help = "Seed a benchmark database and measure throughput and latency of the hot endpoints in-process"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--snapshots",
+            type=int,
+            default=100_000,
+            help="Snapshots seeded for the benchmark backtest",
+        )
+        parser.add_argument(
+            "--orders",
+            type=int,
+            default=100_000,
+            help="Orders seeded for the benchmark backtest",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=2_000,
+            help="Requests sent per HTTP scenario",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=32,
+            help="Requests in flight per HTTP scenario",
+        )
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=100,
+            help="Page size of the order list scenarios",
+        )
+        parser.add_argument(
+            "--scenarios",
+            nargs="+",
+            choices=SCENARIOS,
+            default=list(SCENARIOS),
+            help="Scenarios to run",
+        )
+        parser.add_argument(
+            "--database",
+            default=f"{settings.DATABASES['mongodb']['DB_NAME']}_benchmark",
+            help="MongoDB database seeded and dropped by the benchmark",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=None,
+            help="JSON results path, defaults to storage/benchmarks/api-<commit>-<time>.json",
+        )
+        parser.add_argument(
+            "--baseline",
+            type=Path,
+            default=None,
+            help="Previous JSON results to compare against",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the benchmark database after the run",
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        self._use_database(options["database"])
+
+        generator = np.random.default_rng(seed=5)
+        dataset = {"snapshots": options["snapshots"], "orders": options["orders"]}
+
+        try:
+            self.stdout.write(f"Seeding {dataset['snapshots']} snapshots and {dataset['orders']} orders")
+            backtest_id = self._seed(generator, dataset["snapshots"], dataset["orders"])
+
+            results = asyncio.run(self._run_http_scenarios(generator, backtest_id, options))
+
+            if "report" in options["scenarios"]:
+                results["report"] = self._run_report(backtest_id)
+        finally:
+            if not options["keep"]:
+                MongoDBService().get_collection("backtests").database.client.drop_database(options["database"])
+
+        document = {
+            "commit": self._get_commit(),
+            "created_at": datetime.now(tz=UTC).isoformat(),
+            "dataset": dataset,
+            "requests": options["requests"],
+            "concurrency": options["concurrency"],
+            "page_size": options["page_size"],
+            "scenarios": results,
+        }
+
+        self._write_results(document, options["baseline"])
+        self._save(document, options["output"])
+
+    # Helpers
+    def _use_database(self, database: str) -> None:
+        if database == settings.DATABASES["mongodb"]["DB_NAME"]:
+            raise CommandError("The benchmark database must differ from the configured database")
+
+        settings.DATABASES["mongodb"]["DB_NAME"] = database
+        settings.CACHES["default"]["KEY_PREFIX"] = "benchmark"
+        MongoDBService.reset_after_fork()
+        AsyncMongoDBService.reset_after_fork()
+
+        MongoDBService().get_collection("backtests").database.client.drop_database(database)
+
+    def _seed(self, generator: np.random.Generator, snapshots: int, orders: int) -> str:
+        backtest_id = BacktestModel().store(
+            data={
+                "asset": "btcusdt",
+                "strategies": "ema5_breakout",
+                "status": "running",
+                "start_at": STARTED_AT,
+                "end_at": STARTED_AT + snapshots * 60,
+            }
+        )
+        batch_size = settings.BULK_INSERT_BATCH_SIZE
+
+        for offset in range(0, snapshots, batch_size):
+            SnapshotModel().store_many(
+                data=self._get_snapshots(generator, backtest_id, offset, min(batch_size, snapshots - offset)),
+                ordered=False,
+            )
+
+        for offset in range(0, orders, batch_size):
+            OrderModel().store_many(
+                data=self._get_orders(generator, backtest_id, snapshots, min(batch_size, orders - offset)),
+                ordered=False,
+            )
+
+        return backtest_id
+
+    def _get_snapshots(
+        self,
+        generator: np.random.Generator,
+        backtest_id: str,
+        offset: int,
+        size: int,
+    ) -> List[Dict[str, Any]]:
+        nav = 10_000.0 * np.cumprod(1.0 + generator.normal(0.00001, 0.001, size))
+
+        return [
+            {
+                "backtest": True,
+                "backtest_id": backtest_id,
+                "strategy_id": "ema5_breakout",
+                "event": "tick",
+                "nav": float(value),
+                "allocation": 10_000.0,
+                "nav_peak": float(value),
+                "created_at": STARTED_AT + (offset + position) * 60,
+            }
+            for position, value in enumerate(nav)
+        ]
+
+    def _get_orders(
+        self,
+        generator: np.random.Generator,
+        backtest_id: str,
+        snapshots: int,
+        size: int,
+    ) -> List[Dict[str, Any]]:
+        created_at = np.sort(STARTED_AT + generator.integers(0, max(snapshots, 1) * 60, size))
+        profits = generator.normal(1.0, 25.0, size)
+        symbols = generator.choice(SYMBOLS, size)
+        strategies = generator.choice(STRATEGIES, size)
+
+        return [
+            {
+                **self._get_order_body(backtest_id, int(created_at[position])),
+                "symbol": symbols[position],
+                "strategy_id": strategies[position],
+                "profit": float(profits[position]),
+            }
+            for position in range(size)
+        ]
+
+    async def _run_http_scenarios(
+        self,
+        generator: np.random.Generator,
+        backtest_id: str,
+        options: Dict[str, Any],
+    ) -> Dict[str, Dict[str, Any]]:
+        application = get_asgi_application()
+        pages = max(1, options["orders"] // options["page_size"])
+        page_numbers = generator.integers(1, pages + 1, options["requests"])
+        builders: Dict[str, Callable[[int], Request]] = {
+            "snapshot_post": lambda index: (
+                "POST",
+                "/api/snapshot/",
+                self._get_snapshot_body(backtest_id, STARTED_AT + index),
+            ),
+            "order_post": lambda index: (
+                "POST",
+                "/api/order/",
+                self._get_order_body(backtest_id, STARTED_AT + index),
+            ),
+            "orders_deep_page": lambda index: (
+                "GET",
+                "/api/orders/?"
+                + urlencode(
+                    {
+                        "filter_by": f"backtest_id:{backtest_id}",
+                        "page": int(page_numbers[index]),
+                        "page_size": options["page_size"],
+                    }
+                ),
+                None,
+            ),
+            "orders_filtered": lambda index: (
+                "GET",
+                "/api/orders/?"
+                + urlencode(
+                    [
+                        ("filter_by", f"backtest_id:{backtest_id}"),
+                        ("filter_by", f"symbol:in:{SYMBOLS[index % 2]},{SYMBOLS[2 + index % 2]}"),
+                        ("filter_by", "profit>0"),
+                        ("sort", "profit"),
+                        ("page_size", options["page_size"]),
+                    ]
+                ),
+                None,
+            ),
+        }
+        results = {}
+
+        for name, builder in builders.items():
+            if name not in options["scenarios"]:
+                continue
+
+            self.stdout.write(f"Running {name}")
+            results[name] = await self._run_scenario(application, builder, options["requests"], options["concurrency"])
+
+        return results
+
+    async def _run_scenario(
+        self,
+        application: Any,
+        builder: Callable[[int], Request],
+        requests: int,
+        concurrency: int,
+    ) -> Dict[str, Any]:
+        latencies: List[float] = []
+        statuses: Dict[int, int] = {}
+        indexes = iter(range(requests))
+
+        async def worker() -> None:
+            for index in indexes:
+                method, path, body = builder(index)
+                started_at = time.perf_counter()
+                status = await self._request(application, method, path, body)
+                latencies.append(time.perf_counter() - started_at)
+                statuses[status] = statuses.get(status, 0) + 1
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started_at
+
+        return {
+            **self._get_latency_summary(latencies, elapsed),
+            "errors": sum(count for status, count in statuses.items() if status >= HttpStatus.BAD_REQUEST.value),
+            "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        }
+
+    async def _request(
+        self,
+        application: Any,
+        method: str,
+        path: str,
+        body: Optional[Dict[str, Any]],
+    ) -> int:
+        route, _, query = path.partition("?")
+        content = json.dumps(body).encode() if body is not None else b""
+        communicator = ApplicationCommunicator(
+            application,
+            {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": method,
+                "scheme": "http",
+                "path": route,
+                "raw_path": route.encode(),
+                "query_string": query.encode(),
+                "root_path": "",
+                "headers": [
+                    (b"host", b"localhost"),
+                    (b"x-api-key", (settings.API_KEY or "").encode()),
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(content)).encode()),
+                ],
+                "client": ("127.0.0.1", 0),
+                "server": ("localhost", 80),
+            },
+        )
+
+        await communicator.send_input({"type": "http.request", "body": content})
+        start = await communicator.receive_output(timeout=60)
+        message = start
+
+        while message["type"] != "http.response.body" or message.get("more_body", False):
+            message = await communicator.receive_output(timeout=60)
+
+        await communicator.wait()
+
+        return start["status"]
+
+    def _run_report(self, backtest_id: str) -> Dict[str, Any]:
+        self.stdout.write("Running report")
+        current_app.conf.task_always_eager = True
+
+        ReportModel().update(
+            query_filters={"backtest_id": backtest_id},
+            data={"status": ReportStatus.PENDING.value},
+        )
+
+        started_at = time.perf_counter()
+        make_backtest_report(backtest_id)
+        elapsed = time.perf_counter() - started_at
+
+        report = ReportModel().find(query_filters={"backtest_id": backtest_id}, limit=1)
+
+        return {
+            "seconds": round(elapsed, 3),
+            "status": report[0]["status"] if report else None,
+            "peak_rss_mb": self._get_peak_rss(),
+        }
+
+    def _get_latency_summary(self, latencies: List[float], elapsed: float) -> Dict[str, Any]:
+        milliseconds = np.array(latencies) * 1e3
+        p50, p95, p99 = np.percentile(milliseconds, [50, 95, 99]) if milliseconds.size else (0.0, 0.0, 0.0)
+
+        return {
+            "requests": len(latencies),
+            "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+            "p99_ms": round(float(p99), 2),
+            "max_ms": round(float(milliseconds.max()), 2) if milliseconds.size else 0.0,
+            "peak_rss_mb": self._get_peak_rss(),
+        }
+
+    def _write_results(self, document: Dict[str, Any], baseline_path: Optional[Path]) -> None:
+        baseline = json.loads(Path(baseline_path).read_text())["scenarios"] if baseline_path else {}
+
+        self.stdout.write(
+            f"{'scenario':<18}{'rps':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'errors':>8}{'rss MB':>10}{'vs base':>22}"
+        )
+
+        for name, result in document["scenarios"].items():
+            if name == "report":
+                self.stdout.write(f"{name:<18}{result['seconds']:>9.2f}s{'':>38}{result['peak_rss_mb']:>10.0f}")
+                continue
+
+            self.stdout.write(
+                f"{name:<18}"
+                f"{result['rps']:>10.1f}"
+                f"{result['p50_ms']:>10.1f}"
+                f"{result['p95_ms']:>10.1f}"
+                f"{result['p99_ms']:>10.1f}"
+                f"{result['errors']:>8}"
+                f"{result['peak_rss_mb']:>10.0f}"
+                f"{self._get_comparison(result, baseline.get(name)):>22}"
+            )
+
+    def _get_comparison(self, result: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> str:
+        if not baseline or not baseline.get("rps") or not baseline.get("p95_ms"):
+            return ""
+
+        rps = (result["rps"] / baseline["rps"] - 1.0) * 100
+        p95 = (result["p95_ms"] / baseline["p95_ms"] - 1.0) * 100
+
+        return f"rps {rps:+.0f}% p95 {p95:+.0f}%"
+
+    def _save(self, document: Dict[str, Any], output: Optional[Path]) -> None:
+        if output is None:
+            stamp = datetime.now(tz=UTC).strftime("%Y%m%d%H%M%S")
+            output = Path(settings.BASE_DIR) / "storage" / "benchmarks" / f"api-{document['commit']}-{stamp}.json"
+
+        output = Path(output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(document, indent=2))
+
+        self.stdout.write(f"Results saved to {output}")
+
+    def _get_snapshot_body(self, backtest_id: str, created_at: int) -> Dict[str, Any]:
+        return {
+            "backtest": True,
+            "backtest_id": backtest_id,
+            "strategy_id": "ema5_breakout",
+            "event": "tick",
+            "nav": 10_250.5,
+            "allocation": 10_000.0,
+            "nav_peak": 10_300.0,
+            "created_at": created_at,
+        }
+
+    def _get_order_body(self, backtest_id: str, created_at: int) -> Dict[str, Any]:
+        return {
+            "backtest": True,
+            "backtest_id": backtest_id,
+            "strategy_id": "ema5_breakout",
+            "symbol": "BTCUSDT",
+            "gateway": "binance",
+            "side": "buy",
+            "order_type": "market",
+            "status": "closed",
+            "volume": 0.075,
+            "executed_volume": 0.075,
+            "price": 110_260.78,
+            "close_price": 111_386.07,
+            "filled": True,
+            "profit": 84.32,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+    def _get_commit(self) -> str:
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                capture_output=True,
+                check=True,
+                cwd=settings.BASE_DIR,
+                text=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return "unknown"
+
+    def _get_peak_rss(self) -> float:
+        return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
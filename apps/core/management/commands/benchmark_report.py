@@ -0,0 +1,95 @@
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.core.services.report import ReportService
+
+SYMBOLS = np.array(["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT"], dtype=object)
+STRATEGIES = np.array(["ema5_breakout", "mean_reversion", "momentum"], dtype=object)
+
+
+class Command(BaseCommand):
+    help = "Measure report build time against backtest size"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[1_000, 10_000, 100_000, 1_000_000],
+            help="Snapshot counts to measure",
+        )
+        parser.add_argument(
+            "--orders-ratio",
+            type=float,
+            default=0.1,
+            help="Orders generated per snapshot",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Builds per size, the fastest is reported",
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        service = ReportService()
+        generator = np.random.default_rng(seed=5)
+
+        self.stdout.write(f"{'snapshots':>12}{'orders':>12}{'build':>14}{'per 1k rows':>14}")
+
+        for size in options["sizes"]:
+            orders, snapshots = self._get_backtest(generator, size, options["orders_ratio"])
+            elapsed = self._measure(service, orders, snapshots, options["repeat"])
+            rows = size + orders["profit"].size
+
+            self.stdout.write(
+                f"{size:>12}"
+                f"{orders['profit'].size:>12}"
+                f"{elapsed * 1e3:>11.1f} ms"
+                f"{elapsed * 1e6 / rows:>11.1f} ms"
+            )
+
+    # Helpers
+    def _measure(
+        self,
+        service: ReportService,
+        orders: Dict[str, np.ndarray],
+        snapshots: Dict[str, np.ndarray],
+        repeat: int,
+    ) -> float:
+        timings = []
+
+        with tempfile.TemporaryDirectory() as folder:
+            for _ in range(repeat):
+                started_at = time.perf_counter()
+                service.build(folder=Path(folder), orders=orders, snapshots=snapshots)
+                timings.append(time.perf_counter() - started_at)
+
+        return min(timings)
+
+    def _get_backtest(
+        self,
+        generator: np.random.Generator,
+        size: int,
+        orders_ratio: float,
+    ) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        started_at = np.datetime64("2024-01-01T00:00:00", "ms")
+        orders_size = max(1, int(size * orders_ratio))
+
+        snapshots = {
+            "created_at": started_at + np.arange(size) * np.timedelta64(60_000, "ms"),
+            "nav": 10_000.0 * np.cumprod(1.0 + generator.normal(0.00001, 0.001, size)),
+        }
+        orders = {
+            "created_at": np.sort(started_at + generator.integers(0, size * 60_000, orders_size)),
+            "profit": generator.normal(1.0, 25.0, orders_size),
+            "symbol": generator.choice(SYMBOLS, orders_size),
+            "strategy_id": generator.choice(STRATEGIES, orders_size),
+        }
+
+        return orders, snapshots
@@ -0,0 +1,113 @@
+import time
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+from cerberus import Validator
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.core.controllers.base import BaseController
+from apps.core.controllers.orders import OrderController
+from apps.core.controllers.snapshot import SnapshotController
+from apps.core.services.validation import ValidationService
+
+ORDER = {
+    "backtest": True,
+    "backtest_id": "690a08adc741ec5f14b8e628",
+    "strategy_id": "ema5_breakout",
+    "symbol": "BTCUSDT",
+    "gateway": "binance",
+    "side": "buy",
+    "order_type": "market",
+    "status": "closed",
+    "volume": 0.07493382240856099,
+    "executed_volume": 0.07493382240856099,
+    "price": 110260.78,
+    "close_price": 111386.07,
+    "take_profit_price": 111363.3878,
+    "stop_loss_price": 99234.70199999999,
+    "client_order_id": "hrz-f4746dc603a0",
+    "filled": True,
+    "profit": 84.3222810181302,
+    "profit_percentage": 0.01020571412609278,
+    "created_at": 1762200000,
+    "updated_at": 1762200000,
+}
+
+SNAPSHOT = {
+    "backtest": True,
+    "backtest_id": "690a08adc741ec5f14b8e628",
+    "strategy_id": "ema5_breakout",
+    "event": "tick",
+    "nav": 10250.5,
+    "allocation": 10000.0,
+    "nav_peak": 10300.0,
+    "r2": 0.82,
+    "created_at": 1762200000,
+}
+
+PAGINATION = {
+    "page_param": "1",
+    "page_size_param": "10",
+    "sort_by_param": "created_at",
+    "sort_direction_param": "desc",
+    "filter_by_param": ["symbol:BTCUSDT"],
+    "after_param": None,
+    "count_param": "exact",
+}
+
+
+class Command(BaseCommand):
+    help = "Measure the per-request cost of request validation"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=2000,
+            help="Validations per measurement",
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        iterations = options["iterations"]
+        service = ValidationService()
+        cases: List[Tuple[str, Mapping[str, Any], Dict[str, Any]]] = [
+            ("order", OrderController.POST_VALIDATION_SCHEMA, ORDER),
+            ("order (invalid)", OrderController.POST_VALIDATION_SCHEMA, {**ORDER, "side": "hold"}),
+            ("snapshot", SnapshotController.POST_VALIDATION_SCHEMA, SNAPSHOT),
+            ("pagination", BaseController.PAGINATION_VALIDATION_SCHEMA, PAGINATION),
+        ]
+
+        self.stdout.write(
+            f"{'case':<18}{'per request':>14}{'cached':>14}{'fast':>14}{'speedup':>10}"
+        )
+
+        for name, schema, document in cases:
+            per_request = self._measure(
+                lambda s=schema, d=document: Validator(s).validate(d),  # type: ignore
+                iterations,
+            )
+            cached = self._measure(
+                lambda s=schema, d=document: service.validate(s, d),
+                iterations,
+            )
+            fast = self._measure(
+                lambda s=schema, d=document: service.validate_fast(s, d),
+                iterations,
+            )
+
+            self.stdout.write(
+                f"{name:<18}"
+                f"{per_request:>11.1f} us"
+                f"{cached:>11.1f} us"
+                f"{fast:>11.1f} us"
+                f"{per_request / fast:>9.1f}x"
+            )
+
+    # Helpers
+    def _measure(self, call: Callable[[], Any], iterations: int) -> float:
+        call()
+        started_at = time.perf_counter()
+
+        for _ in range(iterations):
+            call()
+
+        return (time.perf_counter() - started_at) / iterations * 1e6
@@ -0,0 +1,69 @@
+import logging
+from typing import Any, List
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.core.repositories.aggregate import AggregateRepository
+from apps.core.repositories.backtest import BacktestRepository
+from apps.core.repositories.base import BaseRepository
+from apps.core.repositories.order import OrderRepository
+from apps.core.repositories.report import ReportRepository
+from apps.core.repositories.slow_query import SlowQueryRepository
+from apps.core.repositories.snapshot import SnapshotRepository
+
+
+class Command(BaseCommand):
+    help = "Create the MongoDB indexes declared by each repository and report drift"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report missing, drifted and extra indexes",
+        )
+        parser.add_argument(
+            "--rebuild-drifted",
+            action="store_true",
+            help="Drop and recreate indexes whose definition changed",
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        log = logging.getLogger(__name__)
+        repositories: List[BaseRepository] = [
+            AggregateRepository(),
+            BacktestRepository(),
+            OrderRepository(),
+            ReportRepository(),
+            SlowQueryRepository(),
+            SnapshotRepository(),
+        ]
+
+        for repository in repositories:
+            collection_name = repository.collection_name
+
+            try:
+                summary = repository.ensure_indexes(
+                    dry_run=options["dry_run"],
+                    rebuild_drifted=options["rebuild_drifted"],
+                )
+            except Exception as e:
+                log.error(f"Error ensuring indexes on {collection_name}: {e!r}")
+                raise
+
+            for name in summary["created"]:
+                action = "Missing" if options["dry_run"] else "Created"
+                log.info(f"{action} index {collection_name}.{name}")
+
+            for name in summary["drifted"]:
+                log.warning(f"Drifted index {collection_name}.{name}")
+
+            for name in summary["extra"]:
+                log.warning(f"Undeclared index {collection_name}.{name}")
+
+            log.info(
+                f"Indexes on {collection_name}: "
+                f"{len(summary['unchanged'])} unchanged, "
+                f"{len(summary['created'])} missing, "
+                f"{len(summary['drifted'])} drifted, "
+                f"{len(summary['extra'])} undeclared"
+            )
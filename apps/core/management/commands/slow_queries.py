@@ -0,0 +1,59 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.core.models.slow_query import SlowQueryModel
+
+
+class Command(BaseCommand):
+    help = "Summarize the worst sampled slow query shapes and the indexes that would serve them"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--hours",
+            type=int,
+            default=24,
+            help="Only include slow queries captured in this many hours",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Number of query shapes to report",
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        since = datetime.now(tz=UTC) - timedelta(hours=options["hours"])
+        shapes = SlowQueryModel().summarize(since=since, limit=options["limit"])
+
+        if not shapes:
+            self.stdout.write(f"No slow queries captured in the last {options['hours']} hours")
+            return
+
+        for position, shape in enumerate(shapes, start=1):
+            self._write_shape(position, shape)
+
+    # Helpers
+    def _write_shape(self, position: int, shape: Dict[str, Any]) -> None:
+        collscan = " COLLSCAN" if shape["collscan"] else ""
+        suggested_index = ", ".join(f"{field}: {direction}" for field, direction in shape["suggested_index"])
+
+        self.stdout.write(
+            f"#{position} {shape['collection']}.{shape['operation']}"
+            f" samples={shape['count']}"
+            f" total={shape['total_ms']:.1f} ms"
+            f" max={shape['max_ms']:.1f} ms"
+            f" max_skip={shape['max_skip']}"
+            f"{collscan}"
+        )
+        self.stdout.write(f"    filter: {shape['shape']} sort: {shape['sort']}")
+
+        if shape["docs_returned"] is not None:
+            self.stdout.write(
+                f"    examined: {shape['keys_examined']:.0f} keys, {shape['docs_examined']:.0f} docs"
+                f" for {shape['docs_returned']:.0f} returned"
+            )
+
+        self.stdout.write(f"    suggested index: {{{suggested_index}}}")
+        self.stdout.write(f"    last route: {shape['route']}")
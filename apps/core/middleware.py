@@ -0,0 +1,86 @@
+import time
+from contextvars import Token
+from typing import Any, Callable, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+from django.middleware.gzip import GZipMiddleware
+
+from apps.core.services.instrumentation import InstrumentationService
+
+
+class CompressionMiddleware(GZipMiddleware):
+    def process_response(self, request: HttpRequest, response: HttpResponseBase) -> HttpResponseBase:
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        return super().process_response(request, response)
+
+
+class InstrumentationMiddleware:
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    UNMATCHED_ROUTE: str = "unmatched"
+
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    sync_capable: bool = True
+    async_capable: bool = True
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        self.get_response = get_response
+        self._instrumentation_service = InstrumentationService()
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def __call__(self, request: HttpRequest) -> Any:
+        if iscoroutinefunction(self):
+            return self._acall(request)
+
+        token = self._instrumentation_service.start_request(request)
+        started_at = time.perf_counter()
+        response = self.get_response(request)
+        self._finish(token, request, response, time.perf_counter() - started_at)
+
+        return response
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    async def _acall(self, request: HttpRequest) -> HttpResponseBase:
+        token = self._instrumentation_service.start_request(request)
+        started_at = time.perf_counter()
+        response = await self.get_response(request)
+        self._finish(token, request, response, time.perf_counter() - started_at)
+
+        return response
+
+    def _finish(self, token: Token, request: HttpRequest, response: HttpResponseBase, duration: float) -> None:
+        self._instrumentation_service.finish_request(
+            token=token,
+            method=request.method or "",
+            route=self._get_route(request),
+            status=response.status_code,
+            duration=duration,
+            size=self._get_size(response),
+        )
+
+    # Helpers
+    def _get_route(self, request: HttpRequest) -> str:
+        resolver_match = getattr(request, "resolver_match", None)
+
+        return resolver_match.route if resolver_match else self.UNMATCHED_ROUTE
+
+    def _get_size(self, response: HttpResponseBase) -> Optional[int]:
+        return None if response.streaming else len(response.content)
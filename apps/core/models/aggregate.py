@@ -0,0 +1,33 @@
+from typing import Any, Dict
+
+from apps.core.models.base import BaseModel
+from apps.core.repositories.aggregate import AggregateRepository
+
+
+class AggregateModel(BaseModel):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _repository: AggregateRepository
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self) -> None:
+        super().__init__()
+        self._repository = AggregateRepository()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def upsert(self, query_filters: Dict[str, Any], operations: Dict[str, Any]) -> bool:
+        return self._repository.upsert(
+            query_filters=query_filters,
+            operations=operations,
+        )
+
+    async def aupsert(self, query_filters: Dict[str, Any], operations: Dict[str, Any]) -> bool:
+        return await self._repository.aupsert(
+            query_filters=query_filters,
+            operations=operations,
+        )
@@ -3,6 +3,7 @@ from typing import Any, Dict
 
 from apps.core.enums.report_status import ReportStatus
 from apps.core.models.base import BaseModel
+from apps.core.repositories.aggregate import AggregateRepository
 from apps.core.repositories.backtest import BacktestRepository
 from apps.core.repositories.order import OrderRepository
 from apps.core.repositories.report import ReportRepository
@@ -20,6 +21,7 @@ class BacktestModel(BaseModel):
         self._report_repository = ReportRepository()
         self._snapshot_repository = SnapshotRepository()
         self._order_repository = OrderRepository()
+        self._aggregate_repository = AggregateRepository()
 
     def store(self, data: Dict[str, Any]) -> str:
         inserted_id = super().store(
@@ -63,4 +65,60 @@ class BacktestModel(BaseModel):
                 }
             )
 
+            self._aggregate_repository.delete_many(
+                query_filters={
+                    "backtest_id": backtest_id,
+                }
+            )
+
+        return True
+
+    async def astore(self, data: Dict[str, Any]) -> str:
+        inserted_id = await super().astore(
+            data=data,
+        )
+
+        if inserted_id:
+            await self._report_repository.astore(
+                data={
+                    "backtest_id": inserted_id,
+                    "status": ReportStatus.PENDING.value,
+                    "folder": None,
+                }
+            )
+
+        return inserted_id
+
+    async def adelete(self, query_filters: Dict[str, Any]) -> bool:
+        backtest_id_raw = query_filters.get("_id")
+        backtest_id = str(backtest_id_raw) if backtest_id_raw else None
+        response = await super().adelete(
+            query_filters=query_filters,
+        )
+
+        if response and backtest_id:
+            await self._report_repository.adelete_many(
+                query_filters={
+                    "backtest_id": backtest_id,
+                }
+            )
+
+            await self._snapshot_repository.adelete_many(
+                query_filters={
+                    "backtest_id": backtest_id,
+                }
+            )
+
+            await self._order_repository.adelete_many(
+                query_filters={
+                    "backtest_id": backtest_id,
+                }
+            )
+
+            await self._aggregate_repository.adelete_many(
+                query_filters={
+                    "backtest_id": backtest_id,
+                }
+            )
+
         return True
@@ -1,5 +1,9 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
+from bson.raw_bson import RawBSONDocument
+from pymongo.errors import BulkWriteError
+
+from apps.core.enums.field_type import FieldType
 from apps.core.repositories.base import BaseRepository
 
 
@@ -14,12 +18,14 @@ class BaseModel:
     # ───────────────────────────────────────────────────────────
     def find(
         self,
+        *,
         limit: int = 10,
         offset: int = 0,
         sort_by: Optional[str] = None,
         sort_direction: str = "desc",
         query_filters: Optional[Dict[str, Any]] = None,
         projection_fields: Optional[Dict[str, Any]] = None,
+        after: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         return self._repository.find(
             limit=limit,
@@ -28,6 +34,60 @@ class BaseModel:
             sort_direction=sort_direction,
             query_filters=query_filters,
             projection_fields=projection_fields,
+            after=after,
+        )
+
+    def find_raw(
+        self,
+        *,
+        limit: int = 10,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+        after: Optional[Dict[str, Any]] = None,
+    ) -> List[RawBSONDocument]:
+        return self._repository.find_raw(
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+            after=after,
+        )
+
+    def stream(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "asc",
+        projection_fields: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        return self._repository.stream(
+            query_filters=query_filters,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            projection_fields=projection_fields,
+            batch_size=batch_size,
+        )
+
+    def stream_raw(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "asc",
+        projection_fields: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[RawBSONDocument]:
+        return self._repository.stream_raw(
+            query_filters=query_filters,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            projection_fields=projection_fields,
+            batch_size=batch_size,
         )
 
     def count(
@@ -38,6 +98,14 @@ class BaseModel:
             query_filters=query_filters,
         )
 
+    def estimated_count(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        return self._repository.estimated_count(
+            query_filters=query_filters,
+        )
+
     def store(
         self,
         data: Dict[str, Any],
@@ -49,9 +117,11 @@ class BaseModel:
     def store_many(
         self,
         data: List[Dict[str, Any]],
+        ordered: bool = True,
     ) -> List[str]:
         return self._repository.store_many(
             data=data,
+            ordered=ordered,
         )
 
     def update(
@@ -71,3 +141,156 @@ class BaseModel:
         return self._repository.delete(
             query_filters=query_filters,
         )
+
+    async def afind(
+        self,
+        *,
+        limit: int = 10,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+        after: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        return await self._repository.afind(
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+            after=after,
+        )
+
+    async def afind_raw(
+        self,
+        *,
+        limit: int = 10,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+        after: Optional[Dict[str, Any]] = None,
+    ) -> List[RawBSONDocument]:
+        return await self._repository.afind_raw(
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+            after=after,
+        )
+
+    def astream(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "asc",
+        projection_fields: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return self._repository.astream(
+            query_filters=query_filters,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            projection_fields=projection_fields,
+            batch_size=batch_size,
+        )
+
+    def astream_raw(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "asc",
+        projection_fields: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[RawBSONDocument]:
+        return self._repository.astream_raw(
+            query_filters=query_filters,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            projection_fields=projection_fields,
+            batch_size=batch_size,
+        )
+
+    async def acount(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        return await self._repository.acount(
+            query_filters=query_filters,
+        )
+
+    async def aestimated_count(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        return await self._repository.aestimated_count(
+            query_filters=query_filters,
+        )
+
+    async def astore(
+        self,
+        data: Dict[str, Any],
+    ) -> str:
+        return await self._repository.astore(
+            data=data,
+        )
+
+    async def astore_many(
+        self,
+        data: List[Dict[str, Any]],
+        ordered: bool = True,
+    ) -> List[str]:
+        return await self._repository.astore_many(
+            data=data,
+            ordered=ordered,
+        )
+
+    async def aupdate(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+    ) -> int:
+        return await self._repository.aupdate(
+            query_filters=query_filters,
+            data=data,
+        )
+
+    async def adelete(
+        self,
+        query_filters: Dict[str, Any],
+    ) -> int:
+        return await self._repository.adelete(
+            query_filters=query_filters,
+        )
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _get_written(
+        self,
+        data: List[Dict[str, Any]],
+        error: BulkWriteError,
+        ordered: bool,
+    ) -> List[Dict[str, Any]]:
+        failed = {write_error["index"] for write_error in error.details.get("writeErrors", [])}
+
+        if ordered:
+            return data[: min(failed, default=len(data))]
+
+        return [item for index, item in enumerate(data) if index not in failed]
+
+    # ───────────────────────────────────────────────────────────
+    # GETTERS
+    # ───────────────────────────────────────────────────────────
+    @property
+    def field_types(self) -> Dict[str, FieldType]:
+        return self._repository.FIELD_TYPES
+
+    @property
+    def default_projection(self) -> Optional[Dict[str, int]]:
+        return self._repository.DEFAULT_PROJECTION
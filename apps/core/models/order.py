@@ -1,11 +1,140 @@
+from typing import Any, ClassVar, Dict, FrozenSet, List
+
+from pymongo.errors import BulkWriteError
+
 from apps.core.models.base import BaseModel
 from apps.core.repositories.order import OrderRepository
+from apps.core.services.aggregate import AggregateService
 
 
 class OrderModel(BaseModel):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    AGGREGATED_FIELDS: ClassVar[FrozenSet[str]] = frozenset(
+        {"backtest", "backtest_id", "profit", "symbol", "strategy_id"},
+    )
+
     # ───────────────────────────────────────────────────────────
     # CONSTRUCTOR
     # ───────────────────────────────────────────────────────────
     def __init__(self) -> None:
         super().__init__()
         self._repository = OrderRepository()
+        self._aggregate_service = AggregateService()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def store(self, data: Dict[str, Any]) -> str:
+        inserted_id = super().store(
+            data=data,
+        )
+
+        if inserted_id:
+            self._aggregate_service.apply_orders([data])
+
+        return inserted_id
+
+    def store_many(self, data: List[Dict[str, Any]], ordered: bool = True) -> List[str]:
+        try:
+            inserted_ids = super().store_many(
+                data=data,
+                ordered=ordered,
+            )
+        except BulkWriteError as error:
+            self._aggregate_service.apply_orders(self._get_written(data, error, ordered))
+            raise
+
+        self._aggregate_service.apply_orders(data)
+
+        return inserted_ids
+
+    def update(self, query_filters: Dict[str, Any], data: Dict[str, Any]) -> int:
+        previous = self._find_aggregated(query_filters) if self.AGGREGATED_FIELDS.intersection(data) else []
+        response = super().update(
+            query_filters=query_filters,
+            data=data,
+        )
+
+        if response and previous:
+            self._aggregate_service.apply_orders(previous, sign=-1)
+            self._aggregate_service.apply_orders(self._find_aggregated({"_id": previous[0]["_id"]}))
+
+        return response
+
+    def delete(self, query_filters: Dict[str, Any]) -> int:
+        previous = self._find_aggregated(query_filters)
+        response = super().delete(
+            query_filters=query_filters,
+        )
+
+        if response:
+            self._aggregate_service.apply_orders(previous, sign=-1)
+
+        return response
+
+    async def astore(self, data: Dict[str, Any]) -> str:
+        inserted_id = await super().astore(
+            data=data,
+        )
+
+        if inserted_id:
+            await self._aggregate_service.aapply_orders([data])
+
+        return inserted_id
+
+    async def astore_many(self, data: List[Dict[str, Any]], ordered: bool = True) -> List[str]:
+        try:
+            inserted_ids = await super().astore_many(
+                data=data,
+                ordered=ordered,
+            )
+        except BulkWriteError as error:
+            await self._aggregate_service.aapply_orders(self._get_written(data, error, ordered))
+            raise
+
+        await self._aggregate_service.aapply_orders(data)
+
+        return inserted_ids
+
+    async def aupdate(self, query_filters: Dict[str, Any], data: Dict[str, Any]) -> int:
+        previous = await self._afind_aggregated(query_filters) if self.AGGREGATED_FIELDS.intersection(data) else []
+        response = await super().aupdate(
+            query_filters=query_filters,
+            data=data,
+        )
+
+        if response and previous:
+            await self._aggregate_service.aapply_orders(previous, sign=-1)
+            await self._aggregate_service.aapply_orders(await self._afind_aggregated({"_id": previous[0]["_id"]}))
+
+        return response
+
+    async def adelete(self, query_filters: Dict[str, Any]) -> int:
+        previous = await self._afind_aggregated(query_filters)
+        response = await super().adelete(
+            query_filters=query_filters,
+        )
+
+        if response:
+            await self._aggregate_service.aapply_orders(previous, sign=-1)
+
+        return response
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _find_aggregated(self, query_filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return self.find(
+            limit=1,
+            query_filters=query_filters,
+            projection_fields=dict.fromkeys(self.AGGREGATED_FIELDS, 1),
+        )
+
+    async def _afind_aggregated(self, query_filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return await self.afind(
+            limit=1,
+            query_filters=query_filters,
+            projection_fields=dict.fromkeys(self.AGGREGATED_FIELDS, 1),
+        )
@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Any, Dict, List
+
+from apps.core.models.base import BaseModel
+from apps.core.repositories.slow_query import SlowQueryRepository
+
+
+class SlowQueryModel(BaseModel):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _repository: SlowQueryRepository
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self) -> None:
+        super().__init__()
+        self._repository = SlowQueryRepository()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def explain(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        return self._repository.explain(query)
+
+    def summarize(self, since: datetime, limit: int) -> List[Dict[str, Any]]:
+        return self._repository.summarize(since=since, limit=limit)
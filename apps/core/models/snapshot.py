@@ -1,13 +1,154 @@
-from typing import Any, Dict
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional
+
+from pymongo.errors import BulkWriteError
 
 from apps.core.models.base import BaseModel
 from apps.core.repositories.snapshot import SnapshotRepository
+from apps.core.services.aggregate import AggregateService
 
 
 class SnapshotModel(BaseModel):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    AGGREGATED_FIELDS: ClassVar[FrozenSet[str]] = frozenset({"backtest_id", "nav", "created_at"})
+
     # ───────────────────────────────────────────────────────────
     # CONSTRUCTOR
     # ───────────────────────────────────────────────────────────
     def __init__(self) -> None:
         super().__init__()
         self._repository = SnapshotRepository()
+        self._aggregate_service = AggregateService()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def store(self, data: Dict[str, Any]) -> str:
+        inserted_id = super().store(
+            data=data,
+        )
+
+        if inserted_id:
+            self._aggregate_service.apply_snapshots([data])
+
+        return inserted_id
+
+    def store_many(self, data: List[Dict[str, Any]], ordered: bool = True) -> List[str]:
+        try:
+            inserted_ids = super().store_many(
+                data=data,
+                ordered=ordered,
+            )
+        except BulkWriteError as error:
+            self._aggregate_service.apply_snapshots(self._get_written(data, error, ordered))
+            raise
+
+        self._aggregate_service.apply_snapshots(data)
+
+        return inserted_ids
+
+    def update(self, query_filters: Dict[str, Any], data: Dict[str, Any]) -> int:
+        snapshots = self._find_aggregated(query_filters, data)
+        response = super().update(
+            query_filters=query_filters,
+            data=data,
+        )
+
+        if response:
+            for snapshot in snapshots:
+                self._aggregate_service.invalidate(snapshot["backtest_id"])
+
+        return response
+
+    def delete(self, query_filters: Dict[str, Any]) -> int:
+        snapshots = self._find_aggregated(query_filters)
+        response = super().delete(
+            query_filters=query_filters,
+        )
+
+        if response:
+            for snapshot in snapshots:
+                self._aggregate_service.invalidate(snapshot["backtest_id"])
+
+        return response
+
+    async def astore(self, data: Dict[str, Any]) -> str:
+        inserted_id = await super().astore(
+            data=data,
+        )
+
+        if inserted_id:
+            await self._aggregate_service.aapply_snapshots([data])
+
+        return inserted_id
+
+    async def astore_many(self, data: List[Dict[str, Any]], ordered: bool = True) -> List[str]:
+        try:
+            inserted_ids = await super().astore_many(
+                data=data,
+                ordered=ordered,
+            )
+        except BulkWriteError as error:
+            await self._aggregate_service.aapply_snapshots(self._get_written(data, error, ordered))
+            raise
+
+        await self._aggregate_service.aapply_snapshots(data)
+
+        return inserted_ids
+
+    async def aupdate(self, query_filters: Dict[str, Any], data: Dict[str, Any]) -> int:
+        snapshots = await self._afind_aggregated(query_filters, data)
+        response = await super().aupdate(
+            query_filters=query_filters,
+            data=data,
+        )
+
+        if response:
+            for snapshot in snapshots:
+                await self._aggregate_service.ainvalidate(snapshot["backtest_id"])
+
+        return response
+
+    async def adelete(self, query_filters: Dict[str, Any]) -> int:
+        snapshots = await self._afind_aggregated(query_filters)
+        response = await super().adelete(
+            query_filters=query_filters,
+        )
+
+        if response:
+            for snapshot in snapshots:
+                await self._aggregate_service.ainvalidate(snapshot["backtest_id"])
+
+        return response
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _find_aggregated(
+        self,
+        query_filters: Dict[str, Any],
+        data: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        if data is not None and not self.AGGREGATED_FIELDS.intersection(data):
+            return []
+
+        return [
+            snapshot
+            for snapshot in self.find(limit=1, query_filters=query_filters, projection_fields={"backtest_id": 1})
+            if snapshot.get("backtest_id")
+        ]
+
+    async def _afind_aggregated(
+        self,
+        query_filters: Dict[str, Any],
+        data: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        if data is not None and not self.AGGREGATED_FIELDS.intersection(data):
+            return []
+
+        return [
+            snapshot
+            for snapshot in await self.afind(limit=1, query_filters=query_filters, projection_fields={"backtest_id": 1})
+            if snapshot.get("backtest_id")
+        ]
@@ -0,0 +1,31 @@
+import json
+from typing import Any, Iterator, Mapping, Optional
+
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    media_type = "application/x-ndjson"
+
+    def parse(
+        self,
+        stream: Any,
+        _media_type: Optional[str] = None,
+        parser_context: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[Any]:
+        context = parser_context or {}
+        encoding = context.get("encoding", "utf-8")
+
+        return self._parse_lines(stream, encoding)
+
+    def _parse_lines(self, stream: Any, encoding: str) -> Iterator[Any]:
+        for raw_line in stream:
+            line = raw_line.decode(encoding).strip()
+
+            if not line:
+                continue
+
+            try:
+                yield json.loads(line)
+            except ValueError:
+                yield None
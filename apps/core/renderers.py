@@ -0,0 +1,47 @@
+import time
+from datetime import datetime
+from typing import Any, Mapping, Optional
+
+import orjson
+from bson import Decimal128, ObjectId, decode
+from bson.raw_bson import RawBSONDocument
+from rest_framework.renderers import BaseRenderer
+
+from apps.core.services.instrumentation import InstrumentationService
+
+
+class ORJSONRenderer(BaseRenderer):
+    media_type = "application/json"
+    format = "json"
+    charset = None
+    options = orjson.OPT_SERIALIZE_NUMPY
+
+    def render(
+        self,
+        data: Any,
+        _accepted_media_type: Optional[str] = None,
+        _renderer_context: Optional[Mapping[str, Any]] = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+
+        started_at = time.perf_counter()
+        content = orjson.dumps(data, default=self._default, option=self.options)
+        InstrumentationService().observe_serialization(time.perf_counter() - started_at)
+
+        return content
+
+    def _default(self, value: Any) -> Any:
+        if isinstance(value, RawBSONDocument):
+            return decode(value.raw)
+
+        if isinstance(value, ObjectId):
+            return str(value)
+
+        if isinstance(value, Decimal128):
+            return str(value.to_decimal())
+
+        if isinstance(value, datetime):
+            return value.isoformat()
+
+        raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
@@ -0,0 +1,52 @@
+from typing import Any, ClassVar, Dict, List
+
+from pymongo import ASCENDING, IndexModel
+
+from apps.core.enums.field_type import FieldType
+from apps.core.repositories.base import BaseRepository
+
+
+class AggregateRepository(BaseRepository):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    FIELD_TYPES: ClassVar[Dict[str, FieldType]] = {
+        **BaseRepository.FIELD_TYPES,
+        "backtest_id": FieldType.STRING,
+        "version": FieldType.INTEGER,
+        "exact": FieldType.BOOLEAN,
+    }
+    INDEXES: ClassVar[List[IndexModel]] = [
+        IndexModel(
+            [("backtest_id", ASCENDING)],
+            name="aggregates_backtest_id",
+            unique=True,
+        ),
+    ]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self) -> None:
+        super().__init__(collection_name="aggregates")
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def upsert(
+        self,
+        query_filters: Dict[str, Any],
+        operations: Dict[str, Any],
+    ) -> bool:
+        collection = self._db_service.get_collection(self._collection_name)
+        result = collection.update_one(query_filters, operations, upsert=True)
+        return bool(result.modified_count or result.upserted_id is not None)
+
+    async def aupsert(
+        self,
+        query_filters: Dict[str, Any],
+        operations: Dict[str, Any],
+    ) -> bool:
+        collection = self._async_db_service.get_collection(self._collection_name)
+        result = await collection.update_one(query_filters, operations, upsert=True)
+        return bool(result.modified_count or result.upserted_id is not None)
@@ -1,6 +1,39 @@
+from typing import ClassVar, Dict, List
+
+from pymongo import ASCENDING, IndexModel
+
+from apps.core.enums.field_type import FieldType
 from apps.core.repositories.base import BaseRepository
 
 
 class BacktestRepository(BaseRepository):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    FIELD_TYPES: ClassVar[Dict[str, FieldType]] = {
+        **BaseRepository.FIELD_TYPES,
+        "asset": FieldType.STRING,
+        "strategies": FieldType.STRING,
+        "status": FieldType.STRING,
+        "from_date": FieldType.DATETIME,
+        "to_date": FieldType.DATETIME,
+        "start_at": FieldType.DATETIME,
+        "end_at": FieldType.DATETIME,
+    }
+    QUERY_CACHE: ClassVar[bool] = True
+    INDEXES: ClassVar[List[IndexModel]] = [
+        IndexModel(
+            [("status", ASCENDING), ("created_at", ASCENDING), ("_id", ASCENDING)],
+            name="backtests_status_created_at",
+        ),
+        IndexModel(
+            [("created_at", ASCENDING), ("_id", ASCENDING)],
+            name="backtests_created_at",
+        ),
+    ]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
     def __init__(self) -> None:
         super().__init__(collection_name="backtests")
@@ -1,16 +1,48 @@
+import hashlib
+import time
 from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, ClassVar, Dict, Iterator, List, Optional, Tuple, TypeVar
 
+from asgiref.sync import sync_to_async
+from bson import CodecOptions, ObjectId, json_util
+from bson.raw_bson import RawBSONDocument
+from django.conf import settings
+from django.core.cache import caches
+from pymongo import IndexModel
+
+from apps.core.enums.field_type import FieldType
 from apps.core.interfaces.repository import RepositoryInterface
+from apps.core.services.async_mongodb import AsyncMongoDBService
+from apps.core.services.cache import CacheService
 from apps.core.services.mongodb import MongoDBService
+from apps.core.services.slow_query import SlowQueryService
+
+T = TypeVar("T")
 
 
 class BaseRepository(RepositoryInterface):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    FIELD_TYPES: ClassVar[Dict[str, FieldType]] = {
+        "_id": FieldType.OBJECT_ID,
+        "created_at": FieldType.DATETIME,
+        "updated_at": FieldType.DATETIME,
+    }
+    INDEXES: ClassVar[List[IndexModel]] = []
+    DEFAULT_PROJECTION: ClassVar[Optional[Dict[str, int]]] = None
+    QUERY_CACHE: ClassVar[bool] = False
+    SLOW_QUERY_LOG: ClassVar[bool] = True
+    RAW_CODEC_OPTIONS: ClassVar[CodecOptions[RawBSONDocument]] = CodecOptions(document_class=RawBSONDocument)
+
     # ───────────────────────────────────────────────────────────
     # PROPERTIES
     # ───────────────────────────────────────────────────────────
     _collection_name: str
     _db_service: MongoDBService
+    _async_db_service: AsyncMongoDBService
+    _cache_service: CacheService
+    _slow_query_service: SlowQueryService
 
     # ───────────────────────────────────────────────────────────
     # CONSTRUCTOR
@@ -18,35 +50,132 @@ class BaseRepository(RepositoryInterface):
     def __init__(self, collection_name: str) -> None:
         self._collection_name = collection_name
         self._db_service = MongoDBService()
+        self._async_db_service = AsyncMongoDBService()
+        self._cache_service = CacheService()
+        self._slow_query_service = SlowQueryService()
 
     # ───────────────────────────────────────────────────────────
     # PUBLIC METHODS
     # ───────────────────────────────────────────────────────────
     def find(
         self,
+        *,
         limit: int = 10,
         offset: int = 0,
         sort_by: Optional[str] = None,
         sort_direction: str = "desc",
         query_filters: Optional[Dict[str, Any]] = None,
         projection_fields: Optional[Dict[str, Any]] = None,
+        after: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         collection = self._db_service.get_collection(self._collection_name)
-        filters = query_filters or {}
-        projection = projection_fields or {}
-        cursor = collection.find(filters, projection)
+        cursor = self._build_cursor(
+            collection=collection,
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+            after=after,
+        )
 
-        if sort_by and sort_direction:
-            direction = -1 if sort_direction == "desc" else 1
-            cursor = cursor.sort(sort_by, direction)
+        return self._get_cached(
+            parameters=self._get_query_parameters(
+                method="find",
+                limit=limit,
+                offset=offset,
+                sort_by=sort_by,
+                sort_direction=sort_direction,
+                query_filters=query_filters,
+                projection_fields=projection_fields,
+                after=after,
+            ),
+            loader=lambda: list(cursor),
+        )
 
-        if offset:
-            cursor = cursor.skip(offset)
+    def find_raw(
+        self,
+        *,
+        limit: int = 10,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+        after: Optional[Dict[str, Any]] = None,
+    ) -> List[RawBSONDocument]:
+        collection = self._db_service.get_collection(self._collection_name)
+        cursor = self._build_cursor(
+            collection=collection.with_options(codec_options=self.RAW_CODEC_OPTIONS),
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+            after=after,
+        )
 
-        if limit != 9**100:
-            cursor = cursor.limit(limit)
+        raw_documents = self._get_cached(
+            parameters=self._get_query_parameters(
+                method="find_raw",
+                limit=limit,
+                offset=offset,
+                sort_by=sort_by,
+                sort_direction=sort_direction,
+                query_filters=query_filters,
+                projection_fields=projection_fields,
+                after=after,
+            ),
+            loader=lambda: [document.raw for document in cursor],
+        )
+
+        return [RawBSONDocument(raw_document) for raw_document in raw_documents]
+
+    def stream(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "asc",
+        projection_fields: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        collection = self._db_service.get_collection(self._collection_name)
+        cursor = self._build_cursor(
+            collection=collection,
+            limit=9**100,
+            offset=0,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+            after=None,
+        )
+
+        yield from cursor.batch_size(batch_size)
 
-        return list(cursor)
+    def stream_raw(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "asc",
+        projection_fields: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[RawBSONDocument]:
+        collection = self._db_service.get_collection(self._collection_name)
+        cursor = self._build_cursor(
+            collection=collection.with_options(codec_options=self.RAW_CODEC_OPTIONS),
+            limit=9**100,
+            offset=0,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+            after=None,
+        )
+
+        yield from cursor.batch_size(batch_size)
 
     def count(
         self,
@@ -54,53 +183,58 @@ class BaseRepository(RepositoryInterface):
     ) -> int:
         collection = self._db_service.get_collection(self._collection_name)
         filters = query_filters or {}
-        return collection.count_documents(filters)
+
+        return self._get_cached(
+            parameters={"method": "count", "query_filters": filters},
+            loader=lambda: collection.count_documents(filters),
+        )
+
+    def estimated_count(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        collection = self._db_service.get_collection(self._collection_name)
+
+        if not query_filters:
+            return collection.estimated_document_count()
+
+        cache_key = self._build_count_cache_key(query_filters)
+        total = caches["local"].get(cache_key)
+
+        if total is None:
+            total = self._profile(
+                parameters={"method": "count", "query_filters": query_filters},
+                loader=lambda: collection.count_documents(query_filters),
+            )
+            caches["local"].set(cache_key, total, timeout=settings.LIST_COUNT_CACHE_TTL)
+
+        return total
 
     def store(
         self,
         data: Dict[str, Any],
     ) -> str:
-        if "created_at" in data and not isinstance(data["created_at"], datetime):
-            created_at = data["created_at"]
-            created_at = float(created_at if created_at is not None else 0)
-            data["created_at"] = datetime.fromtimestamp(created_at, tz=UTC)
-        elif "created_at" not in data:
-            data["created_at"] = datetime.now(tz=UTC)
-
-        if "updated_at" in data and not isinstance(data["updated_at"], datetime):
-            updated_at = data["updated_at"]
-            updated_at = float(updated_at if updated_at is not None else 0)
-            data["updated_at"] = datetime.fromtimestamp(updated_at, tz=UTC)
-        elif "updated_at" not in data:
-            data["updated_at"] = datetime.now(tz=UTC)
+        self._normalize_timestamps(data, ("created_at", "updated_at"))
 
         collection = self._db_service.get_collection(self._collection_name)
         result = collection.insert_one(data)
+        self._invalidate_cache()
         return str(result.inserted_id)
 
     def store_many(
         self,
         data: List[Dict[str, Any]],
+        ordered: bool = True,
     ) -> List[str]:
-        now = datetime.now(tz=UTC)
-
-        for item in data:
-            if "created_at" in item and not isinstance(item["created_at"], datetime):
-                created_at = item["created_at"]
-                created_at = float(created_at if created_at is not None else 0)
-                item["created_at"] = datetime.fromtimestamp(created_at, tz=UTC)
-            elif "created_at" not in item:
-                item["created_at"] = now
-
-            if "updated_at" in item and not isinstance(item["updated_at"], datetime):
-                updated_at = item["updated_at"]
-                updated_at = float(updated_at if updated_at is not None else 0)
-                item["updated_at"] = datetime.fromtimestamp(updated_at, tz=UTC)
-            elif "updated_at" not in item:
-                item["updated_at"] = now
+        self._prepare_many(data)
 
         collection = self._db_service.get_collection(self._collection_name)
-        result = collection.insert_many(data)
+
+        try:
+            result = collection.insert_many(data, ordered=ordered)
+        finally:
+            self._invalidate_cache()
+
         return [str(inserted_id) for inserted_id in result.inserted_ids]
 
     def update(
@@ -108,15 +242,11 @@ class BaseRepository(RepositoryInterface):
         query_filters: Dict[str, Any],
         data: Dict[str, Any],
     ) -> int:
-        if "updated_at" in data and not isinstance(data["updated_at"], datetime):
-            updated_at = data["updated_at"]
-            updated_at = float(updated_at if updated_at is not None else 0)
-            data["updated_at"] = datetime.fromtimestamp(updated_at, tz=UTC)
-        elif "updated_at" not in data:
-            data["updated_at"] = datetime.now(tz=UTC)
+        self._normalize_timestamps(data, ("updated_at",))
 
         collection = self._db_service.get_collection(self._collection_name)
         result = collection.update_one(query_filters, {"$set": data})
+        self._invalidate_cache()
         return result.modified_count
 
     def delete(
@@ -125,6 +255,7 @@ class BaseRepository(RepositoryInterface):
     ) -> int:
         collection = self._db_service.get_collection(self._collection_name)
         result = collection.delete_one(query_filters)
+        self._invalidate_cache()
         return result.deleted_count
 
     def delete_many(
@@ -133,4 +264,502 @@ class BaseRepository(RepositoryInterface):
     ) -> int:
         collection = self._db_service.get_collection(self._collection_name)
         result = collection.delete_many(query_filters)
+        self._invalidate_cache()
+        return result.deleted_count
+
+    async def afind(
+        self,
+        *,
+        limit: int = 10,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+        after: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        collection = self._async_db_service.get_collection(self._collection_name)
+        cursor = self._build_cursor(
+            collection=collection,
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+            after=after,
+        )
+
+        return await self._aget_cached(
+            parameters=self._get_query_parameters(
+                method="find",
+                limit=limit,
+                offset=offset,
+                sort_by=sort_by,
+                sort_direction=sort_direction,
+                query_filters=query_filters,
+                projection_fields=projection_fields,
+                after=after,
+            ),
+            loader=lambda: cursor.to_list(None),
+        )
+
+    async def afind_raw(
+        self,
+        *,
+        limit: int = 10,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+        after: Optional[Dict[str, Any]] = None,
+    ) -> List[RawBSONDocument]:
+        collection = self._async_db_service.get_collection(self._collection_name)
+        cursor = self._build_cursor(
+            collection=collection.with_options(codec_options=self.RAW_CODEC_OPTIONS),
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+            after=after,
+        )
+
+        raw_documents = await self._aget_cached(
+            parameters=self._get_query_parameters(
+                method="find_raw",
+                limit=limit,
+                offset=offset,
+                sort_by=sort_by,
+                sort_direction=sort_direction,
+                query_filters=query_filters,
+                projection_fields=projection_fields,
+                after=after,
+            ),
+            loader=lambda: self._ato_raw_documents(cursor),
+        )
+
+        return [RawBSONDocument(raw_document) for raw_document in raw_documents]
+
+    async def astream(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "asc",
+        projection_fields: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        collection = self._async_db_service.get_collection(self._collection_name)
+        cursor = self._build_cursor(
+            collection=collection,
+            limit=9**100,
+            offset=0,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+            after=None,
+        )
+
+        async for document in cursor.batch_size(batch_size):
+            yield document
+
+    async def astream_raw(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "asc",
+        projection_fields: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[RawBSONDocument]:
+        collection = self._async_db_service.get_collection(self._collection_name)
+        cursor = self._build_cursor(
+            collection=collection.with_options(codec_options=self.RAW_CODEC_OPTIONS),
+            limit=9**100,
+            offset=0,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+            after=None,
+        )
+
+        async for document in cursor.batch_size(batch_size):
+            yield document
+
+    async def acount(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        collection = self._async_db_service.get_collection(self._collection_name)
+        filters = query_filters or {}
+
+        return await self._aget_cached(
+            parameters={"method": "count", "query_filters": filters},
+            loader=lambda: collection.count_documents(filters),
+        )
+
+    async def aestimated_count(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        collection = self._async_db_service.get_collection(self._collection_name)
+
+        if not query_filters:
+            return await collection.estimated_document_count()
+
+        cache_key = self._build_count_cache_key(query_filters)
+        total = caches["local"].get(cache_key)
+
+        if total is None:
+            total = await self._aprofile(
+                parameters={"method": "count", "query_filters": query_filters},
+                loader=lambda: collection.count_documents(query_filters),
+            )
+            caches["local"].set(cache_key, total, timeout=settings.LIST_COUNT_CACHE_TTL)
+
+        return total
+
+    async def astore(
+        self,
+        data: Dict[str, Any],
+    ) -> str:
+        self._normalize_timestamps(data, ("created_at", "updated_at"))
+
+        collection = self._async_db_service.get_collection(self._collection_name)
+        result = await collection.insert_one(data)
+        await self._ainvalidate_cache()
+        return str(result.inserted_id)
+
+    async def astore_many(
+        self,
+        data: List[Dict[str, Any]],
+        ordered: bool = True,
+    ) -> List[str]:
+        self._prepare_many(data)
+
+        collection = self._async_db_service.get_collection(self._collection_name)
+
+        try:
+            result = await collection.insert_many(data, ordered=ordered)
+        finally:
+            await self._ainvalidate_cache()
+
+        return [str(inserted_id) for inserted_id in result.inserted_ids]
+
+    async def aupdate(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+    ) -> int:
+        self._normalize_timestamps(data, ("updated_at",))
+
+        collection = self._async_db_service.get_collection(self._collection_name)
+        result = await collection.update_one(query_filters, {"$set": data})
+        await self._ainvalidate_cache()
+        return result.modified_count
+
+    async def adelete(
+        self,
+        query_filters: Dict[str, Any],
+    ) -> int:
+        collection = self._async_db_service.get_collection(self._collection_name)
+        result = await collection.delete_one(query_filters)
+        await self._ainvalidate_cache()
+        return result.deleted_count
+
+    async def adelete_many(
+        self,
+        query_filters: Dict[str, Any],
+    ) -> int:
+        collection = self._async_db_service.get_collection(self._collection_name)
+        result = await collection.delete_many(query_filters)
+        await self._ainvalidate_cache()
         return result.deleted_count
+
+    def ensure_indexes(
+        self,
+        dry_run: bool = False,
+        rebuild_drifted: bool = False,
+    ) -> Dict[str, List[str]]:
+        collection = self._db_service.get_collection(self._collection_name)
+        existing = collection.index_information()
+        declared = {index.document["name"] for index in self.INDEXES}
+        to_create: List[IndexModel] = []
+        summary: Dict[str, List[str]] = {
+            "created": [],
+            "drifted": [],
+            "unchanged": [],
+            "extra": [],
+        }
+
+        for index in self.INDEXES:
+            name = index.document["name"]
+            current = existing.get(name)
+
+            if current is None:
+                summary["created"].append(name)
+                to_create.append(self._build_background_index(index))
+                continue
+
+            if not self._is_index_drifted(index, current):
+                summary["unchanged"].append(name)
+                continue
+
+            summary["drifted"].append(name)
+
+            if rebuild_drifted and not dry_run:
+                collection.drop_index(name)
+                to_create.append(self._build_background_index(index))
+
+        summary["extra"] = [
+            name for name in existing if name != "_id_" and name not in declared
+        ]
+
+        if to_create and not dry_run:
+            collection.create_indexes(to_create)
+
+        return summary
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _get_cached(self, parameters: Dict[str, Any], loader: Callable[[], T]) -> T:
+        if not self.QUERY_CACHE:
+            return self._profile(parameters, loader)
+
+        return self._cache_service.get_or_set(
+            collection=self._collection_name,
+            parameters=parameters,
+            loader=lambda: self._profile(parameters, loader),
+            timeout=settings.QUERY_CACHE_TTL,
+        )
+
+    async def _aget_cached(self, parameters: Dict[str, Any], loader: Callable[[], Awaitable[T]]) -> T:
+        if not self.QUERY_CACHE:
+            return await self._aprofile(parameters, loader)
+
+        return await self._cache_service.aget_or_set(
+            collection=self._collection_name,
+            parameters=parameters,
+            loader=lambda: self._aprofile(parameters, loader),
+            timeout=settings.QUERY_CACHE_TTL,
+        )
+
+    def _profile(self, parameters: Dict[str, Any], loader: Callable[[], T]) -> T:
+        started_at = time.perf_counter()
+
+        try:
+            return loader()
+        finally:
+            duration = time.perf_counter() - started_at
+
+            if self.SLOW_QUERY_LOG and self._slow_query_service.is_slow(duration):
+                self._slow_query_service.record(self._get_slow_query(parameters), duration)
+
+    async def _aprofile(self, parameters: Dict[str, Any], loader: Callable[[], Awaitable[T]]) -> T:
+        started_at = time.perf_counter()
+
+        try:
+            return await loader()
+        finally:
+            duration = time.perf_counter() - started_at
+
+            if self.SLOW_QUERY_LOG and self._slow_query_service.is_slow(duration):
+                await sync_to_async(self._slow_query_service.record)(self._get_slow_query(parameters), duration)
+
+    def _invalidate_cache(self) -> None:
+        if self.QUERY_CACHE:
+            self._cache_service.invalidate(self._collection_name)
+
+    async def _ainvalidate_cache(self) -> None:
+        if self.QUERY_CACHE:
+            await self._cache_service.ainvalidate(self._collection_name)
+
+    async def _ato_raw_documents(self, cursor: Any) -> List[bytes]:
+        return [document.raw for document in await cursor.to_list(None)]
+
+    def _build_cursor(
+        self,
+        *,
+        collection: Any,
+        limit: int,
+        offset: int,
+        sort_by: Optional[str],
+        sort_direction: str,
+        query_filters: Optional[Dict[str, Any]],
+        projection_fields: Optional[Dict[str, Any]],
+        after: Optional[Dict[str, Any]],
+    ) -> Any:
+        filters, sort = self._build_query(
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            query_filters=query_filters,
+            after=after,
+        )
+        cursor = collection.find(filters, projection_fields or {})
+
+        if sort:
+            cursor = cursor.sort(sort)
+
+        if offset:
+            cursor = cursor.skip(offset)
+
+        if limit != 9**100:
+            cursor = cursor.limit(limit)
+
+        return cursor
+
+    def _build_query(
+        self,
+        sort_by: Optional[str],
+        sort_direction: str,
+        query_filters: Optional[Dict[str, Any]],
+        after: Optional[Dict[str, Any]],
+    ) -> Tuple[Dict[str, Any], List[Tuple[str, int]]]:
+        filters = query_filters or {}
+        direction = -1 if sort_direction == "desc" else 1
+
+        if after is not None:
+            filters = self._build_keyset_filters(
+                filters=filters,
+                sort_by=sort_by,
+                direction=direction,
+                after=after,
+            )
+
+        if sort_by and sort_direction:
+            return filters, self._build_sort(sort_by, direction)
+
+        if after is not None:
+            return filters, [("_id", direction)]
+
+        return filters, []
+
+    def _build_keyset_filters(
+        self,
+        filters: Dict[str, Any],
+        sort_by: Optional[str],
+        direction: int,
+        after: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        operator = "$lt" if direction == -1 else "$gt"
+
+        if not sort_by or sort_by == "_id":
+            keyset = {"_id": {operator: after["_id"]}}
+        else:
+            keyset = {
+                "$or": [
+                    {sort_by: {operator: after["value"]}},
+                    {sort_by: after["value"], "_id": {operator: after["_id"]}},
+                ]
+            }
+
+        if not filters:
+            return keyset
+
+        return {"$and": [filters, keyset]}
+
+    def _is_index_drifted(self, index: IndexModel, current: Dict[str, Any]) -> bool:
+        document = index.document
+        declared_keys = [(field, direction) for field, direction in document["key"].items()]
+        current_keys = [(field, direction) for field, direction in current["key"]]
+
+        if declared_keys != current_keys:
+            return True
+
+        if document.get("expireAfterSeconds") != current.get("expireAfterSeconds"):
+            return True
+
+        return bool(document.get("unique", False)) != bool(current.get("unique", False))
+
+    def _prepare_many(self, data: List[Dict[str, Any]]) -> None:
+        now = datetime.now(tz=UTC)
+
+        for item in data:
+            if "_id" not in item:
+                item["_id"] = ObjectId()
+
+            self._normalize_timestamps(item, ("created_at", "updated_at"), now)
+
+    # Helpers
+    def _build_background_index(self, index: IndexModel) -> IndexModel:
+        options = dict(index.document)
+        keys = list(options.pop("key").items())
+        return IndexModel(keys, background=True, **options)
+
+    def _get_query_parameters(
+        self,
+        *,
+        method: str,
+        limit: int,
+        offset: int,
+        sort_by: Optional[str],
+        sort_direction: str,
+        query_filters: Optional[Dict[str, Any]],
+        projection_fields: Optional[Dict[str, Any]],
+        after: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        return {
+            "method": method,
+            "limit": limit,
+            "offset": offset,
+            "sort_by": sort_by,
+            "sort_direction": sort_direction,
+            "query_filters": query_filters,
+            "projection_fields": projection_fields,
+            "after": after,
+        }
+
+    def _get_slow_query(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        filters, sort = self._build_query(
+            sort_by=parameters.get("sort_by"),
+            sort_direction=parameters.get("sort_direction", "desc"),
+            query_filters=parameters.get("query_filters"),
+            after=parameters.get("after"),
+        )
+
+        return {
+            "collection": self._collection_name,
+            "operation": parameters["method"],
+            "filter": filters,
+            "sort": sort,
+            "skip": parameters.get("offset", 0),
+            "limit": parameters.get("limit", 0),
+            "projection": parameters.get("projection_fields") or {},
+        }
+
+    def _build_count_cache_key(self, query_filters: Dict[str, Any]) -> str:
+        filters = json_util.dumps(query_filters, sort_keys=True)
+        digest = hashlib.sha1(filters.encode(), usedforsecurity=False).hexdigest()
+        return f"count:{self._collection_name}:{digest}"
+
+    def _normalize_timestamps(
+        self,
+        data: Dict[str, Any],
+        fields: Tuple[str, ...],
+        now: Optional[datetime] = None,
+    ) -> None:
+        for field in fields:
+            if field not in data:
+                data[field] = now or datetime.now(tz=UTC)
+
+            elif not isinstance(data[field], datetime):
+                timestamp = data[field]
+                timestamp = float(timestamp if timestamp is not None else 0)
+                data[field] = datetime.fromtimestamp(timestamp, tz=UTC)
+
+    def _build_sort(self, sort_by: str, direction: int) -> List[Tuple[str, int]]:
+        if sort_by == "_id":
+            return [("_id", direction)]
+
+        return [(sort_by, direction), ("_id", direction)]
+
+    # ───────────────────────────────────────────────────────────
+    # GETTERS
+    # ───────────────────────────────────────────────────────────
+    @property
+    def collection_name(self) -> str:
+        return self._collection_name
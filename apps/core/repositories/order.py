@@ -1,6 +1,64 @@
+from typing import ClassVar, Dict, List, Optional
+
+from pymongo import ASCENDING, IndexModel
+
+from apps.core.enums.field_type import FieldType
 from apps.core.repositories.base import BaseRepository
 
 
 class OrderRepository(BaseRepository):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    FIELD_TYPES: ClassVar[Dict[str, FieldType]] = {
+        **BaseRepository.FIELD_TYPES,
+        "id": FieldType.STRING,
+        "gateway_order_id": FieldType.STRING,
+        "backtest": FieldType.BOOLEAN,
+        "backtest_id": FieldType.STRING,
+        "portfolio_id": FieldType.STRING,
+        "asset_id": FieldType.STRING,
+        "strategy_id": FieldType.STRING,
+        "symbol": FieldType.STRING,
+        "gateway": FieldType.STRING,
+        "side": FieldType.STRING,
+        "order_type": FieldType.STRING,
+        "status": FieldType.STRING,
+        "volume": FieldType.FLOAT,
+        "executed_volume": FieldType.FLOAT,
+        "price": FieldType.FLOAT,
+        "close_price": FieldType.FLOAT,
+        "take_profit_price": FieldType.FLOAT,
+        "stop_loss_price": FieldType.FLOAT,
+        "commission": FieldType.FLOAT,
+        "commission_percentage": FieldType.FLOAT,
+        "client_order_id": FieldType.STRING,
+        "filled": FieldType.BOOLEAN,
+        "profit": FieldType.FLOAT,
+        "profit_percentage": FieldType.FLOAT,
+    }
+    DEFAULT_PROJECTION: ClassVar[Optional[Dict[str, int]]] = {
+        "trades": 0,
+        "logs": 0,
+        "variables": 0,
+    }
+    INDEXES: ClassVar[List[IndexModel]] = [
+        IndexModel(
+            [("backtest_id", ASCENDING), ("created_at", ASCENDING), ("_id", ASCENDING)],
+            name="orders_backtest_id_created_at",
+        ),
+        IndexModel(
+            [("strategy_id", ASCENDING), ("created_at", ASCENDING), ("_id", ASCENDING)],
+            name="orders_strategy_id_created_at",
+        ),
+        IndexModel(
+            [("created_at", ASCENDING), ("_id", ASCENDING)],
+            name="orders_created_at",
+        ),
+    ]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
     def __init__(self) -> None:
         super().__init__(collection_name="orders")
@@ -1,6 +1,39 @@
+from typing import ClassVar, Dict, List, Optional
+
+from pymongo import ASCENDING, IndexModel
+
+from apps.core.enums.field_type import FieldType
 from apps.core.repositories.base import BaseRepository
 
 
 class ReportRepository(BaseRepository):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    FIELD_TYPES: ClassVar[Dict[str, FieldType]] = {
+        **BaseRepository.FIELD_TYPES,
+        "backtest_id": FieldType.STRING,
+        "status": FieldType.STRING,
+        "folder": FieldType.STRING,
+    }
+    DEFAULT_PROJECTION: ClassVar[Optional[Dict[str, int]]] = {
+        "symbols": 0,
+        "strategies": 0,
+    }
+    QUERY_CACHE: ClassVar[bool] = True
+    INDEXES: ClassVar[List[IndexModel]] = [
+        IndexModel(
+            [("backtest_id", ASCENDING)],
+            name="reports_backtest_id",
+        ),
+        IndexModel(
+            [("created_at", ASCENDING), ("_id", ASCENDING)],
+            name="reports_created_at",
+        ),
+    ]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
     def __init__(self) -> None:
         super().__init__(collection_name="reports")
@@ -0,0 +1,108 @@
+from datetime import datetime
+from typing import Any, ClassVar, Dict, List
+
+from django.conf import settings
+from pymongo import ASCENDING, IndexModel
+
+from apps.core.enums.field_type import FieldType
+from apps.core.repositories.base import BaseRepository
+
+
+class SlowQueryRepository(BaseRepository):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    FIELD_TYPES: ClassVar[Dict[str, FieldType]] = {
+        **BaseRepository.FIELD_TYPES,
+        "collection": FieldType.STRING,
+        "operation": FieldType.STRING,
+        "shape_id": FieldType.STRING,
+        "route": FieldType.STRING,
+        "duration_ms": FieldType.FLOAT,
+        "collscan": FieldType.BOOLEAN,
+    }
+    INDEXES: ClassVar[List[IndexModel]] = [
+        IndexModel(
+            [("created_at", ASCENDING)],
+            name="slow_queries_created_at",
+            expireAfterSeconds=settings.SLOW_QUERY_RETENTION_DAYS * 24 * 60 * 60,
+        ),
+        IndexModel(
+            [("shape_id", ASCENDING)],
+            name="slow_queries_shape_id",
+        ),
+    ]
+    SLOW_QUERY_LOG: ClassVar[bool] = False
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self) -> None:
+        super().__init__(collection_name="slow_queries")
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def explain(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        database = self._db_service.get_collection(query["collection"]).database
+
+        return database.command(
+            "explain",
+            self._build_explain_command(query),
+            verbosity="executionStats",
+        )
+
+    def summarize(self, since: datetime, limit: int) -> List[Dict[str, Any]]:
+        collection = self._db_service.get_collection(self._collection_name)
+
+        return list(
+            collection.aggregate(
+                [
+                    {"$match": {"created_at": {"$gte": since}}},
+                    {
+                        "$group": {
+                            "_id": "$shape_id",
+                            "collection": {"$first": "$collection"},
+                            "operation": {"$first": "$operation"},
+                            "shape": {"$first": "$shape"},
+                            "sort": {"$first": "$sort"},
+                            "suggested_index": {"$first": "$suggested_index"},
+                            "route": {"$last": "$route"},
+                            "count": {"$sum": 1},
+                            "total_ms": {"$sum": "$duration_ms"},
+                            "max_ms": {"$max": "$duration_ms"},
+                            "max_skip": {"$max": "$skip"},
+                            "keys_examined": {"$avg": "$keys_examined"},
+                            "docs_examined": {"$avg": "$docs_examined"},
+                            "docs_returned": {"$avg": "$docs_returned"},
+                            "collscan": {"$max": "$collscan"},
+                        }
+                    },
+                    {"$sort": {"total_ms": -1}},
+                    {"$limit": limit},
+                ]
+            )
+        )
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _build_explain_command(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        if query["operation"] == "count":
+            return {"count": query["collection"], "query": query["filter"]}
+
+        command: Dict[str, Any] = {"find": query["collection"], "filter": query["filter"]}
+
+        if query["sort"]:
+            command["sort"] = dict(query["sort"])
+
+        if query["projection"]:
+            command["projection"] = query["projection"]
+
+        if query["skip"]:
+            command["skip"] = query["skip"]
+
+        if query["limit"]:
+            command["limit"] = query["limit"]
+
+        return command
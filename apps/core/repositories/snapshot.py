@@ -1,6 +1,52 @@
+from typing import ClassVar, Dict, List
+
+from pymongo import ASCENDING, IndexModel
+
+from apps.core.enums.field_type import FieldType
 from apps.core.repositories.base import BaseRepository
 
 
 class SnapshotRepository(BaseRepository):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    FIELD_TYPES: ClassVar[Dict[str, FieldType]] = {
+        **BaseRepository.FIELD_TYPES,
+        "backtest": FieldType.BOOLEAN,
+        "backtest_id": FieldType.STRING,
+        "strategy_id": FieldType.STRING,
+        "event": FieldType.STRING,
+        "nav": FieldType.FLOAT,
+        "allocation": FieldType.FLOAT,
+        "nav_peak": FieldType.FLOAT,
+        "r2": FieldType.FLOAT,
+        "cagr": FieldType.FLOAT,
+        "calmar_ratio": FieldType.FLOAT,
+        "expected_shortfall": FieldType.FLOAT,
+        "max_drawdown": FieldType.FLOAT,
+        "profit_factor": FieldType.FLOAT,
+        "recovery_factor": FieldType.FLOAT,
+        "sharpe_ratio": FieldType.FLOAT,
+        "sortino_ratio": FieldType.FLOAT,
+        "ulcer_index": FieldType.FLOAT,
+    }
+    INDEXES: ClassVar[List[IndexModel]] = [
+        IndexModel(
+            [("backtest_id", ASCENDING), ("created_at", ASCENDING), ("_id", ASCENDING)],
+            name="snapshots_backtest_id_created_at",
+        ),
+        IndexModel(
+            [("strategy_id", ASCENDING), ("created_at", ASCENDING), ("_id", ASCENDING)],
+            name="snapshots_strategy_id_created_at",
+        ),
+        IndexModel(
+            [("created_at", ASCENDING), ("_id", ASCENDING)],
+            name="snapshots_created_at",
+        ),
+    ]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
     def __init__(self) -> None:
         super().__init__(collection_name="snapshots")
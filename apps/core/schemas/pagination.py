@@ -38,7 +38,57 @@ def pagination_schema() -> List[OpenApiParameter]:
             name="filter_by",
             type=str,
             location=OpenApiParameter.QUERY,
-            description="Filter by field (format: column:value)",
+            description=(
+                "Filter by field, repeatable and combined with AND. Formats: "
+                "column:value (exact), column:in:a,b (any of), "
+                "column:prefix:value (case-sensitive prefix), "
+                "column:contains:value (case-insensitive, unindexed), "
+                "column>=value, column>value, column<=value, column<value, "
+                "column!=value. Dates accept epoch seconds or ISO 8601"
+            ),
+            required=False,
+            many=True,
+        ),
+        OpenApiParameter(
+            name="after",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            description=(
+                "Opaque cursor returned as pagination.next_cursor; "
+                "switches to keyset pagination and ignores page"
+            ),
+            required=False,
+        ),
+        OpenApiParameter(
+            name="count",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            description=(
+                "How to compute pagination.total: exact, estimated "
+                "(cached or collection metadata) or none (has_more only)"
+            ),
+            enum=["exact", "estimated", "none"],
+            required=False,
+        ),
+        OpenApiParameter(
+            name="fields",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            description=(
+                "Comma-separated fields to return, _id and the sort field are always "
+                "included. Use * for full documents, including heavy fields left out "
+                "by default"
+            ),
+            required=False,
+        ),
+        OpenApiParameter(
+            name="exclude",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            description=(
+                "Comma-separated fields to leave out, replaces the default projection. "
+                "Cannot be combined with fields"
+            ),
             required=False,
         ),
     ]
@@ -0,0 +1,404 @@
+import logging
+import math
+from datetime import UTC, datetime
+from typing import Any, Callable, ClassVar, Dict, List, Optional
+
+import numpy as np
+from pymongo.errors import DuplicateKeyError
+
+from apps.core.helpers import get_cagr_from, get_calmar_ratio_from
+from apps.core.models.aggregate import AggregateModel
+from apps.core.services.metrics import MetricsService
+from apps.core.services.report import ReportService
+
+logger = logging.getLogger("django")
+
+
+class AggregateService:
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    MAX_RETRIES: int = 5
+    SNAPSHOT_METRICS: ClassVar[List[str]] = [
+        "nav",
+        "nav_peak",
+        "r2",
+        "cagr",
+        "calmar_ratio",
+        "expected_shortfall",
+        "max_drawdown",
+        "recovery_factor",
+        "sharpe_ratio",
+        "sortino_ratio",
+        "ulcer_index",
+    ]
+    SNAPSHOT_STATE: ClassVar[Dict[str, Any]] = {
+        "exact": True,
+        "snapshots_count": 0,
+        "first_nav": 0.0,
+        "first_at": 0,
+        "last_nav": 0.0,
+        "last_at": 0,
+        "nav_peak": 0.0,
+        "max_drawdown": 0.0,
+        "max_loss": 0.0,
+        "drawdown_sq": 0.0,
+        "returns_count": 0,
+        "returns_mean": 0.0,
+        "returns_m2": 0.0,
+        "downside_sq": 0.0,
+        "sum_nav": 0.0,
+        "sum_nav_sq": 0.0,
+        "sum_index_nav": 0.0,
+    }
+    ORDER_STATE: ClassVar[Dict[str, Any]] = {
+        "orders_count": 0,
+        "gross_profit": 0.0,
+        "gross_loss": 0.0,
+        "symbols": {},
+        "strategies": {},
+    }
+    EMPTY_STATE: ClassVar[Dict[str, Any]] = {**SNAPSHOT_STATE, **ORDER_STATE}
+    BREAKDOWN_FIELDS: ClassVar[List[str]] = ["orders", "wins", "gross_profit", "gross_loss"]
+
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _model: AggregateModel
+    _report_service: ReportService
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self) -> None:
+        self._model = AggregateModel()
+        self._report_service = ReportService()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def apply_snapshots(self, snapshots: List[Dict[str, Any]]) -> None:
+        for backtest_id, documents in self._group_by_backtest(snapshots).items():
+            self._update(backtest_id, lambda state, items=documents: self._fold_snapshots(state, items))
+
+    def apply_orders(self, orders: List[Dict[str, Any]], sign: int = 1) -> None:
+        for backtest_id, documents in self._group_by_backtest(orders).items():
+            try:
+                self._model.upsert(
+                    query_filters={"backtest_id": backtest_id},
+                    operations=self._get_order_operations(documents, sign),
+                )
+            except Exception:
+                logger.exception(f"Failed to update aggregate for backtest {backtest_id}")
+                self.invalidate(backtest_id)
+
+    def invalidate(self, backtest_id: str) -> None:
+        try:
+            self._model.upsert(
+                query_filters={"backtest_id": backtest_id},
+                operations=self._get_invalidation_operations(),
+            )
+        except Exception:
+            logger.exception(f"Failed to invalidate aggregate for backtest {backtest_id}")
+
+    async def aapply_snapshots(self, snapshots: List[Dict[str, Any]]) -> None:
+        for backtest_id, documents in self._group_by_backtest(snapshots).items():
+            await self._aupdate(backtest_id, lambda state, items=documents: self._fold_snapshots(state, items))
+
+    async def aapply_orders(self, orders: List[Dict[str, Any]], sign: int = 1) -> None:
+        for backtest_id, documents in self._group_by_backtest(orders).items():
+            try:
+                await self._model.aupsert(
+                    query_filters={"backtest_id": backtest_id},
+                    operations=self._get_order_operations(documents, sign),
+                )
+            except Exception:
+                logger.exception(f"Failed to update aggregate for backtest {backtest_id}")
+                await self.ainvalidate(backtest_id)
+
+    async def ainvalidate(self, backtest_id: str) -> None:
+        try:
+            await self._model.aupsert(
+                query_filters={"backtest_id": backtest_id},
+                operations=self._get_invalidation_operations(),
+            )
+        except Exception:
+            logger.exception(f"Failed to invalidate aggregate for backtest {backtest_id}")
+
+    async def afind(self, backtest_id: str) -> Optional[Dict[str, Any]]:
+        results = await self._model.afind(query_filters={"backtest_id": backtest_id})
+        return results[0] if results else None
+
+    def get_report(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "metrics": self._get_metrics(state),
+            "symbols": self._report_service.get_breakdown_rows(self._to_breakdown(state["symbols"])),
+            "strategies": self._report_service.get_breakdown_rows(self._to_breakdown(state["strategies"])),
+            "orders_count": state["orders_count"],
+            "snapshots_count": state["snapshots_count"],
+            "exact": state["exact"],
+        }
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _update(self, backtest_id: str, fold: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
+        try:
+            if self._update_with_retries(backtest_id, fold):
+                return
+
+            logger.warning(f"Aggregate for backtest {backtest_id} kept changing, marked as inexact")
+        except Exception:
+            logger.exception(f"Failed to update aggregate for backtest {backtest_id}")
+
+        self.invalidate(backtest_id)
+
+    async def _aupdate(self, backtest_id: str, fold: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
+        try:
+            if await self._aupdate_with_retries(backtest_id, fold):
+                return
+
+            logger.warning(f"Aggregate for backtest {backtest_id} kept changing, marked as inexact")
+        except Exception:
+            logger.exception(f"Failed to update aggregate for backtest {backtest_id}")
+
+        await self.ainvalidate(backtest_id)
+
+    def _update_with_retries(self, backtest_id: str, fold: Callable[[Dict[str, Any]], Dict[str, Any]]) -> bool:
+        for _ in range(self.MAX_RETRIES):
+            results = self._model.find(
+                limit=1,
+                query_filters={"backtest_id": backtest_id},
+                projection_fields=self._get_snapshot_projection(),
+            )
+            current = results[0] if results else None
+            version = current["version"] if current else 0
+
+            try:
+                if self._model.upsert(
+                    query_filters={"backtest_id": backtest_id, "version": version},
+                    operations=self._get_snapshot_operations(fold(self._get_state(current)), version),
+                ):
+                    return True
+            except DuplicateKeyError:
+                continue
+
+        return False
+
+    async def _aupdate_with_retries(
+        self,
+        backtest_id: str,
+        fold: Callable[[Dict[str, Any]], Dict[str, Any]],
+    ) -> bool:
+        for _ in range(self.MAX_RETRIES):
+            results = await self._model.afind(
+                limit=1,
+                query_filters={"backtest_id": backtest_id},
+                projection_fields=self._get_snapshot_projection(),
+            )
+            current = results[0] if results else None
+            version = current["version"] if current else 0
+
+            try:
+                if await self._model.aupsert(
+                    query_filters={"backtest_id": backtest_id, "version": version},
+                    operations=self._get_snapshot_operations(fold(self._get_state(current)), version),
+                ):
+                    return True
+            except DuplicateKeyError:
+                continue
+
+        return False
+
+    def _fold_snapshots(self, state: Dict[str, Any], snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
+        created_at = np.array([self._to_milliseconds(item.get("created_at")) for item in snapshots], dtype=np.int64)
+        nav = np.array([item.get("nav") for item in snapshots], dtype=np.float64)
+
+        mask = np.isfinite(nav) & (nav > 0)
+        order = np.argsort(created_at[mask], kind="stable")
+        created_at = created_at[mask][order]
+        nav = nav[mask][order]
+
+        if nav.size == 0:
+            return state
+
+        count = state["snapshots_count"]
+        state = {**state}
+
+        if count and created_at[0] < state["last_at"]:
+            state["exact"] = False
+
+        peaks = np.maximum.accumulate(np.maximum(nav, state["nav_peak"]))
+        drawdowns = nav / peaks - 1.0
+        current = nav if count else nav[1:]
+        previous = np.concatenate(([state["last_nav"]], nav[:-1])) if count else nav[:-1]
+        returns = current / previous - 1.0
+        indexes = np.arange(count, count + nav.size, dtype=np.float64)
+
+        if returns.size:
+            self._fold_returns(state, returns)
+
+        state.update(
+            {
+                "snapshots_count": count + int(nav.size),
+                "first_nav": state["first_nav"] if count else float(nav[0]),
+                "first_at": state["first_at"] if count else int(created_at[0]),
+                "last_nav": float(nav[-1]),
+                "last_at": int(created_at[-1]),
+                "nav_peak": float(peaks[-1]),
+                "max_drawdown": min(state["max_drawdown"], float(drawdowns.min())),
+                "max_loss": max(state["max_loss"], float((peaks - nav).max())),
+                "drawdown_sq": state["drawdown_sq"] + float(np.dot(drawdowns, drawdowns)),
+                "sum_nav": state["sum_nav"] + float(nav.sum()),
+                "sum_nav_sq": state["sum_nav_sq"] + float(np.dot(nav, nav)),
+                "sum_index_nav": state["sum_index_nav"] + float(np.dot(indexes, nav)),
+            }
+        )
+
+        return state
+
+    def _fold_returns(self, state: Dict[str, Any], returns: np.ndarray) -> None:
+        count = state["returns_count"]
+        mean = state["returns_mean"]
+
+        batch_count = int(returns.size)
+        batch_mean = float(returns.mean())
+        batch_m2 = float(np.dot(returns - batch_mean, returns - batch_mean))
+        losses = np.minimum(returns, 0.0)
+
+        # Chan et al. (1979): M2 = M2_a + M2_b + delta^2 * n_a * n_b / n
+        total = count + batch_count
+        delta = batch_mean - mean
+
+        state["returns_count"] = total
+        state["returns_mean"] = mean + delta * batch_count / total
+        state["returns_m2"] = state["returns_m2"] + batch_m2 + delta * delta * count * batch_count / total
+        state["downside_sq"] = state["downside_sq"] + float(np.dot(losses, losses))
+
+    def _get_order_operations(self, orders: List[Dict[str, Any]], sign: int) -> Dict[str, Any]:
+        profits = np.array([item.get("profit") for item in orders], dtype=np.float64)
+        profits = np.nan_to_num(profits, nan=0.0)
+        increments = {
+            "orders_count": sign * int(profits.size),
+            "gross_profit": sign * float(np.maximum(profits, 0.0).sum()),
+            "gross_loss": sign * float(np.maximum(-profits, 0.0).sum()),
+        }
+        names = {}
+
+        for field, key in (("symbols", "symbol"), ("strategies", "strategy_id")):
+            labels = np.array([item.get(key) or "" for item in orders], dtype=object)
+
+            for label, sums in self._report_service.get_breakdown(labels, profits).items():
+                path = f"{field}.{self._get_breakdown_key(label)}"
+                names[f"{path}.name"] = label
+                increments.update(
+                    {f"{path}.{name}": sign * value for name, value in zip(self.BREAKDOWN_FIELDS, sums, strict=True)}
+                )
+
+        return {
+            "$inc": increments,
+            "$set": names,
+            "$setOnInsert": {**self.SNAPSHOT_STATE, "version": 0},
+        }
+
+    def _get_snapshot_operations(self, state: Dict[str, Any], version: int) -> Dict[str, Any]:
+        return {
+            "$set": {**{field: state[field] for field in self.SNAPSHOT_STATE}, "version": version + 1},
+            "$setOnInsert": self.ORDER_STATE,
+        }
+
+    def _get_snapshot_projection(self) -> Dict[str, int]:
+        return {**dict.fromkeys(self.SNAPSHOT_STATE, 1), "version": 1}
+
+    def _get_invalidation_operations(self) -> Dict[str, Any]:
+        return {
+            "$set": {"exact": False},
+            "$inc": {"version": 1},
+            "$setOnInsert": {field: value for field, value in self.EMPTY_STATE.items() if field != "exact"},
+        }
+
+    def _get_metrics(self, state: Dict[str, Any]) -> Dict[str, Optional[float]]:
+        count = state["snapshots_count"]
+        returns_count = state["returns_count"]
+
+        if count == 0:
+            return {**dict.fromkeys(self.SNAPSHOT_METRICS), **self._get_order_metrics(state)}
+
+        years = (state["last_at"] - state["first_at"]) / 1000.0 / MetricsService.SECONDS_PER_YEAR
+        periods_per_year = returns_count / years if years > 0 else 0.0
+        deviation = math.sqrt(state["returns_m2"] / returns_count) if returns_count else 0.0
+        downside_deviation = math.sqrt(state["downside_sq"] / returns_count) if returns_count else 0.0
+        annualization = math.sqrt(periods_per_year)
+
+        cagr = get_cagr_from(np.array([state["first_nav"], state["last_nav"]]), years)
+        max_drawdown = state["max_drawdown"]
+
+        return {
+            "nav": state["last_nav"],
+            "nav_peak": state["nav_peak"],
+            "r2": self._get_r2(state),
+            "cagr": self._to_finite(cagr),
+            "calmar_ratio": self._to_finite(get_calmar_ratio_from(cagr, max_drawdown)),
+            "expected_shortfall": None,
+            "max_drawdown": max_drawdown,
+            "recovery_factor": (
+                (state["last_nav"] - state["first_nav"]) / state["max_loss"] if state["max_loss"] else 0.0
+            ),
+            "sharpe_ratio": state["returns_mean"] / deviation * annualization if deviation else 0.0,
+            "sortino_ratio": state["returns_mean"] / downside_deviation * annualization if downside_deviation else 0.0,
+            "ulcer_index": 100.0 * math.sqrt(state["drawdown_sq"] / count),
+            **self._get_order_metrics(state),
+        }
+
+    def _get_order_metrics(self, state: Dict[str, Any]) -> Dict[str, Optional[float]]:
+        gross_loss = state["gross_loss"]
+
+        return {"profit_factor": state["gross_profit"] / gross_loss if gross_loss else 0.0}
+
+    def _get_r2(self, state: Dict[str, Any]) -> float:
+        count = state["snapshots_count"]
+
+        if count == 1:
+            return 0.0
+
+        # R^2 = cov(t, NAV)^2 / (var(t) * var(NAV)), t = 0..n-1, var(t) = n(n^2 - 1) / 12
+        time_variance = count * (count * count - 1) / 12.0
+        nav_variance = state["sum_nav_sq"] - state["sum_nav"] * state["sum_nav"] / count
+        covariance = state["sum_index_nav"] - (count - 1) / 2.0 * state["sum_nav"]
+
+        if nav_variance <= 0:
+            return 0.0
+
+        return min(covariance * covariance / (time_variance * nav_variance), 1.0)
+
+    # Helpers
+    def _group_by_backtest(self, documents: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+
+        for document in documents:
+            backtest_id = document.get("backtest_id")
+
+            if backtest_id and document.get("backtest", True):
+                groups.setdefault(str(backtest_id), []).append(document)
+
+        return groups
+
+    def _get_state(self, current: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        current = current or {}
+        return {field: current.get(field, default) for field, default in self.EMPTY_STATE.items()}
+
+    def _to_breakdown(self, rows: Dict[str, Dict[str, Any]]) -> Dict[str, List[float]]:
+        return {row["name"]: [row.get(field, 0) for field in self.BREAKDOWN_FIELDS] for row in rows.values()}
+
+    def _get_breakdown_key(self, label: str) -> str:
+        return f"k{label.encode().hex()}"
+
+    def _to_milliseconds(self, value: Any) -> int:
+        if isinstance(value, datetime):
+            moment = value if value.tzinfo else value.replace(tzinfo=UTC)
+            return int(moment.timestamp() * 1000)
+
+        return int(float(value or 0) * 1000)
+
+    def _to_finite(self, value: float) -> Optional[float]:
+        return value if math.isfinite(value) else None
@@ -0,0 +1,53 @@
+import asyncio
+import os
+from typing import Any, Optional
+from weakref import WeakKeyDictionary
+
+from django.conf import settings
+from pymongo import AsyncMongoClient
+
+from apps.core.services.mongodb import MongoDBService
+
+
+class AsyncMongoDBService:
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _instance: Optional["AsyncMongoDBService"] = None
+    _connections: "WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncMongoClient[Any]]" = (
+        WeakKeyDictionary()
+    )
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __new__(cls) -> "AsyncMongoDBService":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def get_collection(self, collection_name: str) -> Any:
+        loop = asyncio.get_running_loop()
+        connection = self._connections.get(loop)
+
+        if connection is None:
+            connection = self._connect()
+            self._connections[loop] = connection
+
+        return connection[settings.DATABASES["mongodb"]["DB_NAME"]][collection_name]
+
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        cls._connections = WeakKeyDictionary()
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _connect(self) -> AsyncMongoClient[Any]:
+        return AsyncMongoClient(MongoDBService.get_uri(), **MongoDBService.get_options())
+
+
+os.register_at_fork(after_in_child=AsyncMongoDBService.reset_after_fork)
@@ -0,0 +1,129 @@
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, ClassVar, Dict, TypeVar
+
+from bson import json_util
+from django.core.cache import caches
+
+T = TypeVar("T")
+
+logger = logging.getLogger("django")
+
+
+class CacheService:
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    GENERATION_KEY: str = "generation:{collection}"
+    ENTRY_KEY: str = "query:{collection}:{generation}:{digest}"
+    MISSING: ClassVar[object] = object()
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self) -> None:
+        self._local_cache = caches["local"]
+        self._shared_cache = caches["default"]
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def get_or_set(
+        self,
+        collection: str,
+        parameters: Dict[str, Any],
+        loader: Callable[[], T],
+        timeout: int,
+    ) -> T:
+        try:
+            generation = self._shared_cache.get(self._get_generation_key(collection), 0)
+            key = self._get_entry_key(collection, parameters, generation)
+            value = self._local_cache.get(key, self.MISSING)
+
+            if value is self.MISSING:
+                value = self._shared_cache.get(key, self.MISSING)
+
+                if value is not self.MISSING:
+                    self._local_cache.set(key, value, timeout)
+
+        except Exception as e:
+            logger.warning(f"Query cache unavailable for {collection}: {e}")
+            return loader()
+
+        if value is self.MISSING:
+            value = loader()
+            self._set(key, value, timeout)
+
+        return value  # type: ignore[return-value]
+
+    async def aget_or_set(
+        self,
+        collection: str,
+        parameters: Dict[str, Any],
+        loader: Callable[[], Awaitable[T]],
+        timeout: int,
+    ) -> T:
+        try:
+            generation = await self._shared_cache.aget(self._get_generation_key(collection), 0)
+            key = self._get_entry_key(collection, parameters, generation)
+            value = self._local_cache.get(key, self.MISSING)
+
+            if value is self.MISSING:
+                value = await self._shared_cache.aget(key, self.MISSING)
+
+                if value is not self.MISSING:
+                    self._local_cache.set(key, value, timeout)
+
+        except Exception as e:
+            logger.warning(f"Query cache unavailable for {collection}: {e}")
+            return await loader()
+
+        if value is self.MISSING:
+            value = await loader()
+            await self._aset(key, value, timeout)
+
+        return value  # type: ignore[return-value]
+
+    def invalidate(self, collection: str) -> None:
+        key = self._get_generation_key(collection)
+
+        try:
+            if not self._shared_cache.add(key, 1, timeout=None):
+                self._shared_cache.incr(key)
+        except Exception as e:
+            logger.error(f"Failed to invalidate query cache for {collection}: {e}")
+
+    async def ainvalidate(self, collection: str) -> None:
+        key = self._get_generation_key(collection)
+
+        try:
+            if not await self._shared_cache.aadd(key, 1, timeout=None):
+                await self._shared_cache.aincr(key)
+        except Exception as e:
+            logger.error(f"Failed to invalidate query cache for {collection}: {e}")
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _set(self, key: str, value: Any, timeout: int) -> None:
+        try:
+            self._shared_cache.set(key, value, timeout)
+            self._local_cache.set(key, value, timeout)
+        except Exception as e:
+            logger.warning(f"Failed to store query cache entry: {e}")
+
+    async def _aset(self, key: str, value: Any, timeout: int) -> None:
+        try:
+            await self._shared_cache.aset(key, value, timeout)
+            self._local_cache.set(key, value, timeout)
+        except Exception as e:
+            logger.warning(f"Failed to store query cache entry: {e}")
+
+    # Helpers
+    def _get_generation_key(self, collection: str) -> str:
+        return self.GENERATION_KEY.format(collection=collection)
+
+    def _get_entry_key(self, collection: str, parameters: Dict[str, Any], generation: int) -> str:
+        payload = json_util.dumps(parameters, sort_keys=True)
+        digest = hashlib.sha1(payload.encode(), usedforsecurity=False).hexdigest()
+        return self.ENTRY_KEY.format(collection=collection, generation=generation, digest=digest)
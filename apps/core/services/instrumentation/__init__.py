@@ -0,0 +1,211 @@
+import os
+import time
+from contextvars import ContextVar, Token
+from datetime import datetime
+from typing import Any, ClassVar, Dict, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from .multiprocess_collector import MultiProcessDirectoryCollector
+
+
+class InstrumentationService:
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    LATENCY_BUCKETS: ClassVar[Tuple[float, ...]] = (
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    )
+    TASK_BUCKETS: ClassVar[Tuple[float, ...]] = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0)
+    SIZE_BUCKETS: ClassVar[Tuple[float, ...]] = tuple(float(4**power) for power in range(3, 14))
+    DOCUMENT_BUCKETS: ClassVar[Tuple[float, ...]] = (0, 1, 10, 100, 1_000, 10_000, 100_000)
+
+    REQUEST_DURATION: ClassVar[Histogram] = Histogram(
+        "horizon_http_request_duration_seconds",
+        "HTTP request latency by route",
+        ["method", "route", "status"],
+        buckets=LATENCY_BUCKETS,
+    )
+    REQUEST_SERIALIZATION: ClassVar[Histogram] = Histogram(
+        "horizon_http_serialization_duration_seconds",
+        "Time spent rendering response bodies by route",
+        ["method", "route"],
+        buckets=LATENCY_BUCKETS,
+    )
+    RESPONSE_SIZE: ClassVar[Histogram] = Histogram(
+        "horizon_http_response_size_bytes",
+        "HTTP response body size by route",
+        ["method", "route"],
+        buckets=SIZE_BUCKETS,
+    )
+    COMMAND_DURATION: ClassVar[Histogram] = Histogram(
+        "horizon_mongodb_command_duration_seconds",
+        "MongoDB command latency by collection and operation",
+        ["collection", "operation"],
+        buckets=LATENCY_BUCKETS,
+    )
+    COMMAND_DOCUMENTS: ClassVar[Histogram] = Histogram(
+        "horizon_mongodb_command_documents",
+        "Documents returned or written per MongoDB command",
+        ["collection", "operation"],
+        buckets=DOCUMENT_BUCKETS,
+    )
+    COMMAND_SIZE: ClassVar[Histogram] = Histogram(
+        "horizon_mongodb_reply_size_bytes",
+        "Raw BSON bytes returned per MongoDB command",
+        ["collection", "operation"],
+        buckets=SIZE_BUCKETS,
+    )
+    COMMAND_FAILURES: ClassVar[Counter] = Counter(
+        "horizon_mongodb_command_failures_total",
+        "Failed MongoDB commands by collection and operation",
+        ["collection", "operation"],
+    )
+    TASK_DURATION: ClassVar[Histogram] = Histogram(
+        "horizon_celery_task_duration_seconds",
+        "Celery task run time by task and final state",
+        ["task", "state"],
+        buckets=TASK_BUCKETS,
+    )
+    TASK_QUEUE_WAIT: ClassVar[Histogram] = Histogram(
+        "horizon_celery_task_queue_wait_seconds",
+        "Time between a Celery task becoming due and a worker starting it",
+        ["task"],
+        buckets=TASK_BUCKETS,
+    )
+
+    PUBLISHED_AT_HEADER: str = "published_at"
+    CONTEXT: ClassVar[ContextVar[Optional[Dict[str, Any]]]] = ContextVar("instrumentation", default=None)
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def start_request(self, request: Any) -> Token:
+        return self.CONTEXT.set({"request": request, "serialization": 0.0})
+
+    def finish_request(
+        self,
+        *,
+        token: Token,
+        method: str,
+        route: str,
+        status: int,
+        duration: float,
+        size: Optional[int],
+    ) -> None:
+        context = self.CONTEXT.get() or {}
+        self.CONTEXT.reset(token)
+
+        self.REQUEST_DURATION.labels(method, route, str(status)).observe(duration)
+        self.REQUEST_SERIALIZATION.labels(method, route).observe(context.get("serialization", 0.0))
+
+        if size is not None:
+            self.RESPONSE_SIZE.labels(method, route).observe(size)
+
+    def observe_serialization(self, duration: float) -> None:
+        context = self.CONTEXT.get()
+
+        if context is not None and "serialization" in context:
+            context["serialization"] += duration
+
+    def get_caller(self) -> Optional[str]:
+        context = self.CONTEXT.get()
+        if context is None:
+            return None
+
+        if "task" in context:
+            return f"task:{context['task']}"
+
+        request = context["request"]
+        resolver_match = getattr(request, "resolver_match", None)
+
+        return f"{request.method} {resolver_match.route if resolver_match else request.path}"
+
+    def observe_command(
+        self,
+        collection: str,
+        operation: str,
+        duration: float,
+        documents: Optional[int],
+        size: Optional[int],
+    ) -> None:
+        self.COMMAND_DURATION.labels(collection, operation).observe(duration)
+
+        if documents is not None:
+            self.COMMAND_DOCUMENTS.labels(collection, operation).observe(documents)
+
+        if size is not None:
+            self.COMMAND_SIZE.labels(collection, operation).observe(size)
+
+    def observe_command_failure(self, collection: str, operation: str, duration: float) -> None:
+        self.COMMAND_DURATION.labels(collection, operation).observe(duration)
+        self.COMMAND_FAILURES.labels(collection, operation).inc()
+
+    def start_task(self, task: Any) -> None:
+        request = task.request
+        request.started_at = time.perf_counter()
+        self.CONTEXT.set({"task": task.name})
+
+        due_at = self._get_task_due_at(request)
+        if due_at is not None:
+            self.TASK_QUEUE_WAIT.labels(task.name).observe(max(time.time() - due_at, 0.0))
+
+    def finish_task(self, task: Any, state: Optional[str]) -> None:
+        self.CONTEXT.set(None)
+
+        started_at = getattr(task.request, "started_at", None)
+        if started_at is None:
+            return
+
+        self.TASK_DURATION.labels(task.name, state or "UNKNOWN").observe(time.perf_counter() - started_at)
+
+    def export(self) -> Tuple[bytes, str]:
+        return generate_latest(self._get_registry()), CONTENT_TYPE_LATEST
+
+    def mark_process_dead(self, pid: int) -> None:
+        if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+            multiprocess.mark_process_dead(pid)
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _get_registry(self) -> CollectorRegistry:
+        path = os.getenv("PROMETHEUS_EXPORT_DIR") or os.getenv("PROMETHEUS_MULTIPROC_DIR")
+        if not path:
+            return REGISTRY
+
+        registry = CollectorRegistry()
+        registry.register(MultiProcessDirectoryCollector(path))
+
+        return registry
+
+    # Helpers
+    def _get_task_due_at(self, request: Any) -> Optional[float]:
+        published_at = getattr(request, self.PUBLISHED_AT_HEADER, None)
+        if published_at is None:
+            return None
+
+        if request.eta:
+            return max(float(published_at), datetime.fromisoformat(request.eta).timestamp())
+
+        return float(published_at)
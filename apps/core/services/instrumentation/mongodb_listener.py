@@ -0,0 +1,92 @@
+from typing import Any, ClassVar, Dict, FrozenSet, Optional, Tuple
+
+from bson.raw_bson import RawBSONDocument
+from pymongo import monitoring
+
+from apps.core.services.instrumentation import InstrumentationService
+
+
+class MongoDBCommandListener(monitoring.CommandListener):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    CURSOR_COMMANDS: ClassVar[FrozenSet[str]] = frozenset({"find", "aggregate", "getMore"})
+    WRITE_COMMANDS: ClassVar[FrozenSet[str]] = frozenset({"insert", "update", "delete"})
+
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _collections: Dict[Tuple[Any, int], str]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self) -> None:
+        self._instrumentation_service = InstrumentationService()
+        self._collections = {}
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        collection = self._get_collection(event.command_name, event.command)
+
+        if collection is not None:
+            self._collections[(event.connection_id, event.request_id)] = collection
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        collection = self._collections.pop((event.connection_id, event.request_id), None)
+        if collection is None:
+            return
+
+        batch = self._get_batch(event.reply)
+
+        self._instrumentation_service.observe_command(
+            collection=collection,
+            operation=event.command_name,
+            duration=event.duration_micros / 1e6,
+            documents=self._get_documents(event.command_name, event.reply, batch),
+            size=self._get_size(batch),
+        )
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        collection = self._collections.pop((event.connection_id, event.request_id), None)
+        if collection is None:
+            return
+
+        self._instrumentation_service.observe_command_failure(
+            collection=collection,
+            operation=event.command_name,
+            duration=event.duration_micros / 1e6,
+        )
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _get_collection(self, command_name: str, command: Any) -> Optional[str]:
+        collection = command.get("collection") if command_name == "getMore" else command.get(command_name)
+
+        return collection if isinstance(collection, str) else None
+
+    def _get_batch(self, reply: Any) -> Optional[Any]:
+        cursor = reply.get("cursor")
+        if cursor is None:
+            return None
+
+        return cursor.get("firstBatch", cursor.get("nextBatch"))
+
+    def _get_documents(self, command_name: str, reply: Any, batch: Optional[Any]) -> Optional[int]:
+        if command_name in self.CURSOR_COMMANDS and batch is not None:
+            return len(batch)
+
+        if command_name in self.WRITE_COMMANDS:
+            return reply.get("n")
+
+        return None
+
+    # Helpers
+    def _get_size(self, batch: Optional[Any]) -> Optional[int]:
+        if not batch or not isinstance(batch[0], RawBSONDocument):
+            return None
+
+        return sum(len(document.raw) for document in batch)
@@ -0,0 +1,35 @@
+from pathlib import Path
+from typing import Iterable, List
+
+from prometheus_client.metrics_core import Metric
+from prometheus_client.multiprocess import MultiProcessCollector
+
+
+class MultiProcessDirectoryCollector:
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    PATTERNS: tuple = ("*.db", "*/*.db")
+
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _path: str
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self, path: str) -> None:
+        self._path = path
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def collect(self) -> Iterable[Metric]:
+        return MultiProcessCollector.merge(self._get_files(), accumulate=True)
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _get_files(self) -> List[str]:
+        return sorted(str(file) for pattern in self.PATTERNS for file in Path(self._path).glob(pattern))
@@ -0,0 +1,83 @@
+from typing import Dict, Optional
+
+import numpy as np
+
+from apps.core.helpers import (
+    get_cagr_from,
+    get_calmar_ratio_from,
+    get_cvar_from,
+    get_max_drawdown_from,
+    get_profit_factor_from,
+    get_r2_from,
+    get_recovery_factor_from,
+    get_sharpe_ratio_from_orders,
+    get_sortino_ratio_from,
+    get_ulcer_index_from,
+)
+
+
+class MetricsService:
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    SECONDS_PER_YEAR: float = 365.25 * 24 * 60 * 60
+    CVAR_CONFIDENCE: float = 0.95
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def compute(
+        self,
+        nav: np.ndarray,
+        timestamps: np.ndarray,
+        profits: Optional[np.ndarray] = None,
+    ) -> Dict[str, float]:
+        nav = np.ascontiguousarray(nav, dtype=np.float64)
+        timestamps = np.ascontiguousarray(timestamps, dtype=np.float64)
+
+        if nav.size == 0:
+            raise ValueError("NAV series cannot be empty")
+
+        if timestamps.size != nav.size:
+            raise ValueError("NAV and timestamp series must have equal length")
+
+        peaks = np.maximum.accumulate(nav)
+        drawdowns = nav / peaks - 1.0
+        returns = self._get_returns(nav)
+        losses = np.minimum(returns, 0.0)
+
+        years = float(timestamps[-1] - timestamps[0]) / self.SECONDS_PER_YEAR
+        periods_per_year = returns.size / years if years > 0 else 0.0
+
+        cagr = get_cagr_from(nav, years)
+        max_drawdown = get_max_drawdown_from(drawdowns)
+
+        return {
+            "nav": float(nav[-1]),
+            "nav_peak": float(peaks[-1]),
+            "r2": get_r2_from(nav),
+            "cagr": cagr,
+            "calmar_ratio": get_calmar_ratio_from(cagr, max_drawdown),
+            "expected_shortfall": get_cvar_from(returns, self.CVAR_CONFIDENCE),
+            "max_drawdown": max_drawdown,
+            "profit_factor": self._get_profit_factor(profits),
+            "recovery_factor": get_recovery_factor_from(nav, peaks),
+            "sharpe_ratio": get_sharpe_ratio_from_orders(returns, periods_per_year),
+            "sortino_ratio": get_sortino_ratio_from(returns, losses, periods_per_year),
+            "ulcer_index": get_ulcer_index_from(drawdowns),
+        }
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _get_returns(self, nav: np.ndarray) -> np.ndarray:
+        if nav.size == 1:
+            return np.zeros(1, dtype=np.float64)
+
+        return nav[1:] / nav[:-1] - 1.0
+
+    def _get_profit_factor(self, profits: Optional[np.ndarray]) -> float:
+        if profits is None or len(profits) == 0:
+            return 0.0
+
+        return get_profit_factor_from(np.ascontiguousarray(profits, dtype=np.float64))
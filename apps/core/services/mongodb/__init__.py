@@ -1,9 +1,12 @@
-from typing import Any, Optional
+import os
+from typing import Any, Dict, Optional
 
 from django.conf import settings
 from pymongo import MongoClient
 from pymongo.database import Database
 
+from apps.core.services.instrumentation.mongodb_listener import MongoDBCommandListener
+
 
 class MongoDBService:
     # ───────────────────────────────────────────────────────────
@@ -37,19 +40,38 @@ class MongoDBService:
 
         return self._database[collection_name]
 
-    # ───────────────────────────────────────────────────────────
-    # PRIVATE METHODS
-    # ───────────────────────────────────────────────────────────
-    def _connect(self) -> None:
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        if cls._instance is not None:
+            cls._instance._connection = None
+            cls._instance._database = None
+
+    @staticmethod
+    def get_uri() -> str:
         mongodb_config = settings.DATABASES["mongodb"]
 
-        db_name = mongodb_config["DB_NAME"]
         db_user = mongodb_config["DB_USER"]
         db_password = mongodb_config["DB_PASSWORD"]
         db_host = mongodb_config["DB_HOST"]
         db_port = mongodb_config["DB_PORT"]
 
-        uri = f"mongodb://{db_user}:{db_password}@{db_host}:{db_port}/"
+        return f"mongodb://{db_user}:{db_password}@{db_host}:{db_port}/"
+
+    @staticmethod
+    def get_options() -> Dict[str, Any]:
+        return {
+            **settings.DATABASES["mongodb"].get("OPTIONS", {}),
+            "event_listeners": [MongoDBCommandListener()],
+        }
 
-        self._connection = MongoClient(uri)
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _connect(self) -> None:
+        db_name = settings.DATABASES["mongodb"]["DB_NAME"]
+
+        self._connection = MongoClient(self.get_uri(), **self.get_options())
         self._database = self._connection[db_name]
+
+
+os.register_at_fork(after_in_child=MongoDBService.reset_after_fork)
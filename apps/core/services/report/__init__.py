@@ -0,0 +1,179 @@
+import math
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from apps.core.services.metrics import MetricsService
+
+
+class ReportService:
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    CURVES_ARTIFACT: str = "curves.npz"
+    ORDERS_ARTIFACT: str = "orders.npz"
+    CHUNK_ARTIFACT: str = "chunk-{index}.npz"
+    CHUNK_FIELDS: Tuple[str, ...] = ("snapshot_created_at", "nav", "order_created_at", "profit")
+
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _metrics_service: MetricsService
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self) -> None:
+        self._metrics_service = MetricsService()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def build(
+        self,
+        folder: Path,
+        orders: Dict[str, np.ndarray],
+        snapshots: Dict[str, np.ndarray],
+    ) -> Dict[str, Any]:
+        chunk = self.build_chunk(
+            folder=folder,
+            index=0,
+            orders=orders,
+            snapshots=snapshots,
+        )
+
+        return self.merge(folder=folder, chunks=[chunk])
+
+    def build_chunk(
+        self,
+        folder: Path,
+        index: int,
+        orders: Dict[str, np.ndarray],
+        snapshots: Dict[str, np.ndarray],
+    ) -> Dict[str, Any]:
+        created_at, nav = self._get_equity_series(snapshots)
+        profits = np.nan_to_num(orders["profit"], nan=0.0)
+
+        np.savez(
+            folder / self.CHUNK_ARTIFACT.format(index=index),
+            snapshot_created_at=created_at,
+            nav=nav,
+            order_created_at=orders["created_at"].astype("int64"),
+            profit=profits,
+        )
+
+        return {
+            "index": index,
+            "symbols": self.get_breakdown(orders["symbol"], profits),
+            "strategies": self.get_breakdown(orders["strategy_id"], profits),
+        }
+
+    def merge(self, folder: Path, chunks: List[Dict[str, Any]]) -> Dict[str, Any]:
+        chunks = sorted(chunks, key=lambda chunk: chunk["index"])
+        columns = self._load_chunks(folder, chunks)
+
+        created_at = columns["snapshot_created_at"]
+        nav = columns["nav"]
+        profits = columns["profit"]
+
+        metrics = self._metrics_service.compute(
+            nav=nav,
+            timestamps=created_at / 1000.0,
+            profits=profits,
+        )
+
+        np.savez(
+            folder / self.CURVES_ARTIFACT,
+            created_at=created_at,
+            nav=nav,
+            drawdown=(nav / np.maximum.accumulate(nav) - 1.0).astype(np.float32),
+        )
+        np.savez(
+            folder / self.ORDERS_ARTIFACT,
+            created_at=columns["order_created_at"],
+            profit=profits,
+            cumulative_profit=np.cumsum(profits),
+        )
+
+        return {
+            "metrics": {name: self._to_finite(value) for name, value in metrics.items()},
+            "symbols": self.get_breakdown_rows(self.merge_breakdowns([chunk["symbols"] for chunk in chunks])),
+            "strategies": self.get_breakdown_rows(self.merge_breakdowns([chunk["strategies"] for chunk in chunks])),
+            "orders_count": int(profits.size),
+            "snapshots_count": int(nav.size),
+            "artifacts": [self.CURVES_ARTIFACT, self.ORDERS_ARTIFACT],
+        }
+
+    def get_breakdown(self, keys: np.ndarray, profits: np.ndarray) -> Dict[str, List[float]]:
+        if keys.size == 0:
+            return {}
+
+        labels, inverse = np.unique(keys, return_inverse=True)
+        size = labels.size
+
+        counts = np.bincount(inverse, minlength=size)
+        wins = np.bincount(inverse, minlength=size, weights=profits > 0)
+        gross_profits = np.bincount(inverse, minlength=size, weights=np.maximum(profits, 0.0))
+        gross_losses = np.bincount(inverse, minlength=size, weights=np.maximum(-profits, 0.0))
+
+        return {
+            str(label): [int(count), int(win), float(gross_profit), float(gross_loss)]
+            for label, count, win, gross_profit, gross_loss in zip(
+                labels, counts, wins, gross_profits, gross_losses, strict=True
+            )
+        }
+
+    def merge_breakdowns(self, breakdowns: List[Dict[str, List[float]]]) -> Dict[str, List[float]]:
+        totals: Dict[str, List[float]] = {}
+
+        for breakdown in breakdowns:
+            for label, sums in breakdown.items():
+                current = totals.setdefault(label, [0, 0, 0.0, 0.0])
+                for position, value in enumerate(sums):
+                    current[position] += value
+
+        return totals
+
+    def get_breakdown_rows(self, totals: Dict[str, List[float]]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": label,
+                "orders": int(count),
+                "win_rate": wins / count,
+                "gross_profit": gross_profit,
+                "gross_loss": gross_loss,
+                "net_profit": gross_profit - gross_loss,
+                "profit_factor": gross_profit / gross_loss if gross_loss else 0.0,
+            }
+            for label, (count, wins, gross_profit, gross_loss) in sorted(totals.items())
+            if count > 0
+        ]
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _get_equity_series(self, snapshots: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        created_at = snapshots["created_at"]
+        nav = snapshots["nav"]
+        mask = ~np.isnat(created_at) & np.isfinite(nav)
+
+        return created_at[mask].astype("int64"), nav[mask]
+
+    def _load_chunks(self, folder: Path, chunks: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        parts: Dict[str, List[np.ndarray]] = {field: [] for field in self.CHUNK_FIELDS}
+
+        for chunk in chunks:
+            path = folder / self.CHUNK_ARTIFACT.format(index=chunk["index"])
+
+            with np.load(path) as artifact:
+                for field, arrays in parts.items():
+                    arrays.append(artifact[field])
+
+            path.unlink()
+
+        return {field: np.concatenate(arrays) for field, arrays in parts.items()}
+
+    # Helpers
+    def _to_finite(self, value: float) -> Optional[float]:
+        return value if math.isfinite(value) else None
@@ -0,0 +1,51 @@
+import logging
+import random
+from typing import Any, Dict
+
+from bson import json_util
+from celery import current_app
+from django.conf import settings
+
+from apps.core.services.instrumentation import InstrumentationService
+
+logger = logging.getLogger("django")
+
+
+class SlowQueryService:
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    CAPTURE_TASK: str = "apps.core.tasks.capture_slow_query"
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self) -> None:
+        self._instrumentation_service = InstrumentationService()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def is_slow(self, duration: float) -> bool:
+        return duration * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS
+
+    def record(self, query: Dict[str, Any], duration: float) -> None:
+        route = self._instrumentation_service.get_caller()
+        duration_ms = round(duration * 1000, 1)
+
+        logger.warning(
+            f"Slow {query['operation']} on {query['collection']} took {duration_ms} ms "
+            f"(route={route}, filter={json_util.dumps(query['filter'])}, sort={query['sort']}, "
+            f"skip={query['skip']}, limit={query['limit']}, projection={json_util.dumps(query['projection'])})"
+        )
+
+        if random.random() >= settings.SLOW_QUERY_SAMPLE_RATE:
+            return
+
+        try:
+            current_app.send_task(
+                self.CAPTURE_TASK,
+                args=[json_util.dumps({**query, "route": route, "duration_ms": duration_ms})],
+            )
+        except Exception as e:
+            logger.error(f"Failed to schedule slow query capture: {e}")
@@ -0,0 +1,115 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from channels.layers import get_channel_layer
+from django.conf import settings
+
+logger = logging.getLogger("django")
+
+
+class StreamService:
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    GROUP_NAME: str = "backtest.{backtest_id}"
+    MESSAGE_TYPE: str = "backtest.delta"
+    BATCH_MESSAGE_TYPE: str = "backtest.deltas"
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def get_group_name(self, backtest_id: str) -> str:
+        return self.GROUP_NAME.format(backtest_id=backtest_id)
+
+    async def apublish(
+        self,
+        *,
+        backtest_id: Optional[str],
+        resource: str,
+        event: str,
+        document_id: str,
+        data: Dict[str, Any],
+        exclude: Optional[Dict[str, int]] = None,
+    ) -> None:
+        if not backtest_id:
+            return
+
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return
+
+        message = {
+            "type": self.MESSAGE_TYPE,
+            "resource": resource,
+            "event": event,
+            "data": {**self._compact(data, exclude or {}), "_id": str(document_id)},
+        }
+
+        await self._send(channel_layer, str(backtest_id), message)
+
+    async def apublish_many(
+        self,
+        resource: str,
+        event: str,
+        documents: List[Dict[str, Any]],
+        exclude: Optional[Dict[str, int]] = None,
+    ) -> None:
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return
+
+        batches: Dict[str, List[Dict[str, Any]]] = {}
+
+        for document in documents:
+            backtest_id = document.get("backtest_id")
+
+            if backtest_id and document.get("_id"):
+                batches.setdefault(str(backtest_id), []).append(
+                    {**self._compact(document, exclude or {}), "_id": str(document["_id"])}
+                )
+
+        for backtest_id, items in batches.items():
+            await self._send(
+                channel_layer,
+                backtest_id,
+                {
+                    "type": self.BATCH_MESSAGE_TYPE,
+                    "resource": resource,
+                    "event": event,
+                    "items": items,
+                },
+            )
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    async def _send(self, channel_layer: Any, backtest_id: str, message: Dict[str, Any]) -> None:
+        try:
+            await asyncio.wait_for(
+                channel_layer.group_send(self.get_group_name(backtest_id), message),
+                timeout=settings.STREAM_PUBLISH_TIMEOUT,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to publish {message['resource']} {message['event']} for backtest {backtest_id}: {e}"
+            )
+
+    def _compact(self, data: Dict[str, Any], exclude: Dict[str, int]) -> Dict[str, Any]:
+        return {
+            field: self._to_primitive(value)
+            for field, value in data.items()
+            if field not in exclude and value is not None
+        }
+
+    # Helpers
+    def _to_primitive(self, value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+
+        if isinstance(value, ObjectId):
+            return str(value)
+
+        return value
@@ -0,0 +1,101 @@
+import threading
+from typing import Any, ClassVar, Dict, Mapping, Optional, Tuple
+
+from cerberus import Validator
+
+from .fast_validator import FastValidator
+
+
+class ValidationService:
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _instance: Optional["ValidationService"] = None
+    _local: threading.local = threading.local()
+    _lock: threading.Lock = threading.Lock()
+    _fast_validators: ClassVar[Dict[Tuple[int, bool], Tuple[Any, FastValidator]]] = {}
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __new__(cls) -> "ValidationService":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def validate(
+        self,
+        schema: Mapping[str, Any],
+        document: Mapping[str, Any],
+        allow_unknown: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        validator = self._get_validator(schema, allow_unknown)
+
+        is_valid = validator.validate(document)  # type: ignore
+        if not is_valid:
+            return self._stringify_keys(validator.errors)  # type: ignore
+
+        return None
+
+    def validate_fast(
+        self,
+        schema: Mapping[str, Any],
+        document: Mapping[str, Any],
+        allow_unknown: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        if self._get_fast_validator(schema, allow_unknown).is_accepted(document):
+            return None
+
+        return self.validate(schema, document, allow_unknown)
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _get_validator(self, schema: Mapping[str, Any], allow_unknown: bool) -> Validator:
+        validators = getattr(self._local, "validators", None)
+
+        if validators is None:
+            validators = {}
+            self._local.validators = validators
+
+        key = (id(schema), allow_unknown)
+        entry = validators.get(key)
+
+        if entry is None:
+            entry = (schema, Validator(schema, allow_unknown=allow_unknown))  # type: ignore
+            validators[key] = entry
+
+        return entry[1]
+
+    def _get_fast_validator(
+        self,
+        schema: Mapping[str, Any],
+        allow_unknown: bool,
+    ) -> FastValidator:
+        key = (id(schema), allow_unknown)
+        entry = self._fast_validators.get(key)
+
+        if entry is None:
+            with self._lock:
+                entry = self._fast_validators.get(key)
+
+                if entry is None:
+                    entry = (schema, FastValidator(schema, allow_unknown))
+                    self._fast_validators[key] = entry
+
+        return entry[1]
+
+    def _stringify_keys(self, errors: Any) -> Any:
+        if isinstance(errors, dict):
+            return {str(key): self._stringify_keys(value) for key, value in errors.items()}
+
+        if isinstance(errors, list):
+            return [self._stringify_keys(value) for value in errors]
+
+        return errors
+
+
+__all__ = ["FastValidator", "ValidationService"]
@@ -0,0 +1,159 @@
+import re
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, List, Mapping
+
+from cerberus import Validator
+
+
+class FastValidator:
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    SUPPORTED_RULES: ClassVar[FrozenSet[str]] = frozenset(
+        {
+            "allowed",
+            "coerce",
+            "max",
+            "maxlength",
+            "min",
+            "minlength",
+            "nullable",
+            "regex",
+            "required",
+            "schema",
+            "type",
+        }
+    )
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(
+        self,
+        schema: Mapping[str, Mapping[str, Any]],
+        allow_unknown: bool = False,
+    ) -> None:
+        self._allow_unknown = allow_unknown
+        self._is_compiled = all(self._is_supported(rules) for rules in schema.values())
+        self._required = frozenset(
+            field for field, rules in schema.items() if rules.get("required")
+        )
+        self._checks: Dict[str, Callable[[Any], bool]] = {}
+
+        if self._is_compiled:
+            self._checks = {
+                field: self._compile_field(rules) for field, rules in schema.items()
+            }
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def is_accepted(self, document: Mapping[str, Any]) -> bool:
+        if not self._is_compiled:
+            return False
+
+        if not self._required <= document.keys():
+            return False
+
+        checks = self._checks
+
+        for field, value in document.items():
+            check = checks.get(field)
+
+            if check is None:
+                if self._allow_unknown:
+                    continue
+
+                return False
+
+            if not check(value):
+                return False
+
+        return True
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _is_supported(self, rules: Mapping[str, Any]) -> bool:
+        if not set(rules) <= self.SUPPORTED_RULES:
+            return False
+
+        if "schema" not in rules:
+            return True
+
+        return rules.get("type") == "list" and self._is_supported(rules["schema"])
+
+    def _compile_field(self, rules: Mapping[str, Any]) -> Callable[[Any], bool]:
+        nullable = rules.get("nullable", False)
+        coerce = rules.get("coerce")
+        constraints: List[Callable[[Any], bool]] = []
+
+        if "type" in rules:
+            definition = Validator.types_mapping[rules["type"]]
+            included = definition.included_types
+            excluded = definition.excluded_types
+            constraints.append(
+                lambda value: isinstance(value, included)
+                and not isinstance(value, excluded)
+            )
+
+        if "allowed" in rules:
+            allowed = tuple(rules["allowed"])
+            constraints.append(
+                lambda value: isinstance(value, (str, int, float)) and value in allowed
+            )
+
+        if "min" in rules:
+            minimum = rules["min"]
+            constraints.append(lambda value: self._compare(value, minimum, False))
+
+        if "max" in rules:
+            maximum = rules["max"]
+            constraints.append(lambda value: self._compare(value, maximum, True))
+
+        if "minlength" in rules:
+            minlength = rules["minlength"]
+            constraints.append(
+                lambda value: isinstance(value, str) and len(value) >= minlength
+            )
+
+        if "maxlength" in rules:
+            maxlength = rules["maxlength"]
+            constraints.append(
+                lambda value: isinstance(value, str) and len(value) <= maxlength
+            )
+
+        if "regex" in rules:
+            pattern = rules["regex"]
+            expression = re.compile(pattern if pattern.endswith("$") else pattern + "$")
+            constraints.append(
+                lambda value: not isinstance(value, str)
+                or expression.match(value) is not None
+            )
+
+        if "schema" in rules:
+            check_item = self._compile_field(rules["schema"])
+            constraints.append(
+                lambda value: isinstance(value, list)
+                and all(check_item(item) for item in value)
+            )
+
+        def check(value: Any) -> bool:
+            if value is None:
+                return bool(nullable)
+
+            if coerce is not None:
+                try:
+                    value = coerce(value)
+                except Exception:
+                    return False
+
+            return all(constraint(value) for constraint in constraints)
+
+        return check
+
+    # Helpers
+    def _compare(self, value: Any, bound: Any, is_upper: bool) -> bool:
+        try:
+            return bool(value <= bound) if is_upper else bool(value >= bound)
+        except TypeError:
+            return False
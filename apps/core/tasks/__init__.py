@@ -1,3 +1,13 @@
+from .capture_slow_query import capture_slow_query
+from .fail_backtest_report import fail_backtest_report
 from .make_backtest_report import make_backtest_report
+from .make_backtest_report_chunk import make_backtest_report_chunk
+from .merge_backtest_report import merge_backtest_report
 
-__all__ = ["make_backtest_report"]
+__all__ = [
+    "capture_slow_query",
+    "fail_backtest_report",
+    "make_backtest_report",
+    "make_backtest_report_chunk",
+    "merge_backtest_report",
+]
@@ -1,20 +1,45 @@
 import logging
+import time
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
+import numpy as np
 from bson import ObjectId
+from celery import chord, signature
 from django.conf import settings
 
 from apps.core.enums.report_status import ReportStatus
 from apps.core.models.backtest import BacktestModel
+from apps.core.models.base import BaseModel
 from apps.core.models.order import OrderModel
 from apps.core.models.report import ReportModel
 from apps.core.models.snapshot import SnapshotModel
+from apps.core.services.report import ReportService
 
 logger = logging.getLogger("django")
 
 
 class BacktestReportTask:
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    ORDER_COLUMNS: ClassVar[Dict[str, str]] = {
+        "created_at": "datetime64[ms]",
+        "profit": "float64",
+        "symbol": "object",
+        "strategy_id": "object",
+    }
+    SNAPSHOT_COLUMNS: ClassVar[Dict[str, str]] = {
+        "created_at": "datetime64[ms]",
+        "nav": "float64",
+    }
+    MISSING_VALUES: ClassVar[Dict[str, Any]] = {
+        "datetime64[ms]": np.datetime64("NaT", "ms"),
+        "float64": np.nan,
+        "object": "",
+    }
+
     # ───────────────────────────────────────────────────────────
     # PROPERTIES
     # ───────────────────────────────────────────────────────────
@@ -22,8 +47,8 @@ class BacktestReportTask:
     _backtest_id: Optional[str]
     _backtest: Optional[Dict[str, Any]]
     _report: Optional[Dict[str, Any]]
-    _orders: List[Dict[str, Any]]
-    _snapshots: List[Dict[str, Any]]
+    _orders_count: int
+    _snapshots_count: int
 
     _folder: Optional[Path]
 
@@ -32,36 +57,103 @@ class BacktestReportTask:
     # ───────────────────────────────────────────────────────────
     def __init__(self, backtest_id: Optional[str] = None) -> None:
         self._backtest_id = backtest_id
+        self._backtest = None
+        self._report = None
+        self._orders_count = 0
+        self._snapshots_count = 0
+        self._folder = None
         self._report_model = ReportModel()
         self._order_model = OrderModel()
         self._snapshot_model = SnapshotModel()
+        self._report_service = ReportService()
         self._setup()
 
     # ───────────────────────────────────────────────────────────
     # PUBLIC METHODS
     # ───────────────────────────────────────────────────────────
     def run(self) -> None:
-        if (
-            not self._report
-            or not self._orders
-            or not self._snapshots
-            or not self._folder
-        ):
+        if not self._is_ready():
             logger.error("Task is not ready")
+
+            if self._report:
+                self._update_report_to_failed(self._report["_id"])
+
             return
 
-        orders = self._orders
-        snapshots = self._snapshots
-        report = self._report
-        folder = self._folder
+        report_id = self._report["_id"]  # type: ignore
 
-        report_id = report["_id"]
+        if not self._claim_report(report_id):
+            logger.warning(f"Report {report_id} is already building")
+            return
 
-        self._update_report(
-            report_id=report_id,
-            data={"folder": str(folder)},
+        started_at = time.time()
+        ranges = self._get_chunk_ranges()
+
+        if len(ranges) > 1:
+            self._schedule_chunks(report_id, ranges, started_at)
+            return
+
+        try:
+            summary = self._report_service.build(
+                folder=self._folder,  # type: ignore
+                orders=self._get_orders_by_backtest_id(self._backtest_id),  # type: ignore
+                snapshots=self._get_snapshots_by_backtest_id(self._backtest_id),  # type: ignore
+            )
+        except Exception:
+            logger.exception(f"Failed to build report {report_id}")
+            self._update_report_to_failed(report_id)
+            return
+
+        self._update_report_to_ready(report_id, summary, started_at)
+
+    def run_chunk(
+        self,
+        index: int,
+        started_at: Optional[int],
+        finished_at: Optional[int],
+    ) -> Dict[str, Any]:
+        if not self._is_ready():
+            raise ValueError("Task is not ready")
+
+        return self._report_service.build_chunk(
+            folder=self._folder,  # type: ignore
+            index=index,
+            orders=self._get_orders_by_backtest_id(
+                self._backtest_id,  # type: ignore
+                started_at=started_at,
+                finished_at=finished_at,
+            ),
+            snapshots=self._get_snapshots_by_backtest_id(
+                self._backtest_id,  # type: ignore
+                started_at=started_at,
+                finished_at=finished_at,
+            ),
         )
 
+    def merge(self, chunks: List[Dict[str, Any]], started_at: float) -> None:
+        if not self._is_ready():
+            logger.error("Task is not ready")
+            self.fail()
+            return
+
+        report_id = self._report["_id"]  # type: ignore
+
+        try:
+            summary = self._report_service.merge(
+                folder=self._folder,  # type: ignore
+                chunks=chunks,
+            )
+        except Exception:
+            logger.exception(f"Failed to merge report {report_id}")
+            self._update_report_to_failed(report_id)
+            return
+
+        self._update_report_to_ready(report_id, summary, started_at)
+
+    def fail(self) -> None:
+        if self._report:
+            self._update_report_to_failed(self._report["_id"])
+
     # ───────────────────────────────────────────────────────────
     # PRIVATE METHODS
     # ───────────────────────────────────────────────────────────
@@ -74,23 +166,25 @@ class BacktestReportTask:
             logger.error("Failed to find backtest")
             return
 
-        self._report = self._get_report_by_backtest_id(
-            self._backtest["_id"],
-        )
+        self._report = self._get_report_by_backtest_id(self._backtest_id)
 
         if not self._report:
             logger.error("Failed to find report")
             return
 
-        self._orders = self._get_orders_by_backtest_id(self._backtest["_id"])
+        self._orders_count = self._order_model.count(
+            query_filters=self._get_orders_filters(self._backtest_id),
+        )
 
-        if len(self._orders) == 0:
+        if self._orders_count == 0:
             logger.error("Failed to find orders")
             return
 
-        self._snapshots = self._get_snapshots_by_backtest_id(self._backtest["_id"])
+        self._snapshots_count = self._snapshot_model.count(
+            query_filters=self._get_snapshots_filters(self._backtest_id),
+        )
 
-        if len(self._snapshots) == 0:
+        if self._snapshots_count == 0:
             logger.error("Failed to find snapshots")
             return
 
@@ -99,6 +193,9 @@ class BacktestReportTask:
         self._folder = Path(settings.BASE_DIR) / "storage" / "reports" / str(report_id)
         self._folder.mkdir(parents=True, exist_ok=True)
 
+    def _is_ready(self) -> bool:
+        return bool(self._report and self._orders_count and self._snapshots_count and self._folder)
+
     def _get_backtest_by_id(self, backtest_id: str) -> Optional[Dict[str, Any]]:
         results = BacktestModel().find(
             query_filters={"_id": ObjectId(backtest_id)},
@@ -113,24 +210,104 @@ class BacktestReportTask:
 
         return report[0] if report else None
 
-    def _get_orders_by_backtest_id(self, backtest_id: str) -> List[Dict[str, Any]]:
-        return self._order_model.find(
-            limit=9**100,
-            query_filters={
-                "backtest": True,
-                "backtest_id": backtest_id,
-            },
-            sort_by="created_at",
-            sort_direction="asc",
+    def _get_orders_by_backtest_id(
+        self,
+        backtest_id: str,
+        started_at: Optional[int] = None,
+        finished_at: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        return self._load_columns(
+            model=self._order_model,
+            query_filters=self._get_range_filters(
+                query_filters=self._get_orders_filters(backtest_id),
+                started_at=started_at,
+                finished_at=finished_at,
+            ),
+            columns=self.ORDER_COLUMNS,
         )
 
-    def _get_snapshots_by_backtest_id(self, backtest_id: str) -> List[Dict[str, Any]]:
-        return self._snapshot_model.find(
-            limit=9**100,
-            query_filters={"backtest_id": backtest_id},
+    def _get_snapshots_by_backtest_id(
+        self,
+        backtest_id: str,
+        started_at: Optional[int] = None,
+        finished_at: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        return self._load_columns(
+            model=self._snapshot_model,
+            query_filters=self._get_range_filters(
+                query_filters=self._get_snapshots_filters(backtest_id),
+                started_at=started_at,
+                finished_at=finished_at,
+            ),
+            columns=self.SNAPSHOT_COLUMNS,
+        )
+
+    def _get_chunk_ranges(self) -> List[Tuple[Optional[int], Optional[int]]]:
+        chunks_count = min(
+            -(-self._snapshots_count // settings.REPORT_CHUNK_SIZE),
+            settings.REPORT_MAX_CHUNKS,
+        )
+
+        if chunks_count <= 1:
+            return [(None, None)]
+
+        first_at = self._get_snapshot_time(self._backtest_id, "asc")  # type: ignore
+        last_at = self._get_snapshot_time(self._backtest_id, "desc")  # type: ignore
+        width = (last_at - first_at) / chunks_count
+
+        boundaries = [first_at + round(width * index) for index in range(1, chunks_count)]
+
+        return list(zip([None, *boundaries], [*boundaries, None], strict=True))
+
+    def _get_snapshot_time(self, backtest_id: str, sort_direction: str) -> int:
+        snapshot = self._snapshot_model.find(
+            limit=1,
             sort_by="created_at",
-            sort_direction="asc",
+            sort_direction=sort_direction,
+            query_filters=self._get_snapshots_filters(backtest_id),
+            projection_fields={"created_at": 1},
+        )[0]
+
+        return int(np.datetime64(snapshot["created_at"], "ms").astype("int64"))
+
+    def _schedule_chunks(
+        self,
+        report_id: str,
+        ranges: List[Tuple[Optional[int], Optional[int]]],
+        started_at: float,
+    ) -> None:
+        header = [
+            signature(
+                "apps.core.tasks.make_backtest_report_chunk",
+                args=(self._backtest_id, index, chunk_started_at, chunk_finished_at),
+            )
+            for index, (chunk_started_at, chunk_finished_at) in enumerate(ranges)
+        ]
+        body = signature(
+            "apps.core.tasks.merge_backtest_report",
+            args=(self._backtest_id, started_at),
         )
+        body.on_error(signature("apps.core.tasks.fail_backtest_report", args=(self._backtest_id,)))
+
+        chord(header)(body)
+
+        logger.info(f"Report {report_id} split into {len(header)} chunks")
+
+    def _claim_report(self, report_id: str) -> bool:
+        stale_at = datetime.now(tz=UTC) - timedelta(seconds=settings.REPORT_BUILD_TIMEOUT)
+
+        claimed = self._report_model.update(
+            query_filters={
+                "_id": ObjectId(report_id),
+                "$or": [
+                    {"status": {"$ne": ReportStatus.BUILDING.value}},
+                    {"updated_at": {"$lt": stale_at}},
+                ],
+            },
+            data={"status": ReportStatus.BUILDING.value},
+        )
+
+        return claimed == 1
 
     def _update_report(self, report_id: str, data: Dict[str, Any]) -> None:
         self._report_model.update(
@@ -138,6 +315,17 @@ class BacktestReportTask:
             data=data,
         )
 
+    def _update_report_to_ready(self, report_id: str, summary: Dict[str, Any], started_at: float) -> None:
+        self._update_report(
+            report_id=report_id,
+            data={
+                **summary,
+                "folder": str(self._folder),
+                "build_time": time.time() - started_at,
+                "status": ReportStatus.READY.value,
+            },
+        )
+
     def _update_report_to_failed(self, report_id: str) -> None:
         self._update_report(
             report_id=report_id,
@@ -145,3 +333,81 @@ class BacktestReportTask:
                 "status": ReportStatus.FAILED.value,
             },
         )
+
+    # Helpers
+    def _get_orders_filters(self, backtest_id: str) -> Dict[str, Any]:
+        return {
+            "backtest": True,
+            "backtest_id": backtest_id,
+        }
+
+    def _get_snapshots_filters(self, backtest_id: str) -> Dict[str, Any]:
+        return {"backtest_id": backtest_id}
+
+    def _get_range_filters(
+        self,
+        query_filters: Dict[str, Any],
+        started_at: Optional[int],
+        finished_at: Optional[int],
+    ) -> Dict[str, Any]:
+        created_at: Dict[str, datetime] = {}
+
+        if started_at is not None:
+            created_at["$gte"] = datetime.fromtimestamp(started_at / 1000, tz=UTC)
+
+        if finished_at is not None:
+            created_at["$lt"] = datetime.fromtimestamp(finished_at / 1000, tz=UTC)
+
+        if not created_at:
+            return query_filters
+
+        return {**query_filters, "created_at": created_at}
+
+    def _load_columns(
+        self,
+        model: BaseModel,
+        query_filters: Dict[str, Any],
+        columns: Dict[str, str],
+    ) -> Dict[str, np.ndarray]:
+        chunks: Dict[str, List[np.ndarray]] = {field: [] for field in columns}
+        batch: List[Dict[str, Any]] = []
+
+        documents = model.stream(
+            query_filters=query_filters,
+            sort_by="created_at",
+            sort_direction="asc",
+            projection_fields={**dict.fromkeys(columns, 1), "_id": 0},
+            batch_size=settings.REPORT_BATCH_SIZE,
+        )
+
+        for document in documents:
+            batch.append(document)
+
+            if len(batch) >= settings.REPORT_BATCH_SIZE:
+                self._append_columns(chunks, batch, columns)
+                batch = []
+
+        if batch:
+            self._append_columns(chunks, batch, columns)
+
+        return {
+            field: np.concatenate(chunks[field]) if chunks[field] else np.empty(0, dtype=dtype)
+            for field, dtype in columns.items()
+        }
+
+    def _append_columns(
+        self,
+        chunks: Dict[str, List[np.ndarray]],
+        batch: List[Dict[str, Any]],
+        columns: Dict[str, str],
+    ) -> None:
+        for field, dtype in columns.items():
+            missing = self.MISSING_VALUES[dtype]
+
+            chunks[field].append(
+                np.fromiter(
+                    (missing if (value := document.get(field)) is None else value for document in batch),
+                    dtype=dtype,
+                    count=len(batch),
+                )
+            )
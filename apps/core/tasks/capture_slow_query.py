@@ -0,0 +1,10 @@
+from celery import shared_task
+
+from apps.core.tasks.slow_query import SlowQueryCaptureTask
+
+
+@shared_task(name="apps.core.tasks.capture_slow_query")
+def capture_slow_query(payload: str) -> str:
+    task = SlowQueryCaptureTask(payload=payload)
+
+    return task.run()
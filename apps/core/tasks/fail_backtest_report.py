@@ -0,0 +1,16 @@
+from typing import Any
+
+from celery import shared_task
+
+from apps.core.tasks.backtest.report import BacktestReportTask
+
+
+@shared_task(name="apps.core.tasks.fail_backtest_report")
+def fail_backtest_report(
+    request: Any,  # noqa: ARG001
+    exc: Exception,  # noqa: ARG001
+    traceback: Any,  # noqa: ARG001
+    backtest_id: str,
+) -> None:
+    task = BacktestReportTask(backtest_id=backtest_id)
+    task.fail()
@@ -0,0 +1,21 @@
+from typing import Any, Dict, Optional
+
+from celery import shared_task
+
+from apps.core.tasks.backtest.report import BacktestReportTask
+
+
+@shared_task(name="apps.core.tasks.make_backtest_report_chunk")
+def make_backtest_report_chunk(
+    backtest_id: str,
+    index: int,
+    started_at: Optional[int],
+    finished_at: Optional[int],
+) -> Dict[str, Any]:
+    task = BacktestReportTask(backtest_id=backtest_id)
+
+    return task.run_chunk(
+        index=index,
+        started_at=started_at,
+        finished_at=finished_at,
+    )
@@ -0,0 +1,21 @@
+from datetime import UTC, datetime
+from typing import Any, Dict, List
+
+from celery import shared_task
+
+from apps.core.tasks.backtest.report import BacktestReportTask
+
+
+@shared_task(name="apps.core.tasks.merge_backtest_report")
+def merge_backtest_report(
+    chunks: List[Dict[str, Any]],
+    backtest_id: str,
+    started_at: float,
+) -> Dict[str, Any]:
+    task = BacktestReportTask(backtest_id=backtest_id)
+    task.merge(chunks=chunks, started_at=started_at)
+
+    return {
+        "status": "success",
+        "time": datetime.now(tz=UTC),
+    }
@@ -0,0 +1,152 @@
+import hashlib
+import logging
+import re
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple
+
+from bson import json_util
+from bson.regex import Regex
+
+from apps.core.models.slow_query import SlowQueryModel
+
+logger = logging.getLogger("django")
+
+
+class SlowQueryCaptureTask:
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    PLACEHOLDER: str = "?"
+    LOGICAL_OPERATORS: ClassVar[FrozenSet[str]] = frozenset({"$and", "$or", "$nor"})
+    RANGE_OPERATORS: ClassVar[FrozenSet[str]] = frozenset(
+        {"$gt", "$gte", "$lt", "$lte", "$ne", "$nin", "$regex", "$exists"}
+    )
+
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _query: Dict[str, Any]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self, payload: str) -> None:
+        self._query = json_util.loads(payload)
+        self._slow_query_model = SlowQueryModel()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def run(self) -> str:
+        query = self._query
+        shape = json_util.dumps(self._get_shape(query["filter"]), sort_keys=True)
+        sort = [[field, direction] for field, direction in query["sort"]]
+
+        return self._slow_query_model.store(
+            data={
+                "collection": query["collection"],
+                "operation": query["operation"],
+                "shape_id": self._get_shape_id(query["collection"], query["operation"], shape, sort),
+                "shape": shape,
+                "filter": json_util.dumps(query["filter"]),
+                "sort": sort,
+                "skip": query["skip"],
+                "limit": query["limit"],
+                "projection": json_util.dumps(query["projection"]),
+                "route": query["route"],
+                "duration_ms": query["duration_ms"],
+                "suggested_index": self._get_suggested_index(query["filter"], query["sort"]),
+                **self._get_execution_stats(self._explain()),
+            }
+        )
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _explain(self) -> Optional[Dict[str, Any]]:
+        try:
+            return self._slow_query_model.explain(self._query)
+        except Exception as e:
+            logger.error(f"Failed to explain slow query on {self._query['collection']}: {e}")
+
+            return None
+
+    def _get_execution_stats(self, explain: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if not explain:
+            return {"plan": None, "collscan": False}
+
+        stats = explain.get("executionStats", {})
+        winning_plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+        stages = self._get_stages(winning_plan.get("queryPlan", winning_plan))
+
+        return {
+            "plan": " > ".join(stages),
+            "collscan": any(stage.startswith("COLLSCAN") for stage in stages),
+            "keys_examined": stats.get("totalKeysExamined"),
+            "docs_examined": stats.get("totalDocsExamined"),
+            "docs_returned": stats.get("nReturned"),
+            "execution_ms": stats.get("executionTimeMillis"),
+        }
+
+    def _get_shape(self, filters: Dict[str, Any]) -> Dict[str, Any]:
+        shape: Dict[str, Any] = {}
+
+        for key, value in filters.items():
+            if key in self.LOGICAL_OPERATORS:
+                shape[key] = [self._get_shape(item) for item in value]
+            elif isinstance(value, dict):
+                shape[key] = self._get_shape(value)
+            elif isinstance(value, (Regex, re.Pattern)):
+                shape[key] = {"$regex": self.PLACEHOLDER}
+            else:
+                shape[key] = self.PLACEHOLDER
+
+        return shape
+
+    def _get_suggested_index(self, filters: Dict[str, Any], sort: List[Tuple[str, int]]) -> List[List[Any]]:
+        equality: List[str] = []
+        ranges: List[str] = []
+        self._collect_fields(filters, equality, ranges)
+
+        fields = [(field, 1) for field in equality]
+        fields += [(field, direction) for field, direction in sort]
+        fields += [(field, 1) for field in ranges]
+
+        suggested: Dict[str, int] = {}
+        for field, direction in fields:
+            suggested.setdefault(field, direction)
+
+        return [[field, direction] for field, direction in suggested.items()]
+
+    def _collect_fields(self, filters: Dict[str, Any], equality: List[str], ranges: List[str]) -> None:
+        for key, value in filters.items():
+            if key == "$and":
+                for item in value:
+                    self._collect_fields(item, equality, ranges)
+            elif key.startswith("$"):
+                continue
+            elif self._is_range(value):
+                ranges.append(key)
+            else:
+                equality.append(key)
+
+    # Helpers
+    def _is_range(self, value: Any) -> bool:
+        if isinstance(value, (Regex, re.Pattern)):
+            return True
+
+        return isinstance(value, dict) and any(operator in self.RANGE_OPERATORS for operator in value)
+
+    def _get_stages(self, plan: Optional[Dict[str, Any]]) -> List[str]:
+        stages: List[str] = []
+
+        while plan:
+            stage = plan.get("stage", "")
+            stages.append(f"{stage}({plan['indexName']})" if "indexName" in plan else stage)
+            plan = plan.get("inputStage") or next(iter(plan.get("inputStages", [])), None)
+
+        return stages
+
+    def _get_shape_id(self, collection: str, operation: str, shape: str, sort: List[List[Any]]) -> str:
+        key = f"{collection}:{operation}:{shape}:{sort}"
+
+        return hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()
@@ -2,9 +2,13 @@ from django.urls import path
 from rest_framework.routers import DefaultRouter
 
 from apps.core.controllers.backtest import BacktestController
+from apps.core.controllers.backtest_export import BacktestExportController
+from apps.core.controllers.backtest_live_report import BacktestLiveReportController
+from apps.core.controllers.order_bulk import OrderBulkController
 from apps.core.controllers.orders import OrderController
 from apps.core.controllers.report import ReportController
 from apps.core.controllers.snapshot import SnapshotController
+from apps.core.controllers.snapshot_bulk import SnapshotBulkController
 
 router = DefaultRouter()
 
@@ -24,11 +28,33 @@ urlpatterns = [
         BacktestController.as_view(http_method_names=["put", "patch", "delete"]),
         name="backtest.update",
     ),
+    path(
+        "backtest/<str:id>/orders/export/",
+        BacktestExportController.as_view(http_method_names=["get"]),
+        {"resource": "orders"},
+        name="backtest.orders.export",
+    ),
+    path(
+        "backtest/<str:id>/snapshots/export/",
+        BacktestExportController.as_view(http_method_names=["get"]),
+        {"resource": "snapshots"},
+        name="backtest.snapshots.export",
+    ),
+    path(
+        "backtest/<str:id>/report/live/",
+        BacktestLiveReportController.as_view(http_method_names=["get"]),
+        name="backtest.report.live",
+    ),
     path(
         "orders/",
         OrderController.as_view(http_method_names=["get"]),
         name="order.get",
     ),
+    path(
+        "orders/bulk/",
+        OrderBulkController.as_view(http_method_names=["post"]),
+        name="order.bulk",
+    ),
     path(
         "order/",
         OrderController.as_view(http_method_names=["post"]),
@@ -49,6 +75,11 @@ urlpatterns = [
         SnapshotController.as_view(http_method_names=["get"]),
         name="snapshot.get",
     ),
+    path(
+        "snapshots/bulk/",
+        SnapshotBulkController.as_view(http_method_names=["post"]),
+        name="snapshot.bulk",
+    ),
     path(
         "snapshot/",
         SnapshotController.as_view(http_method_names=["post"]),
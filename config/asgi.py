@@ -1,3 +1,4 @@
+import atexit
 import os
 
 from channels.auth import AuthMiddlewareStack
@@ -9,7 +10,10 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.development")
 
 django_asgi_app = get_asgi_application()
 
-from config.routing import websocket_urlpatterns
+from apps.core.services.instrumentation import InstrumentationService  # noqa: E402
+from config.routing import websocket_urlpatterns  # noqa: E402
+
+atexit.register(InstrumentationService().mark_process_dead, os.getpid())
 
 application = ProtocolTypeRouter(
     {
@@ -1,12 +1,21 @@
 import os
+import time
 from logging.config import dictConfig
-from typing import Any
+from typing import Any, Dict, Optional
 
 from celery import Celery
 from celery.schedules import crontab
-from celery.signals import setup_logging
+from celery.signals import (
+    before_task_publish,
+    setup_logging,
+    task_postrun,
+    task_prerun,
+    worker_process_shutdown,
+)
 from django.conf import settings
 
+from apps.core.services.instrumentation import InstrumentationService
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.development")
 
 app = Celery("horizon5_router")
@@ -28,6 +37,26 @@ def config_loggers(*args: Any, **kwargs: Any) -> None:  # noqa: ARG001
     dictConfig(settings.LOGGING)
 
 
+@before_task_publish.connect
+def mark_published(headers: Dict[str, Any], **kwargs: Any) -> None:  # noqa: ARG001
+    headers.setdefault(InstrumentationService.PUBLISHED_AT_HEADER, time.time())
+
+
+@task_prerun.connect
+def start_task_timer(task: Any, **kwargs: Any) -> None:  # noqa: ARG001
+    InstrumentationService().start_task(task)
+
+
+@task_postrun.connect
+def stop_task_timer(task: Any, state: Optional[str] = None, **kwargs: Any) -> None:  # noqa: ARG001
+    InstrumentationService().finish_task(task, state)
+
+
+@worker_process_shutdown.connect
+def mark_worker_dead(pid: Optional[int] = None, **kwargs: Any) -> None:  # noqa: ARG001
+    InstrumentationService().mark_process_dead(pid or os.getpid())
+
+
 app.autodiscover_tasks()
 
 app.conf.beat_schedule = {
@@ -1 +1,7 @@
-websocket_urlpatterns = []
+from django.urls import path
+
+from apps.core.consumers import BacktestConsumer
+
+websocket_urlpatterns = [
+    path("ws/backtest/<str:id>/", BacktestConsumer.as_asgi(), name="backtest.stream"),
+]
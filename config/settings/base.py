@@ -31,8 +31,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "apps.core.middleware.InstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    "apps.core.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -62,6 +64,26 @@ TEMPLATES = [
 WSGI_APPLICATION = "config.wsgi.application"
 ASGI_APPLICATION = "config.asgi.application"
 
+# Pool size: maxPoolSize = 0.8 * maxConns / (client processes * 2 clients)
+MONGODB_SERVER_MAX_CONNECTIONS = int(os.getenv("MONGODB_SERVER_MAX_CONNECTIONS", "10000"))
+MONGODB_CLIENT_PROCESSES = int(
+    os.getenv(
+        "MONGODB_CLIENT_PROCESSES",
+        str(
+            int(os.getenv("UVICORN_WORKERS", "4"))
+            + int(os.getenv("CELERY_WORKER_CONCURRENCY", "4"))
+            + 1
+        ),
+    )
+)
+MONGODB_MAX_POOL_SIZE = int(
+    os.getenv(
+        "MONGODB_MAX_POOL_SIZE",
+        str(int(MONGODB_SERVER_MAX_CONNECTIONS * 0.8) // (MONGODB_CLIENT_PROCESSES * 2)),
+    )
+)
+MONGODB_WRITE_CONCERN = os.getenv("MONGODB_WRITE_CONCERN", "majority")
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
@@ -73,9 +95,71 @@ DATABASES = {
         "DB_PASSWORD": os.getenv("MONGODB_PASSWORD"),
         "DB_HOST": os.getenv("MONGODB_HOST"),
         "DB_PORT": os.getenv("MONGODB_PORT", "27017"),
+        "OPTIONS": {
+            "appname": os.getenv("MONGODB_APP_NAME", "horizon-connect"),
+            "maxPoolSize": MONGODB_MAX_POOL_SIZE,
+            "minPoolSize": int(os.getenv("MONGODB_MIN_POOL_SIZE", "0")),
+            "maxConnecting": int(os.getenv("MONGODB_MAX_CONNECTING", "4")),
+            "maxIdleTimeMS": int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "60000")),
+            "waitQueueTimeoutMS": int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "2000")),
+            "serverSelectionTimeoutMS": int(
+                os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "5000")
+            ),
+            "connectTimeoutMS": int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", "5000")),
+            "socketTimeoutMS": int(os.getenv("MONGODB_SOCKET_TIMEOUT_MS", "30000")),
+            "compressors": os.getenv("MONGODB_COMPRESSORS", "zstd,snappy,zlib"),
+            "retryWrites": os.getenv("MONGODB_RETRY_WRITES", "True") == "True",
+            "retryReads": os.getenv("MONGODB_RETRY_READS", "True") == "True",
+            "w": int(MONGODB_WRITE_CONCERN)
+            if MONGODB_WRITE_CONCERN.isdigit()
+            else MONGODB_WRITE_CONCERN,
+            "readPreference": os.getenv("MONGODB_READ_PREFERENCE", "primary"),
+        },
+    },
+}
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/2"),
+        "OPTIONS": {
+            "socket_connect_timeout": float(os.getenv("CACHE_REDIS_TIMEOUT", "0.5")),
+            "socket_timeout": float(os.getenv("CACHE_REDIS_TIMEOUT", "0.5")),
+        },
+    },
+    "local": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "horizon-local",
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", "1000")),
+        },
     },
 }
 
+LIST_COUNT_CACHE_TTL = int(os.getenv("LIST_COUNT_CACHE_TTL", "30"))
+QUERY_CACHE_TTL = int(os.getenv("QUERY_CACHE_TTL", "5"))
+
+SLOW_QUERY_THRESHOLD_MS = int(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+SLOW_QUERY_SAMPLE_RATE = float(os.getenv("SLOW_QUERY_SAMPLE_RATE", "0.0"))
+SLOW_QUERY_RETENTION_DAYS = int(os.getenv("SLOW_QUERY_RETENTION_DAYS", "7"))
+
+BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", "10000"))
+BULK_INSERT_BATCH_SIZE = int(os.getenv("BULK_INSERT_BATCH_SIZE", "1000"))
+BULK_MAX_REPORTED_ERRORS = int(os.getenv("BULK_MAX_REPORTED_ERRORS", "1000"))
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+
+STREAM_FLUSH_INTERVAL = int(os.getenv("STREAM_FLUSH_INTERVAL", "250"))
+STREAM_MAX_PENDING = int(os.getenv("STREAM_MAX_PENDING", "1000"))
+STREAM_PUBLISH_TIMEOUT = float(os.getenv("STREAM_PUBLISH_TIMEOUT", "0.5"))
+
+REPORT_BATCH_SIZE = int(os.getenv("REPORT_BATCH_SIZE", "5000"))
+REPORT_BUILD_TIMEOUT = int(os.getenv("REPORT_BUILD_TIMEOUT", "3600"))
+REPORT_CHUNK_SIZE = int(os.getenv("REPORT_CHUNK_SIZE", "250000"))
+REPORT_MAX_CHUNKS = int(os.getenv("REPORT_MAX_CHUNKS", "16"))
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": (
@@ -5,8 +5,11 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
+from apps.core.controllers.prometheus import PrometheusController
+
 urlpatterns = [
     path("api/", include("apps.core.urls")),
+    path("metrics", PrometheusController.as_view(), name="metrics"),
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     path(
         "api/docs/",
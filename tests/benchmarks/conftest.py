@@ -0,0 +1,8 @@
+import os
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.development")
+os.environ.setdefault("MONGODB_DATABASE", "benchmark")
+
+django.setup()
@@ -0,0 +1,105 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from bson import ObjectId
+
+SEED = 5
+SIZES = (100, 1_000, 10_000)
+SERIES_SIZES = (10_000, 100_000, 1_000_000)
+SYMBOLS = np.array(["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT"], dtype=object)
+STRATEGIES = np.array(["ema5_breakout", "mean_reversion", "momentum"], dtype=object)
+STARTED_AT = 1_704_067_200
+
+
+def get_order_body(position: int = 0) -> Dict[str, Any]:
+    return {
+        "backtest": True,
+        "backtest_id": "690a08adc741ec5f14b8e628",
+        "strategy_id": "ema5_breakout",
+        "symbol": "BTCUSDT",
+        "gateway": "binance",
+        "side": "buy",
+        "order_type": "market",
+        "status": "closed",
+        "volume": 0.07493382240856099,
+        "executed_volume": 0.07493382240856099,
+        "price": 110260.78,
+        "close_price": 111386.07,
+        "take_profit_price": 111363.3878,
+        "stop_loss_price": 99234.70199999999,
+        "client_order_id": f"hrz-{position:012x}",
+        "filled": True,
+        "profit": 84.3222810181302,
+        "profit_percentage": 0.01020571412609278,
+        "created_at": STARTED_AT + position * 60,
+        "updated_at": STARTED_AT + position * 60,
+    }
+
+
+def get_snapshot_body(position: int = 0) -> Dict[str, Any]:
+    return {
+        "backtest": True,
+        "backtest_id": "690a08adc741ec5f14b8e628",
+        "strategy_id": "ema5_breakout",
+        "event": "tick",
+        "nav": 10_250.5,
+        "allocation": 10_000.0,
+        "nav_peak": 10_300.0,
+        "created_at": STARTED_AT + position * 60,
+    }
+
+
+def get_order_documents(size: int) -> List[Dict[str, Any]]:
+    generator = np.random.default_rng(SEED)
+    started_at = datetime.fromtimestamp(STARTED_AT, tz=UTC)
+    profits = generator.normal(1.0, 25.0, size)
+    prices = generator.uniform(100.0, 110_000.0, (size, 3))
+
+    return [
+        {
+            **get_order_body(position),
+            "_id": ObjectId(),
+            "backtest_id": ObjectId("690a08adc741ec5f14b8e628"),
+            "profit": float(profits[position]),
+            "created_at": started_at + timedelta(minutes=position),
+            "updated_at": started_at + timedelta(minutes=position),
+            "trades": [
+                {
+                    "_id": ObjectId(),
+                    "price": float(price),
+                    "volume": 0.025,
+                    "created_at": started_at + timedelta(minutes=position, seconds=offset),
+                }
+                for offset, price in enumerate(prices[position])
+            ],
+            "logs": [
+                {"level": "info", "message": "order filled", "created_at": started_at + timedelta(minutes=position)}
+            ],
+            "variables": {"ema": {"fast": 5, "slow": 21}, "atr": float(prices[position][0] / 100)},
+        }
+        for position in range(size)
+    ]
+
+
+def get_order_bodies(size: int) -> List[Dict[str, Any]]:
+    return [get_order_body(position) for position in range(size)]
+
+
+def get_snapshot_bodies(size: int) -> List[Dict[str, Any]]:
+    return [get_snapshot_body(position) for position in range(size)]
+
+
+def get_nav_series(size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    generator = np.random.default_rng(SEED)
+    nav = 10_000.0 * np.cumprod(1.0 + generator.normal(0.00001, 0.001, size))
+    timestamps = STARTED_AT + np.arange(size, dtype=np.float64) * 60
+    profits = generator.normal(1.0, 25.0, max(size // 10, 1))
+
+    return nav, timestamps, profits
+
+
+def get_breakdown_series(size: int) -> Tuple[np.ndarray, np.ndarray]:
+    generator = np.random.default_rng(SEED)
+
+    return generator.choice(SYMBOLS, size), generator.normal(1.0, 25.0, size)
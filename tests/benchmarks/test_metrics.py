@@ -0,0 +1,37 @@
+from typing import Any
+
+import pytest
+
+from apps.core.services.metrics import MetricsService
+from apps.core.services.report import ReportService
+from tests.benchmarks.datasets import SERIES_SIZES, get_breakdown_series, get_nav_series
+
+
+class TestMetricsBenchmark:
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    @pytest.mark.parametrize("size", SERIES_SIZES)
+    def test_compute(self, benchmark: Any, size: int) -> None:
+        nav, timestamps, profits = get_nav_series(size)
+
+        metrics = benchmark(MetricsService().compute, nav, timestamps, profits)
+
+        assert metrics["nav"] == pytest.approx(nav[-1])
+
+    @pytest.mark.parametrize("size", SERIES_SIZES)
+    def test_breakdown(self, benchmark: Any, size: int) -> None:
+        report_service = ReportService()
+        keys, profits = get_breakdown_series(size)
+
+        rows = benchmark(self._get_breakdown_rows, report_service, keys, profits)
+
+        assert sum(row["orders"] for row in rows) == size
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _get_breakdown_rows(self, report_service: ReportService, keys: Any, profits: Any) -> Any:
+        breakdown = report_service.get_breakdown(keys, profits)
+
+        return report_service.get_breakdown_rows(report_service.merge_breakdowns([breakdown]))
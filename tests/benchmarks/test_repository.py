@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from apps.core.repositories.order import OrderRepository
+from apps.core.repositories.snapshot import SnapshotRepository
+from tests.benchmarks.datasets import SIZES, get_order_bodies, get_snapshot_bodies
+
+REPOSITORIES = {
+    "order": (OrderRepository, get_order_bodies),
+    "snapshot": (SnapshotRepository, get_snapshot_bodies),
+}
+
+
+class TestRepositoryBenchmark:
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    @pytest.mark.parametrize("size", SIZES)
+    @pytest.mark.parametrize("resource", REPOSITORIES)
+    def test_prepare_many(self, benchmark: Any, resource: str, size: int) -> None:
+        repository_class, get_bodies = REPOSITORIES[resource]
+        repository = repository_class()
+        batches: List[List[Dict[str, Any]]] = []
+
+        def setup() -> Tuple[Tuple[List[Dict[str, Any]]], Dict[str, Any]]:
+            batches.append(get_bodies(size))
+            return (batches[-1],), {}
+
+        benchmark.pedantic(repository._prepare_many, setup=setup, rounds=20, warmup_rounds=1)
+
+        assert all(isinstance(item["created_at"], datetime) for item in batches[-1])
+        assert all("_id" in item for item in batches[-1])
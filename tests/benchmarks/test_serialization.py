@@ -0,0 +1,38 @@
+from typing import Any, Dict, List
+
+import pytest
+
+from apps.core.controllers.orders import OrderController
+from apps.core.renderers import ORJSONRenderer
+from tests.benchmarks.datasets import SIZES, get_order_documents
+
+
+class TestSerializationBenchmark:
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    @pytest.mark.parametrize("size", SIZES)
+    def test_serialize_orders(self, benchmark: Any, size: int) -> None:
+        controller = OrderController()
+        documents = get_order_documents(size)
+
+        results = benchmark(self._serialize, controller, documents)
+
+        assert len(results) == size
+        assert isinstance(results[0]["trades"][0]["_id"], str)
+
+    @pytest.mark.parametrize("size", SIZES)
+    def test_render_orders(self, benchmark: Any, size: int) -> None:
+        controller = OrderController()
+        renderer = ORJSONRenderer()
+        results = self._serialize(controller, get_order_documents(size))
+
+        content = benchmark(renderer.render, {"success": True, "data": {"results": results}})
+
+        assert content.startswith(b'{"success":true')
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _serialize(self, controller: OrderController, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [controller._serialize(document) for document in documents]
@@ -0,0 +1,47 @@
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+import pytest
+
+from apps.core.controllers.orders import OrderController
+from apps.core.controllers.snapshot import SnapshotController
+from apps.core.services.validation import ValidationService
+from tests.benchmarks.datasets import SIZES, get_order_bodies, get_snapshot_bodies
+
+SCHEMAS = {
+    "order": (OrderController.POST_VALIDATION_SCHEMA, get_order_bodies),
+    "snapshot": (SnapshotController.POST_VALIDATION_SCHEMA, get_snapshot_bodies),
+}
+
+
+class TestValidationBenchmark:
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    @pytest.mark.parametrize("size", SIZES)
+    @pytest.mark.parametrize("resource", SCHEMAS)
+    def test_validate(self, benchmark: Any, resource: str, size: int) -> None:
+        schema, get_bodies = SCHEMAS[resource]
+
+        errors = benchmark(self._validate, ValidationService().validate, schema, get_bodies(size))
+
+        assert errors == []
+
+    @pytest.mark.parametrize("size", SIZES)
+    @pytest.mark.parametrize("resource", SCHEMAS)
+    def test_validate_fast(self, benchmark: Any, resource: str, size: int) -> None:
+        schema, get_bodies = SCHEMAS[resource]
+
+        errors = benchmark(self._validate, ValidationService().validate_fast, schema, get_bodies(size))
+
+        assert errors == []
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _validate(
+        self,
+        validate: Callable[[Mapping[str, Any], Mapping[str, Any]], Optional[Dict[str, Any]]],
+        schema: Mapping[str, Any],
+        bodies: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        return [errors for body in bodies if (errors := validate(schema, body)) is not None]
@@ -57,7 +57,20 @@ class TestBacktest(TestWrapper):
         self.assertIn("success", data)
         self.assertTrue(data["success"])
 
-    def test_03_update_backtest(self) -> None:
+    def test_03_export_backtest_orders(self) -> None:
+        backtest_id = backtests[0]
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/backtest/{backtest_id}/orders/export/",
+            query={"output": "csv"},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+        self.assertTrue(response.headers["Content-Type"].startswith("text/csv"))
+        self.assertTrue(response.text.startswith("_id,"))
+
+    def test_04_update_backtest(self) -> None:
         self.log.info(f"Available backtest IDs: {backtests}")
 
         backtest_id = backtests[0]
@@ -76,7 +89,106 @@ class TestBacktest(TestWrapper):
         self.assertIn("success", data)
         self.assertTrue(data["success"])
 
-    def test_04_delete_backtests(self) -> None:
+    def test_05_project_backtests(self) -> None:
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/backtests/",
+            query={"fields": "asset,status"},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        results = response.json()["data"]["results"]
+        self.assertGreater(len(results), 0)
+
+        for result in results:
+            self.assertTrue(set(result) <= {"_id", "asset", "status", "created_at", "updated_at"})
+            self.assertIn("asset", result)
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/backtests/",
+            query={"exclude": "strategies"},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        results = response.json()["data"]["results"]
+        self.assertTrue(all("strategies" not in result for result in results))
+        self.assertTrue(all("asset" in result for result in results))
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/backtests/",
+            query={"fields": "*"},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+        self.assertTrue(all("strategies" in result for result in response.json()["data"]["results"]))
+
+        for query, error in (
+            ({"fields": "asset,secret"}, "fields_param"),
+            ({"fields": "asset,"}, "fields_param"),
+            ({"exclude": "secret"}, "exclude_param"),
+            ({"fields": "asset", "exclude": "status"}, "fields_param"),
+        ):
+            response = self.execute(
+                "GET",
+                f"{self._base_url}/api/backtests/",
+                query=query,
+            )
+
+            self.assertEqual(response.status_code, HttpStatus.BAD_REQUEST.value)
+
+            data = response.json()
+            self.assertFalse(data["success"])
+            self.assertIn(error, data["data"]["errors"])
+
+    def test_06_get_backtests_not_modified(self) -> None:
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/backtests/",
+            query={"page_size": 5},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+        self.assertEqual(response.headers["Cache-Control"], "no-cache")
+        self.assertIn("Last-Modified", response.headers)
+
+        etag = response.headers["ETag"]
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/backtests/",
+            query={"page_size": 5},
+            headers={"If-None-Match": etag},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.NOT_MODIFIED.value)
+        self.assertEqual(response.headers["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/backtests/",
+            query={"page_size": 5},
+            headers={"If-None-Match": f"W/{etag}"},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.NOT_MODIFIED.value)
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/backtests/",
+            query={"page_size": 6},
+            headers={"If-None-Match": etag},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertTrue(response.json()["success"])
+
+    def test_07_delete_backtests(self) -> None:
         self.log.info(f"Deleting backtest IDs: {backtests}")
 
         for backtest_id in backtests:
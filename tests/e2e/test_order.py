@@ -76,7 +76,73 @@ class TestOrder(TestWrapper):
         self.assertIn("success", data)
         self.assertTrue(data["success"])
 
-    def test_03_update_order(self) -> None:
+    def test_03_get_orders_by_cursor(self) -> None:
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/",
+            query={"page_size": 1},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        data = response.json()
+        self.assertIn("next_cursor", data["data"]["pagination"])
+
+        next_cursor = data["data"]["pagination"]["next_cursor"]
+        if next_cursor is None:
+            return
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/",
+            query={"page_size": 1, "after": next_cursor},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        data = response.json()
+        self.assertTrue(data["success"])
+        self.assertNotIn("total", data["data"]["pagination"])
+        self.assertIn("next_cursor", data["data"]["pagination"])
+
+    def test_04_bulk_create_orders(self) -> None:
+        created_at = int(datetime.now(UTC).timestamp())
+        order = {
+            "backtest": True,
+            "backtest_id": "690a08adc741ec5f14b8e628",
+            "strategy_id": "ema5_breakout",
+            "symbol": "BTCUSDT",
+            "gateway": "binance",
+            "side": "sell",
+            "order_type": "market",
+            "status": "closed",
+            "volume": 0.05,
+            "executed_volume": 0.05,
+            "price": 110300.12,
+            "filled": True,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+        response = self.execute(
+            "POST",
+            f"{self._base_url}/api/orders/bulk/",
+            body=[order, order, {**order, "side": "hold"}],  # type: ignore
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.MULTI_STATUS.value)
+
+        data = response.json()
+        self.assertTrue(data["success"])
+        self.assertEqual(data["data"]["inserted"], 2)
+        self.assertEqual(data["data"]["failed"], 1)
+        self.assertIn("errors", data["data"]["results"][2])
+
+        for result in data["data"]["results"]:
+            if "_id" in result:
+                orders.append(result["_id"])
+
+    def test_05_update_order(self) -> None:
         self.log.info(f"Available order IDs: {orders}")
 
         order_id = orders[0]
@@ -105,7 +171,126 @@ class TestOrder(TestWrapper):
         self.assertIn("success", data)
         self.assertTrue(data["success"])
 
-    def test_04_delete_orders(self) -> None:
+    def test_06_count_orders(self) -> None:
+        for count in ("exact", "estimated"):
+            response = self.execute(
+                "GET",
+                f"{self._base_url}/api/orders/",
+                query={"count": count},
+            )
+
+            self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+            pagination = response.json()["data"]["pagination"]
+            self.assertEqual(pagination["count"], count)
+            self.assertIsInstance(pagination["total"], int)
+            self.assertIn("total_pages", pagination)
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/",
+            query={"count": "none"},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        pagination = response.json()["data"]["pagination"]
+        self.assertEqual(pagination["count"], "none")
+        self.assertNotIn("total", pagination)
+        self.assertNotIn("total_pages", pagination)
+        self.assertIn("has_more", pagination)
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/",
+            query={"count": "approximate"},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.BAD_REQUEST.value)
+
+        data = response.json()
+        self.assertFalse(data["success"])
+        self.assertIn("count_param", data["data"]["errors"])
+
+    def test_07_filter_orders(self) -> None:
+        backtest_filter = "backtest_id:690a08adc741ec5f14b8e628"
+        min_price, max_price = 110300, 110300.12
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/",
+            query={"filter_by": [backtest_filter, "symbol:ETH"], "page_size": 100},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+        self.assertEqual(response.json()["data"]["results"], [])
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/",
+            query={"filter_by": [backtest_filter, "symbol:in:ETHUSDT,BTCUSDT"], "page_size": 100},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        results = response.json()["data"]["results"]
+        self.assertTrue({result["symbol"] for result in results} <= {"ETHUSDT", "BTCUSDT"})
+        self.assertTrue(set(orders) <= {result["_id"] for result in results})
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/",
+            query={"filter_by": [backtest_filter, "symbol:prefix:ETH"], "page_size": 100},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        results = response.json()["data"]["results"]
+        self.assertTrue(all(result["symbol"].startswith("ETH") for result in results))
+        self.assertIn(orders[0], {result["_id"] for result in results})
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/",
+            query={
+                "filter_by": [backtest_filter, f"price>={min_price}", f"price<={max_price}"],
+                "page_size": 100,
+            },
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        results = response.json()["data"]["results"]
+        self.assertTrue(all(min_price <= result["price"] <= max_price for result in results))
+        self.assertTrue(set(orders[1:]) <= {result["_id"] for result in results})
+        self.assertNotIn(orders[0], {result["_id"] for result in results})
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/",
+            query={"filter_by": [backtest_filter, "side!=buy"], "page_size": 100},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        results = response.json()["data"]["results"]
+        self.assertTrue(all(result["side"] != "buy" for result in results))
+        self.assertNotIn(orders[0], {result["_id"] for result in results})
+
+        for expression in ("price>=abc", "price:prefix:110", "symbol~BTC"):
+            response = self.execute(
+                "GET",
+                f"{self._base_url}/api/orders/",
+                query={"filter_by": expression},
+            )
+
+            self.assertEqual(response.status_code, HttpStatus.BAD_REQUEST.value)
+
+            data = response.json()
+            self.assertFalse(data["success"])
+            self.assertIn("filter_by_param", data["data"]["errors"])
+
+    def test_08_delete_orders(self) -> None:
         self.log.info(f"Deleting order IDs: {orders}")
 
         for order_id in orders:
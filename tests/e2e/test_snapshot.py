@@ -1,3 +1,4 @@
+import json
 import unittest
 from datetime import UTC, datetime
 from typing import List
@@ -97,7 +98,72 @@ class TestSnapshot(TestWrapper):
         self.assertIn("success", data)
         self.assertTrue(data["success"])
 
-    def test_04_delete_snapshots(self) -> None:
+    def test_04_bulk_create_snapshots(self) -> None:
+        created_at = int(datetime.now(UTC).timestamp())
+        snapshot = {
+            "backtest": True,
+            "backtest_id": backtests[0],
+            "strategy_id": "ema5_breakout",
+            "event": "on_trade",
+            "nav": 10600.25,
+            "allocation": 0.8,
+            "created_at": created_at,
+        }
+        lines = [
+            json.dumps(snapshot),
+            json.dumps({**snapshot, "nav": 10650.75}),
+            "{not json",
+            json.dumps({**snapshot, "backtest_id": None}),
+        ]
+
+        response = self.execute(
+            "POST",
+            f"{self._base_url}/api/snapshots/bulk/",
+            headers={"Content-Type": "application/x-ndjson"},
+            data="\n".join(lines) + "\n",
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.MULTI_STATUS.value)
+
+        data = response.json()
+        self.assertTrue(data["success"])
+        self.assertEqual(data["data"]["received"], 4)
+        self.assertEqual(data["data"]["inserted"], 2)
+        self.assertEqual(data["data"]["failed"], 2)
+        self.assertEqual([error["index"] for error in data["data"]["errors"]], [2, 3])
+
+        response = self.execute(
+            "POST",
+            f"{self._base_url}/api/snapshots/bulk/",
+            data="{not json\n" + json.dumps({"backtest": True}) + "\n",
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.BAD_REQUEST.value)
+
+        data = response.json()
+        self.assertFalse(data["success"])
+        self.assertEqual(data["data"]["inserted"], 0)
+        self.assertEqual(data["data"]["failed"], 2)
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/snapshots/",
+            query={
+                "filter_by": f"backtest_id:{backtests[0]}",
+                "fields": "_id",
+                "page_size": 100,
+            },
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        for result in response.json()["data"]["results"]:
+            if result["_id"] not in snapshots:
+                snapshots.append(result["_id"])
+
+        self.assertEqual(len(snapshots), 3)
+
+    def test_05_delete_snapshots(self) -> None:
         self.log.info(f"Deleting snapshot IDs: {snapshots}")
 
         for snapshot_id in snapshots:
@@ -120,7 +186,7 @@ class TestSnapshot(TestWrapper):
         snapshots.clear()
         self.log.info("All snapshots deleted and list cleared")
 
-    def test_05_delete_backtests(self) -> None:
+    def test_06_delete_backtests(self) -> None:
         self.log.info(f"Deleting backtest IDs: {backtests}")
 
         for backtest_id in backtests:
@@ -33,6 +33,8 @@ class TestWrapper(unittest.TestCase):
         query: Optional[Dict[str, Any]] = {},
         body: Optional[Dict[str, Any]] = {},
         headers: Optional[Dict[str, str]] = {},
+        *,
+        data: Optional[str] = None,
     ) -> Any:
         if query is None:
             query = {}
@@ -53,7 +55,8 @@ class TestWrapper(unittest.TestCase):
                 method,
                 url,
                 headers=self._headers,
-                json=body,
+                json=None if data is not None else body,
+                data=data,
                 params=query,
             )
         except requests.exceptions.RequestException as e: